@@ -17,6 +17,7 @@ import socket
 import signal
 import shutil
 import gzip
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse
@@ -636,22 +637,60 @@ class LocalDataSource(DataSource):
 
 
 class S3DataSource(DataSource):
-    """S3 data source"""
+    """S3 data source
+
+    Recording files are fetched by a thread pool and kept in cache_dir along
+    with the ETag of each object, so reopening a recording only downloads
+    files that changed in S3 (and nothing when it is unchanged); parsed
+    recordings are also kept in memory for the life of the viewer.
+    Recording metadata is cached by ETag and revalidated with conditional
+    requests. Without a cache_dir a temporary directory is used and removed
+    on cleanup.
+    """
     
-    def __init__(self, bucket, prefix=''):
+    def __init__(self, bucket, prefix='', cache_dir=None, max_workers=8):
         self.s3_client = boto3.client('s3')
         self.bucket = bucket
         self.prefix = prefix.rstrip('/')
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="bedrock_agentcore_replay_"))
+        self.max_workers = max_workers
+        self._owns_cache_dir = cache_dir is None
+        if cache_dir is None:
+            self.cache_dir = Path(tempfile.mkdtemp(prefix="bedrock_agentcore_replay_"))
+        else:
+            self.cache_dir = Path(cache_dir).expanduser() / bucket / (self.prefix or '_root')
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.temp_dir = self.cache_dir
+        
+        self._lock = threading.Lock()
+        self._metadata_cache_file = self.cache_dir / 'metadata-cache.json'
+        self._metadata_cache = self._load_json(self._metadata_cache_file)
+        self._recording_cache = {}
         
         console.print(f"[cyan]Using S3 location:[/cyan]")
         console.print(f"  Bucket: {bucket}")
         console.print(f"  Prefix: {prefix}")
+        if not self._owns_cache_dir:
+            console.print(f"  Cache: {self.cache_dir}")
     
     def cleanup(self):
         """Clean up temp files"""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+        if self._owns_cache_dir and self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir)
+    
+    @staticmethod
+    def _load_json(path):
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    @staticmethod
+    def _save_json(path, data):
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
     
     def list_recordings(self):
         """List recordings from S3"""
@@ -669,30 +708,11 @@ class S3DataSource(DataSource):
                 if 'CommonPrefixes' in page:
                     console.print(f"Found {len(page['CommonPrefixes'])} directories in prefix {self.prefix}")
                     
-                    for prefix_info in page['CommonPrefixes']:
-                        prefix = prefix_info['Prefix']
-                        recording_id = prefix.rstrip('/').split('/')[-1]
-                        
-                        # Check if it's a recording directory by looking for metadata.json
-                        metadata = self._get_metadata(recording_id)
-                        if metadata:
-                            # This is a valid recording directory
-                            session_id = recording_id  # Use the folder name as the session ID
-                            timestamp = int(metadata.get('startTime', time.time() * 1000))
-                            
-                            recordings.append({
-                                'id': recording_id,
-                                'sessionId': session_id,
-                                'timestamp': timestamp,
-                                'date': datetime.fromtimestamp(
-                                    timestamp / 1000
-                                ).strftime('%Y-%m-%d %H:%M:%S'),
-                                'events': metadata.get('eventCount', 0),
-                                'duration': metadata.get('duration', 0)
-                            })
-                            console.print(f"✅ Found recording: {recording_id}")
-                        else:
-                            console.print(f"⚠️ Directory without metadata: {recording_id}")
+                    directories = [
+                        (prefix_info['Prefix'].rstrip('/').split('/')[-1], prefix_info['Prefix'] + 'metadata.json')
+                        for prefix_info in page['CommonPrefixes']
+                    ]
+                    recordings.extend(self._describe_recordings(directories))
                 
                 recordings.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
                 console.print(f"[green]Found {len(recordings)} recordings[/green]")
@@ -718,22 +738,7 @@ class S3DataSource(DataSource):
                 console.print(f"Found directories: {dirs}")
                 
                 # Check each directory for metadata
-                for dir_name in dirs:
-                    metadata = self._get_metadata(dir_name)
-                    if metadata:
-                        session_id = dir_name
-                        timestamp = int(metadata.get('startTime', time.time() * 1000))
-                        
-                        recordings.append({
-                            'id': dir_name,
-                            'sessionId': session_id,
-                            'timestamp': timestamp,
-                            'date': datetime.fromtimestamp(
-                                timestamp / 1000
-                            ).strftime('%Y-%m-%d %H:%M:%S'),
-                            'events': metadata.get('eventCount', 0),
-                            'duration': metadata.get('duration', 0)
-                        })
+                recordings.extend(self._describe_recordings([(dir_name, None) for dir_name in dirs]))
                 
                 recordings.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
                 console.print(f"[green]Found {len(recordings)} recordings with alternative method[/green]")
@@ -742,24 +747,57 @@ class S3DataSource(DataSource):
             console.print(f"[red]Error listing recordings: {e}[/red]")
             import traceback
             traceback.print_exc()
+        finally:
+            self._save_metadata_cache()
         
         return recordings
     
-    def _get_metadata(self, recording_id):
+    def _describe_recordings(self, directories):
+        """Fetch metadata for (recording_id, metadata_key) pairs concurrently"""
+        recordings = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(
+                lambda directory: self._get_metadata(*directory), directories
+            )
+            for (recording_id, _), metadata in zip(directories, results):
+                if not metadata:
+                    console.print(f"⚠️ Directory without metadata: {recording_id}")
+                    continue
+                
+                # This is a valid recording directory
+                session_id = recording_id  # Use the folder name as the session ID
+                timestamp = int(metadata.get('startTime', time.time() * 1000))
+                
+                recordings.append({
+                    'id': recording_id,
+                    'sessionId': session_id,
+                    'timestamp': timestamp,
+                    'date': datetime.fromtimestamp(
+                        timestamp / 1000
+                    ).strftime('%Y-%m-%d %H:%M:%S'),
+                    'events': metadata.get('eventCount', 0),
+                    'duration': metadata.get('duration', 0)
+                })
+                console.print(f"✅ Found recording: {recording_id}")
+        return recordings
+    
+    def _get_metadata(self, recording_id, metadata_key=None):
         """Get metadata for a recording"""
         try:
-            # Try both possible metadata paths
+            # Try both possible metadata paths, starting with any that worked before
             keys_to_try = [
+                metadata_key,
                 f"{self.prefix}/{recording_id}/metadata.json",
                 f"{recording_id}/metadata.json",
                 f"{self.prefix}{recording_id}/metadata.json"
             ]
+            keys_to_try = list(dict.fromkeys(key for key in keys_to_try if key))
+            keys_to_try.sort(key=lambda key: key not in self._metadata_cache)
             
             for key in keys_to_try:
                 try:
                     console.print(f"[dim]Trying metadata path: {key}[/dim]")
-                    response = self.s3_client.get_object(Bucket=self.bucket, Key=key)
-                    data = json.loads(response['Body'].read().decode('utf-8'))
+                    data = self._fetch_metadata(key)
                     console.print(f"[dim]Found metadata at: {key}[/dim]")
                     return data
                 except Exception as e:
@@ -771,12 +809,78 @@ class S3DataSource(DataSource):
             console.print(f"[dim]Error getting metadata: {e}[/dim]")
             return {}
     
+    def _fetch_metadata(self, key):
+        """Get a metadata object, revalidating a cached copy by its ETag"""
+        with self._lock:
+            cached = self._metadata_cache.get(key)
+        
+        request = {'Bucket': self.bucket, 'Key': key}
+        if cached:
+            request['IfNoneMatch'] = cached['etag']
+        try:
+            response = self.s3_client.get_object(**request)
+        except ClientError as e:
+            if cached and e.response.get('Error', {}).get('Code') in ('304', 'NotModified'):
+                return cached['data']
+            raise
+        
+        data = json.loads(response['Body'].read().decode('utf-8'))
+        with self._lock:
+            self._metadata_cache[key] = {'etag': response['ETag'], 'data': data}
+        return data
+    
+    def _save_metadata_cache(self):
+        with self._lock:
+            snapshot = dict(self._metadata_cache)
+        try:
+            self._save_json(self._metadata_cache_file, snapshot)
+        except OSError as e:
+            console.print(f"[yellow]Warning: Could not save metadata cache: {e}[/yellow]")
+    
+    def _load_recording_file(self, key, local_path, download):
+        """Download one recording file if needed, then parse it"""
+        filename = local_path.name
+        if download:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=key)
+            tmp_path = local_path.with_name(filename + '.part')
+            with open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(response['Body'], f, 1024 * 1024)
+            os.replace(tmp_path, local_path)
+        
+        if filename == 'metadata.json':
+            with open(local_path, 'r') as f:
+                return 'metadata', json.load(f)
+        
+        events = []
+        if filename.startswith('batch-') and (filename.endswith('.ndjson.gz') or filename.endswith('.jsonl.gz')):
+            try:
+                with gzip.open(local_path, 'rt') as f:
+                    for line in f:
+                        if line.strip():
+                            try:
+                                event_data = json.loads(line)
+                                # Validate event structure for rrweb
+                                if 'type' in event_data and 'timestamp' in event_data:
+                                    events.append(event_data)
+                                else:
+                                    console.print(f"[yellow]Skipping invalid event: missing required fields[/yellow]")
+                            except json.JSONDecodeError as e:
+                                console.print(f"[yellow]Warning: Invalid JSON in line: {line[:50]}...[/yellow]")
+            except Exception as e:
+                console.print(f"[yellow]Warning: Error processing batch file {filename}: {e}[/yellow]")
+        return 'events', events
+    
     def download_recording(self, recording_id):
         """Download recording from S3"""
         console.print(f"[cyan]Downloading recording: {recording_id}[/cyan]")
         
-        recording_dir = self.temp_dir / recording_id
+        if Path(recording_id).name != recording_id or recording_id in ('.', '..'):
+            console.print(f"[red]Invalid recording id: {recording_id}[/red]")
+            return None
+        
+        recording_dir = self.cache_dir / recording_id
         recording_dir.mkdir(exist_ok=True)
+        manifest_file = recording_dir / '.manifest.json'
         
         try:
             with Progress(
@@ -791,46 +895,54 @@ class S3DataSource(DataSource):
                 
                 paginator = self.s3_client.get_paginator('list_objects_v2')
                 
-                files_to_download = []
+                files_to_load = []
                 for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
                     if 'Contents' in page:
                         for obj in page['Contents']:
-                            files_to_download.append(obj['Key'])
+                            files_to_load.append((obj['Key'], obj['ETag']))
                 
-                # Download files
-                console.print(f"Downloading {len(files_to_download)} files")
-                task = progress.add_task(f"Downloading {len(files_to_download)} files...", total=len(files_to_download))
+                # Reuse the parsed recording when no object changed since it was loaded
+                fingerprint = tuple(files_to_load)
+                with self._lock:
+                    cached = self._recording_cache.get(recording_id)
+                if cached and cached[0] == fingerprint:
+                    console.print(f"[green]✓ Using cached recording ({len(cached[1]['events'])} events)[/green]")
+                    return cached[1]
+                
+                # Only download files that are new or changed since the last download
+                manifest = self._load_json(manifest_file)
+                downloads = {
+                    key for key, etag in files_to_load
+                    if manifest.get(key) != etag or not (recording_dir / key.split('/')[-1]).exists()
+                }
+                console.print(f"Downloading {len(downloads)} of {len(files_to_load)} files "
+                              f"({len(files_to_load) - len(downloads)} cached)")
+                task = progress.add_task(f"Loading {len(files_to_load)} files...", total=len(files_to_load))
                 
                 all_events = []
                 metadata = {}
                 
-                for key in files_to_download:
-                    filename = key.split('/')[-1]
-                    local_path = recording_dir / filename
-                    
-                    self.s3_client.download_file(self.bucket, key, str(local_path))
-                    progress.advance(task)
-                    
-                    # Process file
-                    if filename == 'metadata.json':
-                        with open(local_path, 'r') as f:
-                            metadata = json.load(f)
-                    elif filename.startswith('batch-') and (filename.endswith('.ndjson.gz') or filename.endswith('.jsonl.gz')):
-                        try:
-                            with gzip.open(local_path, 'rt') as f:
-                                for line in f:
-                                    if line.strip():
-                                        try:
-                                            event_data = json.loads(line)
-                                            # Validate event structure for rrweb
-                                            if 'type' in event_data and 'timestamp' in event_data:
-                                                all_events.append(event_data)
-                                            else:
-                                                console.print(f"[yellow]Skipping invalid event: missing required fields[/yellow]")
-                                        except json.JSONDecodeError as e:
-                                            console.print(f"[yellow]Warning: Invalid JSON in line: {line[:50]}...[/yellow]")
-                        except Exception as e:
-                            console.print(f"[yellow]Warning: Error processing batch file {filename}: {e}[/yellow]")
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = [
+                        executor.submit(
+                            self._load_recording_file, key,
+                            recording_dir / key.split('/')[-1], key in downloads
+                        )
+                        for key, _ in files_to_load
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
+                        progress.advance(task)
+                
+                # Collect in listing order so events stay in batch order
+                for future in futures:
+                    kind, data = future.result()
+                    if kind == 'metadata':
+                        metadata = data
+                    else:
+                        all_events.extend(data)
+                
+                self._save_json(manifest_file, dict(files_to_load))
             
             console.print(f"[green]✓ Downloaded {len(all_events)} events[/green]")
             
@@ -885,10 +997,13 @@ class S3DataSource(DataSource):
                 for path in recording_dir.iterdir():
                     console.print(f"  - {path.name} ({path.stat().st_size} bytes)")
             
-            return {
+            recording = {
                 'metadata': metadata,
                 'events': all_events
             }
+            with self._lock:
+                self._recording_cache[recording_id] = (fingerprint, recording)
+            return recording
             
         except Exception as e:
             console.print(f"[red]Error downloading recording: {e}[/red]")
@@ -995,6 +1110,18 @@ def main():
         default=8080,
         help='Port to run server on (default: 8080)'
     )
+    parser.add_argument(
+        '--cache-dir',
+        default=os.getenv('REPLAY_CACHE_DIR'),
+        help='Directory for caching S3 recordings between runs (default: $REPLAY_CACHE_DIR, '
+             'otherwise a temporary directory removed on exit)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Concurrent S3 downloads (default: 8)'
+    )
     
     args = parser.parse_args()
     
@@ -1011,7 +1138,7 @@ def main():
         bucket = path_parts[0]
         prefix = path_parts[1] if len(path_parts) > 1 else ''
         
-        data_source = S3DataSource(bucket, prefix)
+        data_source = S3DataSource(bucket, prefix, cache_dir=args.cache_dir, max_workers=args.workers)
     
     # Start viewer
     viewer = SessionReplayViewer(data_source, port=args.port)
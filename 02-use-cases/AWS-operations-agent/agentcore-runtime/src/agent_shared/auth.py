@@ -2,8 +2,12 @@
 # IMPORTS
 # ============================================================================
 
+import base64
+import json
 import logging
-from .config import get_oauth_settings
+import threading
+import time
+from .config import get_oauth_settings, load_configs
 from . import mylogger
  
 logger = mylogger.get_logger()
@@ -12,6 +16,13 @@ logger = mylogger.get_logger()
 _oauth_initialized = False
 _token_getter = None
 
+# Process-wide M2M token cache, refreshed shortly before the token expires
+_token_lock = threading.Lock()
+_cached_token = None
+_cached_token_expires_at = 0.0
+_refresh_threshold = 60
+_default_token_ttl = 300
+
 # ============================================================================
 # OAUTH SETUP
 # ============================================================================
@@ -23,7 +34,7 @@ def setup_oauth():
     Returns:
         bool: True if successful, False if not available
     """
-    global _oauth_initialized, _token_getter
+    global _oauth_initialized, _token_getter, _refresh_threshold, _default_token_ttl
     
     if _oauth_initialized:
         return True
@@ -68,6 +79,12 @@ def setup_oauth():
         scopes = oauth_settings['scopes']
         auth_flow = oauth_settings['auth_flow']
         
+        # Token refresh timing from okta.jwt in static-config.yaml
+        _, okta_config = load_configs()
+        jwt_config = okta_config.get('jwt', {})
+        _refresh_threshold = jwt_config.get('refresh_threshold', _refresh_threshold)
+        _default_token_ttl = jwt_config.get('cache_duration', _default_token_ttl)
+        
         # logger.info(f"🔐 Setting up OAuth with provider: {provider_name}")
         # logger.info(f"🔐 Scopes: {scopes}")
         # logger.info(f"🔐 Auth flow: {auth_flow}")
@@ -96,36 +113,80 @@ def setup_oauth():
 # TOKEN MANAGEMENT
 # ============================================================================
 
-def get_m2m_token():
+def _get_token_expiry(token):
+    """
+    Read the expiry time from a JWT's exp claim.
+    
+    The signature is not verified - exp is only used to decide when to refresh.
+    
+    Args:
+        token (str): JWT access token
+    
+    Returns:
+        float: Expiry as a Unix timestamp, or None if the token has no readable exp
+    """
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+def get_m2m_token(force_refresh=False):
     """
     Get M2M token for gateway access.
     
+    The token is cached for the process and only requested again once it is
+    within okta.jwt.refresh_threshold seconds of its exp claim. Tokens without
+    a readable exp are kept for okta.jwt.cache_duration seconds.
+    
+    Args:
+        force_refresh (bool): Ignore the cached token and request a new one
+    
     Returns:
         str: OAuth token or None if not available
     """
-    global _token_getter
+    global _cached_token, _cached_token_expires_at
     
     if not _oauth_initialized or not _token_getter:
         logger.warning("⚠️ OAuth not initialized - no token available")
         return None
     
-    try:
-        logger.info("🔑 Requesting M2M token from OAuth provider...")
-        token = _token_getter()
-        if token:
-            logger.info(f"✅ M2M token obtained successfully")
-            logger.info(f"🔑 Token length: {len(token)} characters")
-            logger.info(f"🔑 Token starts with: {token[:20]}...")
-            return token
-        else:
-            logger.warning("⚠️ No token returned from OAuth provider")
+    with _token_lock:
+        if not force_refresh and _cached_token and time.time() < _cached_token_expires_at - _refresh_threshold:
+            logger.debug("🔑 Using cached M2M token")
+            return _cached_token
+        
+        try:
+            logger.info("🔑 Requesting M2M token from OAuth provider...")
+            token = _token_getter()
+            if token:
+                expires_at = _get_token_expiry(token) or time.time() + _default_token_ttl
+                _cached_token = token
+                _cached_token_expires_at = expires_at
+                logger.info(f"✅ M2M token obtained successfully")
+                logger.info(f"🔑 Token length: {len(token)} characters")
+                logger.info(f"🔑 Token valid for {int(expires_at - time.time())} seconds")
+                return token
+            else:
+                logger.warning("⚠️ No token returned from OAuth provider")
+                return None
+                
+        except Exception as e:
+            logger.error(f"❌ Failed to get M2M token: {e}")
+            import traceback
+            logger.error(f"❌ Full traceback: {traceback.format_exc()}")
             return None
-            
-    except Exception as e:
-        logger.error(f"❌ Failed to get M2M token: {e}")
-        import traceback
-        logger.error(f"❌ Full traceback: {traceback.format_exc()}")
-        return None
+
+def clear_m2m_token_cache():
+    """
+    Drop the cached M2M token so the next get_m2m_token() requests a new one.
+    """
+    global _cached_token, _cached_token_expires_at
+    
+    with _token_lock:
+        _cached_token = None
+        _cached_token_expires_at = 0.0
 
 # ============================================================================
 # ERROR HANDLING
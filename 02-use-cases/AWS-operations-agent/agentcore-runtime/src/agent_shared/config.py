@@ -14,32 +14,37 @@ logger = mylogger.get_logger()
 # CONFIGURATION LOADING
 # ============================================================================
 
+_config_manager = None
+
 def load_configs():
     """
     Load configuration using unified AgentCore configuration system.
     
+    The YAML files are parsed and merged once and cached until they change on
+    disk (see config_manager.MTIME_CHECK_INTERVAL), so repeated calls are cheap.
+    Treat the returned dictionaries as read-only.
+    
     Returns:
         tuple: (merged_config, okta_config) - Two dictionaries with config data
     """
+    global _config_manager
+    
     try:
-        # Import the unified config manager
-        import sys
-        import os
-        
         # In Docker container, config_manager is in /app/shared/
         # No need to manipulate path since it's in the same shared directory structure
         from .config_manager import AgentCoreConfigManager
         
-        # Initialize config manager
-        config_manager = AgentCoreConfigManager()
+        # One config manager shared by all agent_shared modules
+        if _config_manager is None:
+            _config_manager = AgentCoreConfigManager()
+            logger.info("✅ Loaded configuration using unified AgentCore config system")
         
         # Get merged configuration (static + dynamic)
-        merged_config = config_manager.get_merged_config()
+        merged_config = _config_manager.get_merged_config()
         
         # Get OAuth settings
-        okta_config = config_manager.get_oauth_settings()
+        okta_config = merged_config.get("okta", {})
         
-        logger.info("✅ Loaded configuration using unified AgentCore config system")
         return merged_config, okta_config
         
     except Exception as e:
@@ -47,6 +52,18 @@ def load_configs():
         # Fallback to empty configs
         return {}, {}
 
+def reload_configs():
+    """
+    Drop cached configuration so the next load_configs() re-reads the YAML files.
+    
+    Returns:
+        tuple: (merged_config, okta_config) - Freshly loaded configuration
+    """
+    from .config_manager import clear_config_cache
+    
+    clear_config_cache()
+    return load_configs()
+
 # ============================================================================
 # MODEL SETTINGS
 # ============================================================================
@@ -4,14 +4,46 @@ Unified configuration management for all AgentCore consumers
 """
 
 import os
+import time
 import yaml
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from . import mylogger
  
 logger = mylogger.get_logger()
 
+# Minimum seconds between mtime checks of the same configuration file
+MTIME_CHECK_INTERVAL = 1.0
+
+# Caches shared by all AgentCoreConfigManager instances. Cached dictionaries
+# are returned as-is, so callers must treat them as read-only.
+_project_roots: Dict[Path, Path] = {}                                   # start dir -> project root
+_file_checks: Dict[Path, Tuple[float, Optional[float]]] = {}            # path -> (checked at, mtime)
+_yaml_cache: Dict[Path, Tuple[Optional[float], Dict[str, Any]]] = {}   # path -> (mtime, content)
+_merged_cache: Dict[str, Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], float]] = {}  # root -> (static, dynamic, merged, checked at)
+
+def clear_config_cache() -> None:
+    """Forget all cached configuration so the next access re-reads the YAML files"""
+    _file_checks.clear()
+    _yaml_cache.clear()
+    _merged_cache.clear()
+    logger.info("🔄 Configuration cache cleared")
+
+def _file_mtime(file_path: Path) -> Optional[float]:
+    """Modification time of file_path (None if missing), checked at most every MTIME_CHECK_INTERVAL"""
+    now = time.monotonic()
+    checked = _file_checks.get(file_path)
+    if checked and now - checked[0] < MTIME_CHECK_INTERVAL:
+        return checked[1]
+    
+    try:
+        mtime = file_path.stat().st_mtime
+    except FileNotFoundError:
+        mtime = None
+    _file_checks[file_path] = (now, mtime)
+    return mtime
+
 class AgentCoreConfigManager:
     """Unified configuration management for all AgentCore consumers"""
     
@@ -24,31 +56,46 @@ class AgentCoreConfigManager:
         """
         self.environment = environment
         self.project_root = self._find_project_root()
+        self._cache_key = str(self.project_root)
         self._validator = None  # Will be imported when needed to avoid circular imports
         
     def _find_project_root(self) -> Path:
         """Find the project root directory containing .agentcore.yaml"""
-        current = Path(__file__).parent
+        start = Path(__file__).parent
+        if start in _project_roots:
+            return _project_roots[start]
+        
+        # Fallback to parent of shared directory
+        root = start.parent
+        current = start
         while current != current.parent:
             if (current / '.agentcore.yaml').exists():
-                return current
+                root = current
+                break
             current = current.parent
         
-        # Fallback to parent of shared directory
-        return Path(__file__).parent.parent
+        _project_roots[start] = root
+        return root
     
     def _load_yaml(self, relative_path: str) -> Dict[str, Any]:
-        """Load YAML file relative to project root"""
+        """Load YAML file relative to project root, reusing the parsed content until its mtime changes"""
         file_path = self.project_root / relative_path
+        mtime = _file_mtime(file_path)
+        
+        cached = _yaml_cache.get(file_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
         
-        if not file_path.exists():
+        if mtime is None:
             logger.warning(f"Configuration file not found: {file_path}")
-            return {}
+            _yaml_cache[file_path] = (None, {})
+            return _yaml_cache[file_path][1]
         
         try:
             with open(file_path, 'r') as f:
                 content = yaml.safe_load(f) or {}
             logger.debug(f"Loaded configuration from {file_path}")
+            _yaml_cache[file_path] = (mtime, content)
             return content
         except Exception as e:
             logger.error(f"Failed to load configuration from {file_path}: {e}")
@@ -68,6 +115,11 @@ class AgentCoreConfigManager:
         except Exception as e:
             logger.error(f"Failed to save configuration to {file_path}: {e}")
             raise
+        finally:
+            # Re-read on next access even within MTIME_CHECK_INTERVAL
+            _file_checks.pop(file_path, None)
+            _yaml_cache.pop(file_path, None)
+            _merged_cache.pop(self._cache_key, None)
     
     def _deep_merge(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         """Deep merge two dictionaries, with override taking precedence"""
@@ -107,9 +159,22 @@ class AgentCoreConfigManager:
     # Merged Configuration Methods
     def get_merged_config(self) -> Dict[str, Any]:
         """Get complete configuration (static + dynamic merged)"""
+        # Within MTIME_CHECK_INTERVAL of the last check this is a dictionary lookup
+        now = time.monotonic()
+        cached = _merged_cache.get(self._cache_key)
+        if cached and now - cached[3] < MTIME_CHECK_INTERVAL:
+            return cached[2]
+        
         static = self.get_static_config()
         dynamic = self.get_dynamic_config()
-        return self._deep_merge(static, dynamic)
+        
+        # Merge again only when either file was reloaded
+        if cached and cached[0] is static and cached[1] is dynamic:
+            merged = cached[2]
+        else:
+            merged = self._deep_merge(static, dynamic)
+        _merged_cache[self._cache_key] = (static, dynamic, merged, now)
+        return merged
     
     # Convenience Methods for Backward Compatibility
     def get_model_settings(self) -> Dict[str, Any]:
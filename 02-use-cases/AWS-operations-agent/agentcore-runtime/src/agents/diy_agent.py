@@ -8,8 +8,11 @@ import functools
 import logging
 import sys
 import os
+import threading
+from collections import OrderedDict
 from typing import AsyncGenerator, Optional
 
+import httpx
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
@@ -20,6 +23,7 @@ sys.path.append(project_root)
 
 # AWS documented imports
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.exceptions import McpError
 from strands import Agent, tool
 from strands.models import BedrockModel
 from strands.tools.mcp.mcp_client import MCPClient
@@ -27,7 +31,7 @@ from strands_tools import think
 
 # Shared utilities
 from agent_shared.config_manager import AgentCoreConfigManager
-from agent_shared.auth import setup_oauth, get_m2m_token, is_oauth_available
+from agent_shared.auth import setup_oauth, get_m2m_token, clear_m2m_token_cache, is_oauth_available
 from agent_shared.memory import setup_memory, get_conversation_context, save_conversation, is_memory_available
 from agent_shared.responses import format_diy_response, extract_text_from_event, format_error_response
 
@@ -48,6 +52,184 @@ def _create_streamable_http_transport(url, headers=None):
     """
     return streamablehttp_client(url, headers=headers)
 
+# ============================================================================
+# PERSISTENT GATEWAY SESSION AND PER-SESSION AGENTS
+# ============================================================================
+
+class GatewayConnection:
+    """
+    Process-wide MCP session to the gateway, shared by all requests.
+    
+    The client is opened once and reused. It is reopened when the gateway URL
+    or M2M token changes (the token is baked into the transport headers) and
+    when the gateway or its auth fails. The tool list is cached for tool_ttl
+    seconds. Requests hold the client they streamed with via acquire() and
+    release(); a replaced client is only closed once no request uses it.
+    """
+    
+    def __init__(self, tool_ttl):
+        self.tool_ttl = tool_ttl
+        self.generation = 0  # Bumped whenever the cached tool objects change
+        self._lock = threading.Lock()
+        self._client = None
+        self._gateway_url = None
+        self._token = None
+        self._tools = None
+        self._tools_loaded_at = 0.0
+        self._active = {}  # client -> number of requests streaming with it
+    
+    def _open(self, gateway_url, token):
+        self._retire()
+        
+        mcp_client = MCPClient(functools.partial(
+            _create_streamable_http_transport,
+            url=gateway_url,
+            headers={"Authorization": f"Bearer {token}"}
+        ))
+        mcp_client.__enter__()
+        
+        self._client = mcp_client
+        self._gateway_url = gateway_url
+        self._token = token
+        logger.info(f"🔗 MCP gateway session opened: {gateway_url}")
+    
+    def _stop(self, mcp_client):
+        if mcp_client is None:
+            return
+        try:
+            mcp_client.__exit__(None, None, None)
+        except Exception as e:
+            logger.warning(f"⚠️ Error closing MCP client: {e}")
+    
+    def _retire(self):
+        """Stop using the current client; close it now if no request holds it."""
+        mcp_client, self._client, self._tools = self._client, None, None
+        if mcp_client is not None and not self._active.get(mcp_client):
+            self._stop(mcp_client)
+    
+    def acquire(self, gateway_url):
+        """
+        Get the gateway's MCP tools, connecting or reconnecting as needed.
+        
+        The client stays open until release() is called with it.
+        
+        Returns:
+            tuple: (client, tools bound to it, tools generation)
+        """
+        with self._lock:
+            token = get_m2m_token()
+            if not token:
+                raise Exception("No access token")
+            
+            for attempt in range(2):
+                try:
+                    if self._client is None or gateway_url != self._gateway_url or token != self._token:
+                        self._open(gateway_url, token)
+                    
+                    if self._tools is None or time.time() - self._tools_loaded_at > self.tool_ttl:
+                        self._tools = self._client.list_tools_sync() or []
+                        self._tools_loaded_at = time.time()
+                        self.generation += 1
+                        logger.info(f"🛠️ Loaded {len(self._tools)} MCP tools from gateway")
+                    
+                    self._active[self._client] = self._active.get(self._client, 0) + 1
+                    return self._client, self._tools, self.generation
+                    
+                except Exception as e:
+                    self._retire()
+                    if attempt:
+                        raise
+                    logger.warning(f"⚠️ MCP session failed ({e}) - reconnecting")
+                    # A rejected token is the usual cause, so fetch a fresh one
+                    clear_m2m_token_cache()
+                    token = get_m2m_token()
+                    if not token:
+                        raise Exception("No access token")
+    
+    def release(self, mcp_client):
+        """Mark a request done with its client, closing it if it was replaced."""
+        with self._lock:
+            remaining = self._active.get(mcp_client, 0) - 1
+            if remaining > 0:
+                self._active[mcp_client] = remaining
+                return
+            self._active.pop(mcp_client, None)
+            if mcp_client is not self._client:
+                self._stop(mcp_client)
+    
+    def invalidate(self, mcp_client):
+        """Reconnect on the next request if mcp_client is still the current one."""
+        with self._lock:
+            if mcp_client is self._client:
+                self._retire()
+
+def _is_gateway_error(error):
+    """True if error, or an exception it was raised from, came from the MCP transport or auth."""
+    while error is not None:
+        if isinstance(error, (McpError, httpx.HTTPError, ConnectionError)):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+class SessionAgentCache:
+    """
+    Agents kept per session_id so follow-up requests reuse them.
+    
+    A reused agent keeps its conversation in agent.messages. When the tools
+    it was built with change, the agent is rebuilt with the same messages.
+    Least recently used sessions are dropped beyond max_sessions, and idle
+    ones after idle_timeout seconds.
+    """
+    
+    def __init__(self, max_sessions, idle_timeout):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._entries = OrderedDict()  # session_id -> {"agent", "version", "last_used"}
+        self._locks = {}
+    
+    def _evict_idle(self):
+        cutoff = time.time() - self.idle_timeout
+        for session_id in [sid for sid, entry in self._entries.items() if entry["last_used"] < cutoff]:
+            self.discard(session_id)
+    
+    def has(self, session_id):
+        """True if a live agent is cached for the session."""
+        self._evict_idle()
+        return session_id in self._entries
+    
+    def lock(self, session_id):
+        """Lock serializing requests of one session on its agent."""
+        return self._locks.setdefault(session_id, asyncio.Lock())
+    
+    def get(self, session_id, version, build):
+        """
+        Get the session's agent, building it with build(messages) if missing
+        or built for another tools version.
+        """
+        self._evict_idle()
+        entry = self._entries.get(session_id)
+        
+        if entry is None or entry["version"] != version:
+            messages = list(entry["agent"].messages) if entry else None
+            entry = {"agent": build(messages), "version": version}
+            self._entries[session_id] = entry
+            logger.info(f"🤖 Built agent for session {session_id} ({len(self._entries)} cached)")
+        
+        entry["last_used"] = time.time()
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self.max_sessions:
+            self.discard(next(iter(self._entries)))
+        
+        return entry["agent"]
+    
+    def discard(self, session_id):
+        """Forget the session's agent."""
+        self._entries.pop(session_id, None)
+        # A held lock stays so queued requests of the session remain serialized
+        lock = self._locks.get(session_id)
+        if lock is not None and not lock.locked():
+            del self._locks[session_id]
+
 # def execute_agent(bedrock_model, prompt):
 #     """
 #     EXACT pattern from AWS documentation for Strands MCP Client
@@ -102,12 +284,14 @@ def _create_streamable_http_transport(url, headers=None):
 #         agent = Agent(model=bedrock_model, tools=local_tools)
 #         return agent(prompt)
 
-async def execute_agent_streaming(bedrock_model, prompt):
+async def execute_agent_streaming(bedrock_model, prompt, session_id=None):
     """
     Streaming version of AWS documented pattern
+    
+    The gateway MCP session, its tool list and the M2M token are cached for
+    the process; with a session_id the agent itself is reused across requests.
     """
     # Get configuration
-    config_manager = AgentCoreConfigManager()
     gateway_url = config_manager.get_gateway_url()
     
     # Define system prompt for the agent
@@ -219,70 +403,79 @@ Available AWS Services: EC2, S3, Lambda, CloudFormation, IAM, RDS, CloudWatch, C
 
 Remember: Progress updates with emojis are MANDATORY, not optional! Follow the exact pattern shown above.
 """
+    def build_agent(tools, system_prompt=None):
+        def build(messages=None):
+            return Agent(model=bedrock_model, tools=tools, system_prompt=system_prompt, messages=messages)
+        return build
+    
+    async def stream_agent(version, build):
+        if not session_id:
+            async for event in build().stream_async(prompt):
+                yield event
+            return
+        
+        async with session_agents.lock(session_id):
+            agent = session_agents.get(session_id, version, build)
+            async for event in agent.stream_async(prompt):
+                yield event
+    
     # Fallback to local tools if gateway or oauth is not working
     if not gateway_url or not is_oauth_available():
         logger.info("🏠 No MCP available - using local streaming")
         local_tools = [get_current_time, echo_message, think]
-        #agent = Agent(model=bedrock_model, tools=local_tools, system_prompt=system_prompt)
+        async for event in stream_agent("local", build_agent(local_tools)):
+            yield event
+        return
+    
+    async def stream_fallback():
+        logger.info("🏠 Falling back to local streaming")
+        local_tools = [get_current_time, echo_message, think]
         agent = Agent(model=bedrock_model, tools=local_tools)
         async for event in agent.stream_async(prompt):
             yield event
+    
+    try:
+        # Reuses the open MCP session and cached tool list when still valid
+        mcp_client, tools, generation = await asyncio.to_thread(gateway_connection.acquire, gateway_url)
+    except Exception as e:
+        logger.error(f"❌ MCP connection failed: {e}")
+        async for event in stream_fallback():
+            yield event
         return
     
     try:
-        access_token = get_m2m_token()
-        if not access_token:
-            raise Exception("No access token")
-        
-        # Create headers for authentication
-        headers = {"Authorization": f"Bearer {access_token}"}
-        
-        # EXACT AWS pattern: Create MCP client with functools.partial
-        mcp_client = MCPClient(functools.partial(
-            _create_streamable_http_transport,
-            url=gateway_url,
-            headers=headers
-        ))
-        
-        # EXACT AWS pattern: Use context manager
-        with mcp_client:
-            tools = mcp_client.list_tools_sync()
-            
+        try:
             # Add local tools
             all_tools = [get_current_time, echo_message]
             if tools:
                 all_tools.extend(tools)
                 logger.info(f"🛠️ Streaming with {len(tools)} MCP tools + local tools")
             
-            logger.info("$$$$$$$$$$$$$$$$$$$$")
-            logger.info(f"All tools count: {len(all_tools)}")
-            logger.info("$$$$$$$$$$$$$$$$$$$$")
-
-            agent = Agent(model=bedrock_model, tools=all_tools, system_prompt=system_prompt)
-            async for event in agent.stream_async(prompt):
-                    #logger.info("=" * 50)
-                    #logger.info(f"Raw event: {event}")
-                    #logger.info(f"Event type: {type(event)} at {time.time()}")
-                    # Extract delta text if it's a contentBlockDelta event
-                    if isinstance(event, dict) and 'event' in event:
-                        inner_event = event['event']
-                        if 'contentBlockDelta' in inner_event:
-                            delta = inner_event['contentBlockDelta'].get('delta', {})
-                            if 'text' in delta:
-                                logger.info(delta['text'])
-                    #logger.info("*" * 50)
-                    yield event
+            version = ("mcp", generation)
+            async for event in stream_agent(version, build_agent(all_tools, system_prompt)):
+                # Extract delta text if it's a contentBlockDelta event
+                if isinstance(event, dict) and 'event' in event:
+                    inner_event = event['event']
+                    if 'contentBlockDelta' in inner_event:
+                        delta = inner_event['contentBlockDelta'].get('delta', {})
+                        if 'text' in delta:
+                            logger.info(delta['text'])
+                yield event
+        finally:
+            # Closes the client if it was replaced while this request used it
+            await asyncio.to_thread(gateway_connection.release, mcp_client)
                 
     except Exception as e:
         logger.error(f"❌ MCP streaming failed: {e}")
-        # Fallback to local streaming
-        logger.info("🏠 Falling back to local streaming")
-        local_tools = [get_current_time, echo_message, think]
-        agent = Agent(model=bedrock_model, tools=local_tools)
-        async for event in agent.stream_async(prompt):
-            logger.info('@@@@@@@@@@@@@@@@@@@@')
-            logger.info(tools)
-            logger.info('@@@@@@@@@@@@@@@@@@@@')
+        # Only a gateway failure means the shared session is broken; other
+        # requests may still be streaming with it, so it is closed after them
+        if _is_gateway_error(e):
+            await asyncio.to_thread(gateway_connection.invalidate, mcp_client)
+        # Drop the session's agent since a failed turn can leave its messages
+        # half-written
+        if session_id:
+            session_agents.discard(session_id)
+        async for event in stream_fallback():
             yield event
 
 # ============================================================================
@@ -306,6 +499,16 @@ def echo_message(message: str) -> str:
 
 config_manager = AgentCoreConfigManager()
 model_settings = config_manager.get_model_settings()
+cache_settings = config_manager.get_merged_config().get('agents', {}).get('cache', {})
+
+# Shared by all agents; the Bedrock client is safe to reuse across requests
+bedrock_model = BedrockModel(**model_settings, streaming=True, timeout=900)
+
+gateway_connection = GatewayConnection(tool_ttl=cache_settings.get('tool_ttl', 300))
+session_agents = SessionAgentCache(
+    max_sessions=cache_settings.get('max_sessions', 100),
+    idle_timeout=cache_settings.get('session_idle_timeout', 1800)
+)
 
 logger.info(f"🚀 Simple DIY Agent with model: {model_settings['model_id']}")
 
@@ -320,9 +523,10 @@ async def stream_response(user_message: str, session_id: str = None, actor_id: s
     try:
         logger.info(f"🔄 Processing: {user_message[:50]}...")
         
-        # Get conversation context if available
+        # Get conversation context if available; a cached session agent
+        # already holds the conversation
         context = ""
-        if is_memory_available() and session_id:
+        if is_memory_available() and session_id and not session_agents.has(session_id):
             context = get_conversation_context(session_id, actor_id)
         
         # Prepare message with context
@@ -330,13 +534,10 @@ async def stream_response(user_message: str, session_id: str = None, actor_id: s
         if context:
             final_message = f"{context}\n\nCurrent user message: {user_message}"
         
-        # Create model with longer timeout for streaming
-        model = BedrockModel(**model_settings, streaming=True, timeout=900)
-        
         # Use AWS documented streaming pattern
         last_event_time = time.time()
         
-        async for event in execute_agent_streaming(model, final_message):
+        async for event in execute_agent_streaming(bedrock_model, final_message, session_id):
             # Format and yield response
             formatted = format_diy_response(event)
             yield formatted
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Per-request latency benchmark for the DIY agent.
+
+Sends a series of prompts to a running agent (see run-diy-local-container.sh)
+and reports time to first streamed byte and total time per request. The first
+request pays for the M2M token, MCP session, tool listing and agent creation;
+later requests of the same session reuse them.
+
+For a before/after comparison, run it against images built from both commits.
+
+Usage:
+    python benchmark-diy-latency.py [--url http://localhost:8080] [--requests 10]
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+
+import requests
+
+PROMPT = "What is the current time? Use the get_current_time tool."
+
+
+def timed_request(url, prompt, session_id, timeout):
+    """Return (time to first byte, total time) of one streamed invocation in seconds"""
+    started_at = time.perf_counter()
+    first_byte = None
+    with requests.post(
+        f"{url}/invocations",
+        json={"prompt": prompt, "session_id": session_id, "actor_id": "benchmark"},
+        stream=True,
+        timeout=timeout,
+    ) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=None):
+            if chunk and first_byte is None:
+                first_byte = time.perf_counter() - started_at
+    total = time.perf_counter() - started_at
+    return first_byte if first_byte is not None else total, total
+
+
+def summarize(label, values):
+    """Format min / median / max of a list of seconds"""
+    if not values:
+        return f"{label:<24} n/a"
+    return (
+        f"{label:<24} min {min(values):6.2f}s  median {statistics.median(values):6.2f}s  "
+        f"max {max(values):6.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DIY agent request latency")
+    parser.add_argument("--url", default="http://localhost:8080", help="Agent base URL")
+    parser.add_argument("--requests", type=int, default=10, help="Number of requests")
+    parser.add_argument("--prompt", default=PROMPT, help="Prompt to send")
+    parser.add_argument(
+        "--new-session-each",
+        action="store_true",
+        help="Use a new session_id per request (no agent reuse)",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=300, help="Per-request timeout in seconds"
+    )
+    args = parser.parse_args()
+
+    requests.get(f"{args.url}/ping", timeout=10).raise_for_status()
+
+    session_id = f"benchmark-{uuid.uuid4().hex[:8]}"
+    results = []
+    print(f"🚀 {args.requests} requests against {args.url}")
+    for i in range(args.requests):
+        if args.new_session_each:
+            session_id = f"benchmark-{uuid.uuid4().hex[:8]}"
+        ttfb, total = timed_request(args.url, args.prompt, session_id, args.timeout)
+        results.append((ttfb, total))
+        print(f"   #{i + 1:<3} first byte {ttfb:6.2f}s  total {total:6.2f}s")
+
+    first, rest = results[0], results[1:]
+    print("\n📊 Results")
+    print(summarize("First request TTFB", [first[0]]))
+    print(summarize("First request total", [first[1]]))
+    print(summarize("Later requests TTFB", [ttfb for ttfb, _ in rest]))
+    print(summarize("Later requests total", [total for _, total in rest]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the SQL statement splitter used by validate_query.
+
+Compares the single-pass tokenizer in pg_analyze_performance.py with the
+previous splitter, which rescanned the query from the start at every
+semicolon. The legacy splitter is quadratic, so it is only run on the
+smaller inputs.
+
+Usage:
+    python scripts/benchmark_sql_splitter.py [--max-mb 8]
+
+Requires the Lambda dependencies (boto3, psycopg2) to import the module.
+"""
+
+import argparse
+import random
+import time
+
+from pg_analyze_performance import split_sql_statements
+
+STATEMENT_TEMPLATES = [
+    "SELECT id, name FROM users WHERE note = 'semi;colon' AND id > {n};",
+    "SELECT * FROM orders /* block ; comment */ WHERE total > {n};",
+    "SELECT $$ body ; with ; semicolons $$ AS body, {n};",
+    '-- line comment ; here\nSELECT count(*) FROM "Quoted;Table" WHERE x = {n};',
+    "SHOW statement_timeout;",
+]
+
+LEGACY_MAX_BYTES = 64 * 1024
+
+
+def legacy_split_statements(query_text):
+    """The previous splitter, kept here as the benchmark baseline"""
+
+    def is_within_quotes(text, position):
+        single_quotes = False
+        double_quotes = False
+        for i in range(position):
+            if text[i] == "'" and not double_quotes:
+                single_quotes = not single_quotes
+            elif text[i] == '"' and not single_quotes:
+                double_quotes = not double_quotes
+        return single_quotes or double_quotes
+
+    statements = []
+    current_stmt = []
+    i = 0
+    comment_block = False
+    line_comment = False
+    while i < len(query_text):
+        char = query_text[i]
+        if query_text[i : i + 2] == "/*" and not line_comment:
+            comment_block = True
+            current_stmt.append(char)
+            i += 1
+        elif query_text[i : i + 2] == "*/" and comment_block:
+            comment_block = False
+            current_stmt.append(char)
+            i += 1
+        elif query_text[i : i + 2] == "--" and not comment_block:
+            line_comment = True
+            current_stmt.append(char)
+            i += 1
+        elif char == "\n" and line_comment:
+            line_comment = False
+            current_stmt.append(char)
+        elif (
+            char == ";"
+            and not comment_block
+            and not line_comment
+            and not is_within_quotes(query_text, i)
+        ):
+            current_stmt.append(char)
+            stmt = "".join(current_stmt).strip()
+            if stmt:
+                statements.append(stmt)
+            current_stmt = []
+        else:
+            current_stmt.append(char)
+        i += 1
+    last_stmt = "".join(current_stmt).strip()
+    if last_stmt:
+        statements.append(last_stmt)
+    return statements
+
+
+def generate_sql(size_bytes, seed=42):
+    """Generate roughly size_bytes of mixed SQL statements"""
+    rng = random.Random(seed)
+    parts = []
+    total = 0
+    n = 0
+    while total < size_bytes:
+        statement = rng.choice(STATEMENT_TEMPLATES).format(n=n)
+        parts.append(statement)
+        total += len(statement) + 1
+        n += 1
+    return "\n".join(parts)
+
+
+def time_call(func, arg, repeat=3):
+    """Return the best wall time of func(arg) in milliseconds and its result"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        result = func(arg)
+        elapsed = (time.perf_counter() - started_at) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SQL statement splitter")
+    parser.add_argument(
+        "--max-mb", type=float, default=8, help="Largest input size in MB"
+    )
+    args = parser.parse_args()
+
+    sizes = [16 * 1024]
+    while sizes[-1] * 4 <= args.max_mb * 1024 * 1024:
+        sizes.append(sizes[-1] * 4)
+
+    print(
+        f"{'size':>10} {'statements':>11} {'tokenizer ms':>13} {'MB/s':>8} {'legacy ms':>11}"
+    )
+    for size in sizes:
+        sql = generate_sql(size)
+        new_ms, statements = time_call(split_sql_statements, sql)
+        mb_per_s = len(sql) / (1024 * 1024) / (new_ms / 1000)
+
+        legacy = "skipped"
+        if size <= LEGACY_MAX_BYTES:
+            legacy_ms, _ = time_call(legacy_split_statements, sql, repeat=1)
+            legacy = f"{legacy_ms:.1f}"
+
+        print(
+            f"{len(sql):>10} {len(statements):>11} {new_ms:>13.1f} {mb_per_s:>8.1f} {legacy:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -199,6 +199,30 @@ lambda_target_config = {
                             },
                             "required": ["environment","action_type"]
                             }
+                        },
+                        {
+                        "name": "full_report",
+                        "description": "Runs several database health analyses in one call and returns a combined report with per-section timings. Provide the environment (dev/prod). Use action_type default value as full_report to run every analysis, or pass action_types to choose sections (slow_query, connection_management_issues, index_analysis, autovacuum_analysis, io_analysis, replication_analysis, system_health, vacuum_progress, xid_analysis, bloat_analysis, long_running_transactions).",
+                        "inputSchema": {
+                            "type": "object",
+                            "properties": {
+                                "environment": {
+                                    "type": "string"
+                                },
+                                "action_type": {
+                                    "type": "string",
+                                    "description": "The type of action to perform. Use 'full_report' for this tool."
+                                },
+                                "action_types": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "string"
+                                    },
+                                    "description": "Optional list of analyses to include. Defaults to all of them."
+                                }
+                            },
+                            "required": ["environment","action_type"]
+                            }
                         }
                 ]
             }
@@ -1,10 +1,15 @@
+import copy
+import hashlib
 import json
 import boto3
 import psycopg2
+import psycopg2.pool
 import os
 import re
+import threading
 import time
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from botocore.exceptions import ClientError
 
@@ -12,6 +17,65 @@ from botocore.exceptions import ClientError
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Warm-container state. Lambda keeps module globals alive between invocations
+# of the same container, so secrets, parameters and database connections are
+# cached here and only re-fetched when they expire or stop working.
+SECRET_CACHE_TTL_SECONDS = int(os.environ.get('SECRET_CACHE_TTL_SECONDS', '300'))
+DB_POOL_MAX_CONNECTIONS = int(os.environ.get('DB_POOL_MAX_CONNECTIONS', '4'))
+DB_HEALTH_CHECK_INTERVAL_SECONDS = int(os.environ.get('DB_HEALTH_CHECK_INTERVAL_SECONDS', '30'))
+DB_CONNECT_TIMEOUT_SECONDS = int(os.environ.get('DB_CONNECT_TIMEOUT_SECONDS', '10'))
+PLAN_CACHE_TTL_SECONDS = int(os.environ.get('PLAN_CACHE_TTL_SECONDS', '300'))
+PLAN_CACHE_MAX_ENTRIES = int(os.environ.get('PLAN_CACHE_MAX_ENTRIES', '128'))
+
+# Result streaming. Rows are fetched from server-side cursors in batches and
+# fetching and formatting stop once the response reaches RESPONSE_MAX_BYTES.
+FETCH_BATCH_ROWS = int(os.environ.get('FETCH_BATCH_ROWS', '100'))
+RESPONSE_MAX_BYTES = int(os.environ.get('RESPONSE_MAX_BYTES', '25000'))
+
+_aws_clients = {}
+_secret_cache = {}
+_parameter_cache = {}
+_connection_pools = {}
+_connection_owners = {}
+_connection_last_used = {}
+_aws_client_lock = threading.Lock()
+_pool_lock = threading.Lock()
+_plan_cache = OrderedDict()
+_plan_cache_lock = threading.Lock()
+_cold_start = True
+_invocation_timings = {}
+_invocation_timings_lock = threading.Lock()
+
+def _get_aws_client(service_name):
+    """Return a boto3 client for the service, created once per container"""
+    client = _aws_clients.get(service_name)
+    if client is None:
+        with _aws_client_lock:
+            client = _aws_clients.get(service_name)
+            if client is None:
+                session = boto3.session.Session()
+                client = session.client(
+                    service_name=service_name,
+                    region_name=os.environ.get('REGION')
+                )
+                _aws_clients[service_name] = client
+    return client
+
+def _cache_get(cache, key):
+    entry = cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def _cache_put(cache, key, value):
+    cache[key] = (time.monotonic() + SECRET_CACHE_TTL_SECONDS, value)
+
+def _record_timing(name, started_at):
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    # Called from ThreadPoolExecutor workers, so the read-modify-write needs the lock
+    with _invocation_timings_lock:
+        _invocation_timings[name] = _invocation_timings.get(name, 0) + elapsed_ms
+
 class QueryComplexityError(Exception):
     """Custom exception for query complexity violations"""
     pass
@@ -94,6 +158,7 @@ def validate_and_execute_queries(secret_name, query, max_rows=20,
     start_time = time.time()
     conn = None
     total_rows = 0
+    remaining_bytes = RESPONSE_MAX_BYTES
     
     try:
         # Validate and split queries
@@ -139,54 +204,54 @@ def validate_and_execute_queries(secret_name, query, max_rows=20,
                     'complexity_metrics': complexity_metrics
                 }
                 
-                stmt_lower = stmt.lower().strip()
+                is_select_query = stmt.lower().strip().lstrip('(').startswith('select')
                 
-                # Only add LIMIT for SELECT queries
-                if stmt_lower.startswith('select') and 'limit' not in stmt_lower:
-                    remaining_rows = max_total_rows - total_rows
-                    limit_rows = min(max_rows, remaining_rows)
-                    stmt = f"{stmt} LIMIT {limit_rows + 1}"
+                # Row budget for this statement: its own limit, capped by
+                # what is left of the total
+                remaining_rows = max_total_rows - total_rows
+                limit_rows = min(max_rows, remaining_rows)
                 
-                # Execute with explain plan first for SELECT queries
-                if stmt_lower.startswith('select'):
-                    #cur.execute(f"EXPLAIN (FORMAT JSON) {stmt}")
-                    #explain_plan = cur.fetchone()[0]
-                    
-                    # Analyze plan for potential issues
-                    optimization_suggestions = analyze_query_performance(secret_name, stmt)
-                    if optimization_suggestions:
-                        response['optimization_suggestions'].extend(
-                            f"Statement {stmt_index}: {suggestion}"
-                            for suggestion in optimization_suggestions
-                        )
-                
-                # Execute actual query
-                cur.execute(stmt)
-                
-                # Get column names
-                stmt_response['columns'] = [desc[0] for desc in cur.description]
+                # Analyze plan for potential issues on SELECT queries, with
+                # the same LIMIT the statement will run with
+                if is_select_query:
+                    analyzed_stmt = stmt
+                    if can_push_down_limit(stmt):
+                        analyzed_stmt = f"{stmt} LIMIT {limit_rows + 1}"
+                    analysis = analyze_query_performance(secret_name, analyzed_stmt)
+                    # Only the plan's recommendations are suggestions; the other
+                    # keys (summary, performance_stats, plan_cache, ...) are not
+                    response['optimization_suggestions'].extend(
+                        f"Statement {stmt_index}: {recommendation['issue']}"
+                        for recommendation in analysis.get('recommendations', [])
+                    )
                 
-                # Fetch results
-                rows = cur.fetchall()
-                row_count = len(rows)
+                # Execute and stream the rows within the row and byte budgets
+                fetched = fetch_statement_rows(
+                    conn, cur, stmt, stmt_index,
+                    max_rows=limit_rows,
+                    max_bytes=remaining_bytes
+                )
+                rows = fetched['rows']
+                total_rows += len(rows)
+                remaining_bytes = max(remaining_bytes - fetched['metrics']['bytes'], 0)
                 
-                # Check total row limit
-                total_rows += row_count
-                if total_rows > max_total_rows:
+                stmt_response['columns'] = fetched['columns']
+                stmt_response['metrics'] = fetched['metrics']
+                if fetched['truncated_by'] == 'rows':
                     stmt_response['truncated'] = True
-                    excess_rows = total_rows - max_total_rows
-                    rows = rows[:-excess_rows]
-                    stmt_response['message'] = (
-                        f"Results truncated. Maximum total rows ({max_total_rows}) reached"
-                    )
-                    total_rows = max_total_rows
-                
-                # Check individual statement limit
-                elif row_count > max_rows:
+                    if limit_rows < max_rows:
+                        stmt_response['message'] = (
+                            f"Results truncated. Maximum total rows ({max_total_rows}) reached"
+                        )
+                    else:
+                        stmt_response['message'] = (
+                            f"Results truncated to {max_rows} rows"
+                        )
+                elif fetched['truncated_by'] == 'bytes':
                     stmt_response['truncated'] = True
-                    rows = rows[:max_rows]
                     stmt_response['message'] = (
-                        f"Results truncated to {max_rows} rows"
+                        f"Results truncated to {len(rows)} rows: "
+                        f"response size limit ({RESPONSE_MAX_BYTES} bytes) reached"
                     )
                 
                 stmt_response['row_count'] = len(rows)
@@ -235,68 +300,143 @@ def validate_and_execute_queries(secret_name, query, max_rows=20,
     
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
 
 def get_secret(secret_name):
-    """Get secret from AWS Secrets Manager """
-    secret_name = secret_name
-    region_name = os.environ['REGION']
-    session = boto3.session.Session()
-    client = session.client(
-        service_name='secretsmanager',
-        region_name=region_name
-    )
+    """Get secret from AWS Secrets Manager, cached for SECRET_CACHE_TTL_SECONDS"""
+    secret = _cache_get(_secret_cache, secret_name)
+    if secret is not None:
+        return secret
+
+    started_at = time.perf_counter()
+    client = _get_aws_client('secretsmanager')
     
     try:
         secret_value = client.get_secret_value(SecretId=secret_name)
         secret = json.loads(secret_value['SecretString'])
+        _cache_put(_secret_cache, secret_name, secret)
         return secret
     except ClientError as e:
         raise Exception(f"Failed to get secret: {str(e)}")
+    finally:
+        _record_timing('secret_ms', started_at)
 
 def get_env_secret(environment):
-    ssm_client = boto3.client('ssm')
     """Retrieve the secret name for the specified environment"""
-    if environment == 'prod':
-        try:
-            # Get the secret name from Parameter Store
-            response = ssm_client.get_parameter(
-                Name=f'/AuroraOps/{environment}'
-            )
-            print(response['Parameter']['Value'])
-            return response['Parameter']['Value']
-        except ssm_client.exceptions.ParameterNotFound:
-            error_message = f"Parameter not found: /AuroraOps/{environment}"
-            print(error_message)
-            raise Exception(error_message)
-    elif environment == 'dev':
-        try:
-            # Get the secret name from Parameter Store
-            response = ssm_client.get_parameter(
-                Name=f'/AuroraOps/{environment}'
-            )
-            return response['Parameter']['Value']
-        except Exception as e:
-            raise Exception(f"Failed to get dev secret name from Parameter Store: {str(e)}")
-    else:
+    if environment not in ('prod', 'dev'):
         print("environement does not exist")
         raise ValueError(f"Unknown environment: {environment}")
 
+    parameter_name = f'/AuroraOps/{environment}'
+    secret_name = _cache_get(_parameter_cache, parameter_name)
+    if secret_name is not None:
+        return secret_name
+
+    started_at = time.perf_counter()
+    ssm_client = _get_aws_client('ssm')
+    try:
+        # Get the secret name from Parameter Store
+        response = ssm_client.get_parameter(Name=parameter_name)
+        secret_name = response['Parameter']['Value']
+    except ssm_client.exceptions.ParameterNotFound:
+        error_message = f"Parameter not found: {parameter_name}"
+        print(error_message)
+        raise Exception(error_message)
+    except Exception as e:
+        raise Exception(f"Failed to get {environment} secret name from Parameter Store: {str(e)}")
+    finally:
+        _record_timing('parameter_ms', started_at)
+
+    _cache_put(_parameter_cache, parameter_name, secret_name)
+    return secret_name
+
+def _create_pool(secret_name):
+    secret = get_secret(secret_name)
+    return psycopg2.pool.ThreadedConnectionPool(
+        1,
+        DB_POOL_MAX_CONNECTIONS,
+        host=secret['host'],
+        database=secret['dbname'],
+        user=secret['username'],
+        password=secret['password'],
+        port=secret['port'],
+        connect_timeout=DB_CONNECT_TIMEOUT_SECONDS
+    )
+
+def _get_pool(secret_name):
+    """Return the connection pool for a secret, creating it on first use"""
+    pool = _connection_pools.get(secret_name)
+    if pool is not None and not pool.closed:
+        return pool
+
+    with _pool_lock:
+        pool = _connection_pools.get(secret_name)
+        if pool is None or pool.closed:
+            try:
+                pool = _create_pool(secret_name)
+            except psycopg2.OperationalError:
+                # The secret may have been rotated: re-read it and retry once
+                _secret_cache.pop(secret_name, None)
+                pool = _create_pool(secret_name)
+            _connection_pools[secret_name] = pool
+    return pool
+
+def _is_healthy(conn):
+    """Check a pooled connection, probing the server if it has been idle"""
+    if conn.closed:
+        return False
+    last_used = _connection_last_used.get(id(conn))
+    if last_used is None or time.monotonic() - last_used < DB_HEALTH_CHECK_INTERVAL_SECONDS:
+        # Freshly opened or recently used
+        return True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
 def connect_to_db(secret_name):
-    """Establish database connection"""
-    cur_secret = secret_name
-    secret = get_secret(cur_secret)
+    """Get a healthy database connection from the warm pool for this secret"""
+    started_at = time.perf_counter()
     try:
-        conn = psycopg2.connect(
-            host=secret['host'],
-            database=secret['dbname'],
-            user=secret['username'],
-            password=secret['password'],
-            port=secret['port']
-        )
-        return conn
+        pool = _get_pool(secret_name)
+        for _ in range(DB_POOL_MAX_CONNECTIONS + 1):
+            conn = pool.getconn()
+            if _is_healthy(conn):
+                _connection_owners[id(conn)] = pool
+                return conn
+            # Drop broken connections (e.g. closed by the server while frozen)
+            logger.info("Discarding unhealthy pooled database connection")
+            _connection_last_used.pop(id(conn), None)
+            pool.putconn(conn, close=True)
+        raise Exception("No healthy database connection available")
     except Exception as e:
         raise Exception(f"Failed to connect to the database: {str(e)}")
+    finally:
+        _record_timing('connect_ms', started_at)
+
+def release_connection(conn):
+    """Return a connection to its pool with session state reset, or close it"""
+    pool = _connection_owners.pop(id(conn), None)
+    try:
+        if conn.closed:
+            raise psycopg2.InterfaceError("connection already closed")
+        # Roll back any open transaction and RESET session settings
+        conn.reset()
+        keep = True
+    except psycopg2.Error:
+        keep = False
+
+    if pool is None or pool.closed:
+        conn.close()
+        return
+    if keep:
+        _connection_last_used[id(conn)] = time.monotonic()
+    else:
+        _connection_last_used.pop(id(conn), None)
+    pool.putconn(conn, close=not keep)
 
 # Define the queries dictionary for different object types
 queries = {
@@ -570,7 +710,7 @@ def extract_database_object_ddl(secret_name, object_type, object_name=None, obje
     finally:
         if conn:
             try:
-                conn.close()
+                release_connection(conn)
                 print("\nDatabase connection closed")
             except Exception as e:
                 print(f"\nError closing connection: {str(e)}")
@@ -754,9 +894,84 @@ def clean_query_for_explain(query):
     
     return cleaned_query.strip()
 
+_NUMERIC_LITERAL = r'\d+(?:\.\d*)?(?:[eE][-+]?\d+)?|\.\d+'
+_OTHER_TOKEN_PARTS = re.compile(rf'(?P<number>{_NUMERIC_LITERAL})|\S')
+_EXPONENT_SUFFIX = re.compile(r'[eE]\d+')
+
+def fingerprint_query(query):
+    """
+    Normalize a query so that statements differing only in literal values,
+    whitespace, comments or keyword case share one fingerprint
+
+    Parameters:
+    - query: SQL query string
+    Returns:
+    - Normalized query text with string and numeric literals replaced by ?
+    """
+    parts = []
+    for kind, start, end in tokenize_sql(query):
+        if kind in ('space', 'line_comment', 'block_comment'):
+            continue
+        text = query[start:end]
+        if kind == 'string':
+            parts.append('?')
+        elif kind == 'word':
+            # The lexer splits 1e3 into a number and an e3 word
+            if parts and parts[-1] == '?' and _EXPONENT_SUFFIX.fullmatch(text):
+                continue
+            parts.append(text.lower())
+        elif kind == 'other':
+            for part in _OTHER_TOKEN_PARTS.finditer(text):
+                # Keep $n parameter placeholders, strip other numbers
+                if part.group('number') and not (parts and parts[-1] == '$'):
+                    parts.append('?')
+                else:
+                    parts.append(part.group())
+        else:
+            parts.append(text)
+    return ' '.join(parts)
+
+def _plan_cache_key(secret_name, query):
+    fingerprint = fingerprint_query(query)
+    return hashlib.sha256(f"{secret_name}\0{fingerprint}".encode('utf-8')).hexdigest()
+
+def _plan_cache_get(key):
+    """Return a copy of the cached analysis for key, or None if missing or expired"""
+    with _plan_cache_lock:
+        entry = _plan_cache.get(key)
+        if entry is None:
+            return None
+        if entry['expires_at'] <= time.monotonic():
+            del _plan_cache[key]
+            return None
+        _plan_cache.move_to_end(key)
+        analysis = copy.deepcopy(entry['analysis'])
+    analysis['plan_cache'] = {
+        'hit': True,
+        'fingerprint': key[:12],
+        'age_seconds': round(time.monotonic() - entry['cached_at'], 1)
+    }
+    return analysis
+
+def _plan_cache_put(key, plan, analysis):
+    now = time.monotonic()
+    with _plan_cache_lock:
+        _plan_cache[key] = {
+            'plan': plan,
+            'analysis': copy.deepcopy(analysis),
+            'cached_at': now,
+            'expires_at': now + PLAN_CACHE_TTL_SECONDS
+        }
+        _plan_cache.move_to_end(key)
+        while len(_plan_cache) > PLAN_CACHE_MAX_ENTRIES:
+            _plan_cache.popitem(last=False)
+
 def analyze_query_performance(secret_name, query_or_object_name, parameters=None, object_type=None):
     """
     Analyze query performance and provide optimization recommendations
+
+    Plans and their analysis are cached per container by query fingerprint,
+    so repeated requests for the same query shape skip the database.
     
     Parameters:
     - secret_name: Secret containing database credentials
@@ -764,17 +979,29 @@ def analyze_query_performance(secret_name, query_or_object_name, parameters=None
     - parameters: Optional. List of parameter values for parameterized queries
     - object_type: Optional. If provided, will fetch definition from database object
     """
+    cache_key = None
+    if not object_type:
+        query_to_analyze = clean_query_for_explain(query_or_object_name)
+        cache_key = _plan_cache_key(secret_name, query_to_analyze)
+        cached = _plan_cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Plan cache hit for fingerprint {cache_key[:12]}")
+            return cached
+
     conn = connect_to_db(secret_name)
     try:
         with conn.cursor() as cur:
             # If object_type is provided, fetch the query definition
             if object_type:
                 query_to_analyze = get_object_definition(cur, query_or_object_name, object_type)
-            else:
-                query_to_analyze = query_or_object_name
 
-            # Clean the query before analysis
-            query_to_analyze = clean_query_for_explain(query_to_analyze)
+                # Clean the query before analysis
+                query_to_analyze = clean_query_for_explain(query_to_analyze)
+                cache_key = _plan_cache_key(secret_name, query_to_analyze)
+                cached = _plan_cache_get(cache_key)
+                if cached is not None:
+                    logger.info(f"Plan cache hit for fingerprint {cache_key[:12]}")
+                    return cached
 
             # Check if the query contains parameter placeholders
             has_parameters = any(f'${i}' in query_to_analyze for i in range(1, 21))
@@ -790,36 +1017,35 @@ def analyze_query_performance(secret_name, query_or_object_name, parameters=None
 
                 # Use GENERIC_PLAN for parameterized queries
                 cur.execute(f"EXPLAIN (GENERIC_PLAN, BUFFERS, FORMAT JSON) {modified_query}")
-                plan = cur.fetchone()[0]
-
-                cur.execute(f"EXPLAIN (FORMAT JSON) {modified_query}")
-                estimated_plan = cur.fetchone()[0]
-                
-                # Pass True for is_generic_plan
-                analysis = analyze_execution_plan(plan[0], estimated_plan[0], True)
             else:
                 # For non-parameterized queries, use ANALYZE
                 cur.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query_to_analyze}")
-                plan = cur.fetchone()[0]
-                
-                cur.execute(f"EXPLAIN (FORMAT JSON) {query_to_analyze}")
-                estimated_plan = cur.fetchone()[0]
-                
-                # Pass False for is_generic_plan
-                analysis = analyze_execution_plan(plan[0], estimated_plan[0], False)
+            plan = cur.fetchone()[0]
 
-            return analysis
+            # Every node of the plan already carries the planner estimates
+            # (Plan Rows, Total Cost), so it doubles as the estimated plan
+            analysis = analyze_execution_plan(plan[0], is_generic_plan=has_parameters)
+
+        _plan_cache_put(cache_key, plan, analysis)
+        analysis['plan_cache'] = {'hit': False, 'fingerprint': cache_key[:12]}
+        return analysis
 
     except Exception as e:
         raise Exception(f"Failed to analyze query performance: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
 
-def analyze_execution_plan(actual_plan, estimated_plan, is_generic_plan):
+def analyze_execution_plan(actual_plan, estimated_plan=None, is_generic_plan=False):
     """
     Analyze execution plan and provide detailed explanations and recommendations
+
+    estimated_plan defaults to actual_plan, whose nodes include the planner
+    estimates alongside the actual figures.
     """
+    if estimated_plan is None:
+        estimated_plan = actual_plan
+
     analysis = {
         'summary': [],
         'issues': [],
@@ -865,51 +1091,55 @@ def analyze_execution_plan(actual_plan, estimated_plan, is_generic_plan):
 
 def analyze_plan_node(node, analysis, is_generic_plan):
     """
-    Recursively analyze each node in the execution plan
+    Analyze each node in the execution plan, parents before children
+
+    Walks the plan with an explicit stack rather than recursion so that
+    very deep plans cannot exceed the interpreter recursion limit.
     """
-    # Analyze current node
-    node_type = node['Node Type']
-    
-    # Check for expensive operations with appropriate metrics based on plan type
-    if node_type == 'Seq Scan':
-        analysis['issues'].append({
-            'type': 'sequential_scan',
-            'description': f"Sequential scan detected on table {node.get('Relation Name')}",
-            'severity': 'high'
-        })
-    
-    elif node_type == 'Nested Loop':
-        if is_generic_plan:
-            if node.get('Plan Rows', 0) > 1000:
-                analysis['issues'].append({
-                    'type': 'nested_loop_large_dataset',
-                    'description': "Nested loop join planned for large dataset",
-                    'severity': 'medium'
-                })
-        else:
-            if node.get('Actual Rows', 0) > 1000:
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        node_type = node['Node Type']
+
+        # Check for expensive operations with appropriate metrics based on plan type
+        if node_type == 'Seq Scan':
+            analysis['issues'].append({
+                'type': 'sequential_scan',
+                'description': f"Sequential scan detected on table {node.get('Relation Name')}",
+                'severity': 'high'
+            })
+
+        elif node_type == 'Nested Loop':
+            if is_generic_plan:
+                if node.get('Plan Rows', 0) > 1000:
+                    analysis['issues'].append({
+                        'type': 'nested_loop_large_dataset',
+                        'description': "Nested loop join planned for large dataset",
+                        'severity': 'medium'
+                    })
+            else:
+                if node.get('Actual Rows', 0) > 1000:
+                    analysis['issues'].append({
+                        'type': 'nested_loop_large_dataset',
+                        'description': "Nested loop join performed on large dataset",
+                        'severity': 'medium'
+                    })
+
+        elif node_type == 'Hash Join':
+            rows_metric = node.get('Plan Rows' if is_generic_plan else 'Actual Rows', 0)
+            if node.get('Hash Cond') and rows_metric > 10000:
                 analysis['issues'].append({
-                    'type': 'nested_loop_large_dataset',
-                    'description': "Nested loop join performed on large dataset",
+                    'type': 'large_hash_join',
+                    'description': "Large hash join operation detected",
                     'severity': 'medium'
                 })
-    
-    elif node_type == 'Hash Join':
-        rows_metric = node.get('Plan Rows' if is_generic_plan else 'Actual Rows', 0)
-        if node.get('Hash Cond') and rows_metric > 10000:
-            analysis['issues'].append({
-                'type': 'large_hash_join',
-                'description': "Large hash join operation detected",
-                'severity': 'medium'
-            })
 
-    # Check for filter conditions
-    if 'Filter' in node:
-        analyze_filter_condition(node['Filter'], analysis)
+        # Check for filter conditions
+        if 'Filter' in node:
+            analyze_filter_condition(node['Filter'], analysis)
 
-    # Recursively analyze child nodes
-    for child in node.get('Plans', []):
-        analyze_plan_node(child, analysis, is_generic_plan)
+        # Push children in reverse so they are visited in plan order
+        stack.extend(reversed(node.get('Plans', [])))
 
 def analyze_filter_condition(filter_condition, analysis):
     """
@@ -1026,6 +1256,10 @@ def format_analysis_output(analysis):
         output.append(f"- Execution Time: {analysis['performance_stats'].get('execution_time_ms', 'N/A'):.2f} ms")
         output.append(f"- Actual Rows: {analysis['performance_stats'].get('actual_rows', 'N/A')}")
         output.append(f"- Estimated Rows: {analysis['performance_stats'].get('estimated_rows', 'N/A')}")
+
+    plan_cache = analysis.get('plan_cache')
+    if plan_cache and plan_cache.get('hit'):
+        output.append(f"- Plan Source: cached {plan_cache['age_seconds']}s ago (fingerprint {plan_cache['fingerprint']})")
     
     output.append("")
 
@@ -1096,6 +1330,121 @@ def monitor_query_performance(query, start_time, rows_returned):
     
     return metrics
 
+# Single-pass SQL lexer. Strings, quoted identifiers, comments and
+# dollar-quoted bodies are consumed whole, so semicolons and keywords inside
+# them are never mistaken for statement boundaries or commands.
+_SQL_TOKEN_PATTERN = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<line_comment>--[^\n]*)
+  | (?P<block_comment>/\*)
+  | (?P<string>[eE]'(?:[^'\\]+|\\.|'')*'?|'(?:[^']+|'')*'?)
+  | (?P<identifier>"(?:[^"]+|"")*"?)
+  | (?P<dollar>\$(?:[A-Za-z_\u0080-\uffff][A-Za-z_0-9\u0080-\uffff]*)?\$)
+  | (?P<semicolon>;)
+  | (?P<word>[A-Za-z_\u0080-\uffff][A-Za-z_0-9$\u0080-\uffff]*)
+  | (?P<other>[^\s;'"$/A-Za-z_\u0080-\uffff-]+|.)
+""", re.VERBOSE | re.DOTALL)
+_BLOCK_COMMENT_DELIMITERS = re.compile(r'/\*|\*/')
+
+# Keywords that may not appear anywhere in a SELECT statement
+PROHIBITED_KEYWORDS = frozenset([
+    'insert', 'update', 'delete', 'drop', 'truncate', 'alter',
+    'create', 'grant', 'revoke', 'execute', 'copy'
+])
+
+def _block_comment_end(sql, pos):
+    """Return the end of a (possibly nested) block comment opened before pos"""
+    depth = 1
+    for delimiter in _BLOCK_COMMENT_DELIMITERS.finditer(sql, pos):
+        depth += 1 if delimiter.group() == '/*' else -1
+        if depth == 0:
+            return delimiter.end()
+    return len(sql)
+
+def tokenize_sql(sql):
+    """
+    Split SQL text into tokens in a single linear pass
+
+    Args:
+        sql (str): SQL text
+
+    Yields:
+        tuple: (kind, start, end) where kind is one of space, line_comment,
+        block_comment, string, identifier, semicolon, word or other
+    """
+    pos = 0
+    length = len(sql)
+    match = _SQL_TOKEN_PATTERN.match
+    while pos < length:
+        token = match(sql, pos)
+        kind = token.lastgroup
+        end = token.end()
+        if kind == 'block_comment':
+            end = _block_comment_end(sql, end)
+        elif kind == 'dollar':
+            # Dollar-quoted body runs to the next identical $tag$
+            close = sql.find(token.group(), end)
+            end = length if close == -1 else close + len(token.group())
+            kind = 'string'
+        yield kind, pos, end
+        pos = end
+
+def split_sql_statements(sql):
+    """
+    Split SQL text into statements and classify each one
+
+    Args:
+        sql (str): SQL text containing one or more statements
+
+    Returns:
+        list: One dict per non-empty statement with 'text' (without the
+        trailing semicolon or surrounding comments), 'command' (first keyword, lowercased) and
+        'prohibited_keyword' (first keyword from PROHIBITED_KEYWORDS, or None)
+    """
+    statements = []
+    command = None
+    prohibited_keyword = None
+    text_start = text_end = None
+
+    for kind, token_start, token_end in tokenize_sql(sql):
+        if kind == 'semicolon':
+            if command is not None:
+                statements.append({
+                    'text': sql[text_start:text_end],
+                    'command': command,
+                    'prohibited_keyword': prohibited_keyword
+                })
+            command = None
+            prohibited_keyword = None
+            text_start = text_end = None
+            continue
+        if kind in ('space', 'line_comment', 'block_comment'):
+            continue
+
+        # Statement text spans its first to last significant token, so
+        # leading and trailing comments are dropped
+        if text_start is None:
+            text_start = token_start
+        text_end = token_end
+        if kind == 'word':
+            word = sql[token_start:token_end].lower()
+            if command is None:
+                command = word
+            if prohibited_keyword is None and word in PROHIBITED_KEYWORDS:
+                prohibited_keyword = word
+        elif command is None:
+            # Statement starting with something other than a keyword
+            command = sql[token_start:token_end].lower()
+
+    if command is not None:
+        statements.append({
+            'text': sql[text_start:text_end],
+            'command': command,
+            'prohibited_keyword': prohibited_keyword
+        })
+
+    return statements
+
 def validate_query(query):
     """
     Validate query for security concerns and split into statements
@@ -1112,114 +1461,133 @@ def validate_query(query):
     if not query or not isinstance(query, str):
         raise ValueError("Query must be a non-empty string")
 
-    def is_within_quotes(text, position):
-        """Check if a position in text is within quotes"""
-        single_quotes = False
-        double_quotes = False
-        for i in range(position):
-            if text[i] == "'" and not double_quotes:
-                single_quotes = not single_quotes
-            elif text[i] == '"' and not single_quotes:
-                double_quotes = not double_quotes
-        return single_quotes or double_quotes
-
-    def split_statements(query_text):
-        """Split query into individual statements, respecting quotes and comments"""
-        statements = []
-        current_stmt = []
-        i = 0
-        comment_block = False
-        line_comment = False
-        
-        while i < len(query_text):
-            char = query_text[i]
-            
-            # Handle comment blocks
-            if query_text[i:i+2] == '/*' and not line_comment:
-                comment_block = True
-                current_stmt.append(char)
-                i += 1
-            elif query_text[i:i+2] == '*/' and comment_block:
-                comment_block = False
-                current_stmt.append(char)
-                i += 1
-            # Handle line comments
-            elif query_text[i:i+2] == '--' and not comment_block:
-                line_comment = True
-                current_stmt.append(char)
-                i += 1
-            elif char == '\n' and line_comment:
-                line_comment = False
-                current_stmt.append(char)
-            # Handle semicolons
-            elif char == ';' and not comment_block and not line_comment and not is_within_quotes(query_text, i):
-                current_stmt.append(char)
-                stmt = ''.join(current_stmt).strip()
-                if stmt:
-                    statements.append(stmt)
-                current_stmt = []
-            else:
-                current_stmt.append(char)
-            i += 1
-        
-        # Add the last statement if exists
-        last_stmt = ''.join(current_stmt).strip()
-        if last_stmt:
-            statements.append(last_stmt)
-        
-        return [stmt for stmt in statements if stmt]
-
-    # Split into statements
-    statements = split_statements(query)
     validated_statements = []
 
     # Validate each statement
-    for stmt in statements:
-        stmt = stmt.strip()
-        if stmt.endswith(';'):
-            stmt = stmt[:-1]
-        
-        stmt_lower = stmt.lower().strip()
+    for statement in split_sql_statements(query):
+        command = statement['command']
         
-        # Get the command type
-        first_word = stmt_lower.split()[0] if stmt_lower.split() else ''
+        if command not in ['select', 'show']:
+            raise ValueError(f"Prohibited operation detected: {command}")
         
-        if first_word not in ['select', 'show']:
-            raise ValueError(f"Prohibited operation detected: {first_word}")
-        
-        # For SELECT statements, check for dangerous operations
-        if first_word == 'select':
-            dangerous_operations = [
-                r'\binsert\b', r'\bupdate\b', r'\bdelete\b', r'\bdrop\b', 
-                r'\btruncate\b', r'\balter\b', r'\bcreate\b', r'\bgrant\b', 
-                r'\brevoke\b', r'\bexecute\b', r'\bcopy\b'
-            ]
-            
-            # Remove content within quotes for checking
-            query_for_check = ''
-            in_quote = False
-            quote_char = None
-            
-            for char in stmt:
-                if char in ["'", '"'] and (not quote_char or char == quote_char):
-                    if not in_quote:
-                        quote_char = char
-                        in_quote = True
-                    else:
-                        quote_char = None
-                        in_quote = False
-                elif not in_quote:
-                    query_for_check += char
-            
-            # Check for dangerous operations
-            for operation in dangerous_operations:
-                if re.search(operation, query_for_check.lower()):
-                    raise ValueError(f"Statement contains prohibited operation: {operation}")
+        # For SELECT statements, check for dangerous operations outside
+        # strings, quoted identifiers and comments
+        if command == 'select' and statement['prohibited_keyword']:
+            raise ValueError(
+                f"Statement contains prohibited operation: {statement['prohibited_keyword']}"
+            )
         
-        validated_statements.append(stmt)
+        validated_statements.append(statement['text'])
+
+    if not validated_statements:
+        raise ValueError("Query does not contain any statements")
     
     return validated_statements
 
+def can_push_down_limit(statement):
+    """
+    Check whether a LIMIT clause can be appended to a validated statement
+
+    Args:
+        statement (str): Statement text as returned by validate_query
+
+    Returns:
+        bool: True for SELECT statements without a top-level LIMIT or FETCH
+    """
+    depth = 0
+    first_word = None
+    for kind, start, end in tokenize_sql(statement):
+        if kind == 'other':
+            text = statement[start:end]
+            depth += text.count('(') - text.count(')')
+        elif kind == 'word':
+            word = statement[start:end].lower()
+            if first_word is None:
+                first_word = word
+            if depth == 0 and word in ('limit', 'fetch'):
+                return False
+    return first_word == 'select'
+
+def _value_size(value):
+    return len(str(value).encode('utf-8'))
+
+def fetch_statement_rows(conn, cur, statement, stmt_index, max_rows, max_bytes):
+    """
+    Execute one validated statement and stream at most max_rows rows
+
+    SELECT statements run through a named (server-side) cursor, so only the
+    rows that are fetched leave the database, and get a LIMIT pushed down
+    when they have none. Fetching stops at max_rows or once the fetched
+    values exceed max_bytes.
+
+    Args:
+        conn: Database connection with an open read-only transaction
+        cur: Regular cursor on conn, used for statements such as SHOW
+        statement (str): Validated statement text
+        stmt_index (int): Position of the statement, used to name the cursor
+        max_rows (int): Maximum number of rows to keep, or None for no limit
+        max_bytes (int): Maximum size of the kept values, in bytes
+
+    Returns:
+        dict: columns, rows, truncated_by ('rows', 'bytes' or None) and
+        per-statement metrics (rows, bytes, latency_ms)
+    """
+    started_at = time.perf_counter()
+    is_select_query = statement.lower().strip().lstrip('(').startswith('select')
+    limit_pushed_down = (
+        is_select_query and max_rows is not None and can_push_down_limit(statement)
+    )
+    final_query = f"{statement} LIMIT {max_rows + 1}" if limit_pushed_down else statement
+
+    stream = conn.cursor(name=f"stmt_{stmt_index}") if is_select_query else cur
+    rows = []
+    fetched_bytes = 0
+    truncated_by = None
+    try:
+        try:
+            stream.execute(final_query)
+        except psycopg2.Error as pe:
+            logger.error(f"Error executing query: {final_query}")
+            logger.error(f"Error details: {str(pe)}")
+            raise
+
+        while truncated_by is None:
+            batch_size = FETCH_BATCH_ROWS
+            if max_rows is not None:
+                batch_size = min(batch_size, max_rows + 1 - len(rows))
+            batch = stream.fetchmany(batch_size)
+            if not batch:
+                break
+            for row in batch:
+                if max_rows is not None and len(rows) >= max_rows:
+                    truncated_by = 'rows'
+                    break
+                row_bytes = sum(_value_size(value) for value in row)
+                if rows and fetched_bytes + row_bytes > max_bytes:
+                    truncated_by = 'bytes'
+                    break
+                rows.append(row)
+                fetched_bytes += row_bytes
+
+        # Named cursors only describe their columns after the first fetch
+        columns = [desc[0] for desc in stream.description] if stream.description else []
+    finally:
+        if stream is not cur:
+            stream.close()
+
+    return {
+        'columns': columns,
+        'rows': rows,
+        'truncated_by': truncated_by,
+        'metrics': {
+            'rows': len(rows),
+            'bytes': fetched_bytes,
+            'latency_ms': round((time.perf_counter() - started_at) * 1000, 1),
+            'server_side_cursor': is_select_query,
+            'limit_pushed_down': limit_pushed_down
+        }
+    }
+
 def execute_read_query(secret_name, query, max_rows=20):
     """
     Execute read-only queries safely and return results with monitoring
@@ -1242,6 +1610,7 @@ def execute_read_query(secret_name, query, max_rows=20):
     
     start_time = time.time()
     conn = None
+    remaining_bytes = RESPONSE_MAX_BYTES
     
     try:
         # Validate and split queries
@@ -1267,40 +1636,32 @@ def execute_read_query(secret_name, query, max_rows=20):
                 }
                 
                 # Determine if it's a SELECT query
-                stmt_lower = stmt.lower().strip()
-                is_select_query = stmt_lower.lstrip('(').startswith('select')
-                
-                # Prepare the final query
-                final_query = stmt
-                if is_select_query and 'limit' not in stmt_lower:
-                    final_query = f"{stmt} LIMIT {max_rows + 1}"
-                
-                # Execute query
-                try:
-                    cur.execute(final_query)
-                except psycopg2.Error as pe:
-                    logger.error(f"Error executing query: {final_query}")
-                    logger.error(f"Error details: {str(pe)}")
-                    raise
-                
-                # Get column names
-                stmt_response['columns'] = [desc[0] for desc in cur.description]
-                
-                # Fetch results
-                rows = cur.fetchall()
-                total_rows = len(rows)
-                
-                # Handle row limiting only for SELECT queries
-                if is_select_query and total_rows > max_rows:
+                is_select_query = stmt.lower().strip().lstrip('(').startswith('select')
+
+                # Row limiting only applies to SELECT queries
+                fetched = fetch_statement_rows(
+                    conn, cur, stmt, stmt_index,
+                    max_rows=max_rows if is_select_query else None,
+                    max_bytes=remaining_bytes
+                )
+                rows = fetched['rows']
+                remaining_bytes = max(remaining_bytes - fetched['metrics']['bytes'], 0)
+
+                stmt_response['columns'] = fetched['columns']
+                stmt_response['row_count'] = len(rows)
+                stmt_response['metrics'] = fetched['metrics']
+                if fetched['truncated_by'] == 'rows':
                     stmt_response['truncated'] = True
-                    rows = rows[:max_rows]
                     stmt_response['message'] = (
                         f"Results truncated to {max_rows} rows for performance reasons. "
-                        f"Total rows available: {total_rows}"
+                        "More rows are available"
+                    )
+                elif fetched['truncated_by'] == 'bytes':
+                    stmt_response['truncated'] = True
+                    stmt_response['message'] = (
+                        f"Results truncated to {len(rows)} rows: "
+                        f"response size limit ({RESPONSE_MAX_BYTES} bytes) reached"
                     )
-                    stmt_response['row_count'] = max_rows
-                else:
-                    stmt_response['row_count'] = total_rows
                 
                 # Convert rows to list of dictionaries
                 stmt_response['rows'] = [
@@ -1355,13 +1716,66 @@ def execute_read_query(secret_name, query, max_rows=20):
     
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
+
+class _BoundedOutput:
+    """Collects output lines until RESPONSE_MAX_BYTES is used up"""
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = RESPONSE_MAX_BYTES if max_bytes is None else max_bytes
+        self.lines = []
+        self.size = 0
+        self.truncated = False
+
+    def append(self, line):
+        """Add a line, returning False once the budget is exhausted"""
+        if self.truncated:
+            return False
+        line_bytes = len(line.encode('utf-8')) + 1
+        if self.size + line_bytes > self.max_bytes:
+            self.truncated = True
+            return False
+        self.lines.append(line)
+        self.size += line_bytes
+        return True
+
+    def text(self):
+        lines = self.lines
+        if self.truncated:
+            lines = lines + [f"... output truncated at {self.max_bytes} bytes"]
+        return "\n".join(lines)
+
+def _append_result_table(output, columns, rows):
+    """Append rows as an aligned text table, stopping when output is full"""
+    cells = [[str(row[col]) for col in columns] for row in rows]
+    widths = [len(str(col)) for col in columns]
+    for row_cells in cells:
+        for i, cell in enumerate(row_cells):
+            widths[i] = max(widths[i], len(cell))
+
+    header = " | ".join(str(col).ljust(width) for col, width in zip(columns, widths))
+    if not (output.append(header) and output.append("-" * len(header))):
+        return
+    for row_cells in cells:
+        if not output.append(" | ".join(
+            cell.ljust(width) for cell, width in zip(row_cells, widths)
+        )):
+            return
+
+def _rows_returned_line(result):
+    metrics = result.get('metrics')
+    if not metrics:
+        return f"Rows returned: {result['row_count']}"
+    return (
+        f"Rows returned: {result['row_count']} "
+        f"({metrics['bytes']} bytes, {metrics['latency_ms']:.1f} ms)"
+    )
 
 def format_enhanced_results(results):
     """
     Format results with enhanced information
     """
-    formatted_output = []
+    formatted_output = _BoundedOutput()
     
     # Add performance summary
     metrics = results['performance_metrics']
@@ -1387,6 +1801,8 @@ def format_enhanced_results(results):
     
     # Format each statement's results
     for i, result in enumerate(results['results'], 1):
+        if formatted_output.truncated:
+            break
         formatted_output.append(f"Statement {i}:")
         formatted_output.append(f"Query: {result['query']}")
         
@@ -1402,32 +1818,12 @@ def format_enhanced_results(results):
             formatted_output.append(f"Note: {result['message']}")
         
         if result['columns']:
-            # Calculate column widths
-            widths = {
-                col: max(len(str(col)), 
-                        max(len(str(row[col])) for row in result['rows']))
-                for col in result['columns']
-            }
-            
-            # Add header
-            header = " | ".join(
-                str(col).ljust(widths[col])
-                for col in result['columns']
-            )
-            formatted_output.append(header)
-            formatted_output.append("-" * len(header))
+            _append_result_table(formatted_output, result['columns'], result['rows'])
             
-            # Add rows
-            for row in result['rows']:
-                formatted_output.append(" | ".join(
-                    str(row[col]).ljust(widths[col])
-                    for col in result['columns']
-                ))
-            
-        formatted_output.append(f"Rows returned: {result['row_count']}")
+        formatted_output.append(_rows_returned_line(result))
         formatted_output.append("")
     
-    return "\n".join(formatted_output)
+    return formatted_output.text()
 
 def format_query_results(results):
     """
@@ -1439,7 +1835,7 @@ def format_query_results(results):
     Returns:
         str: Formatted results string
     """
-    formatted_output = []
+    formatted_output = _BoundedOutput()
     
     # Add performance message first
     if results['performance_metrics'] and results['performance_metrics']['performance_message']:
@@ -1451,40 +1847,16 @@ def format_query_results(results):
     
     # Add column headers
     if results['columns']:
-        # Calculate column widths
-        widths = {}
-        for col in results['columns']:
-            widths[col] = len(str(col))
-            for row in results['rows']:
-                widths[col] = max(widths[col], len(str(row[col])))
-        
-        # Create header
-        header = " | ".join(
-            str(col).ljust(widths[col])
-            for col in results['columns']
-        )
-        formatted_output.append(header)
-        
-        # Add separator
-        separator = "-" * len(header)
-        formatted_output.append(separator)
-        
-        # Add rows
-        for row in results['rows']:
-            formatted_row = " | ".join(
-                str(row[col]).ljust(widths[col])
-                for col in results['columns']
-            )
-            formatted_output.append(formatted_row)
+        _append_result_table(formatted_output, results['columns'], results['rows'])
     
     # Add summary
     formatted_output.append(f"\nTotal rows: {results['row_count']}")
     
-    return "\n".join(formatted_output)
+    return formatted_output.text()
 
 def format_multi_query_results(results):
     """Format results from multiple statements"""
-    formatted_output = []
+    formatted_output = _BoundedOutput()
     
     # Add performance summary
     metrics = results['performance_metrics']
@@ -1495,37 +1867,19 @@ def format_multi_query_results(results):
     
     # Format each statement's results
     for i, result in enumerate(results['results'], 1):
+        if formatted_output.truncated:
+            break
         formatted_output.append(f"Statement {i}: {result['query']}")
         if result['message']:
             formatted_output.append(f"Note: {result['message']}")
         
         if result['columns']:
-            # Calculate column widths
-            widths = {
-                col: max(len(str(col)), 
-                        max(len(str(row[col])) for row in result['rows']))
-                for col in result['columns']
-            }
-            
-            # Add header
-            header = " | ".join(
-                str(col).ljust(widths[col])
-                for col in result['columns']
-            )
-            formatted_output.append(header)
-            formatted_output.append("-" * len(header))
-            
-            # Add rows
-            for row in result['rows']:
-                formatted_output.append(" | ".join(
-                    str(row[col]).ljust(widths[col])
-                    for col in result['columns']
-                ))
+            _append_result_table(formatted_output, result['columns'], result['rows'])
             
-        formatted_output.append(f"Rows returned: {result['row_count']}")
+        formatted_output.append(_rows_returned_line(result))
         formatted_output.append("")
     
-    return "\n".join(formatted_output)
+    return formatted_output.text()
 
 def execute_enhanced_query_diagnostics(secret_name, query):
     """
@@ -1619,7 +1973,7 @@ def execute_enhanced_query_diagnostics(secret_name, query):
         raise Exception(f"Failed to execute enhanced query diagnostics: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
 
 def execute_performance_insights_analysis(secret_name):
     """
@@ -1702,7 +2056,7 @@ def execute_performance_insights_analysis(secret_name):
         raise Exception(f"Failed to execute performance insights analysis: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
 
 def format_enhanced_diagnostics_output(results):
     """Format enhanced diagnostics results for display"""
@@ -1746,7 +2100,26 @@ def format_enhanced_diagnostics_output(results):
     
     return "\n".join(output)
 
+def _log_invocation_latency(action_type, cold_start, started_at):
+    """Log per-action latency, split into setup time and tagged cold or warm"""
+    metrics = {
+        'metric': 'action_latency',
+        'action_type': action_type,
+        'start': 'cold' if cold_start else 'warm',
+        'total_ms': round((time.perf_counter() - started_at) * 1000, 1)
+    }
+    with _invocation_timings_lock:
+        metrics.update({name: round(value, 1) for name, value in _invocation_timings.items()})
+    logger.info(json.dumps(metrics))
+
 def lambda_handler(event, context):
+    global _cold_start
+    cold_start = _cold_start
+    _cold_start = False
+    with _invocation_timings_lock:
+        _invocation_timings.clear()
+    started_at = time.perf_counter()
+    action_type = None
     try:
         print(f"Received event: {json.dumps(event)}")
         
@@ -1841,4 +2214,6 @@ def lambda_handler(event, context):
             "functionResponse": {
                 "content": f"Error inside the exception block: {str(e)}"
             }
-        }
\ No newline at end of file
+        }
+    finally:
+        _log_invocation_latency(action_type, cold_start, started_at)
\ No newline at end of file
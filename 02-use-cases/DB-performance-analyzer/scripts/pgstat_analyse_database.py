@@ -2,26 +2,173 @@
 import json
 import boto3
 import psycopg2
+import psycopg2.pool
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from botocore.exceptions import ClientError
 
+# Warm-container state. Lambda keeps module globals alive between invocations
+# of the same container, so secrets, parameters and database connections are
+# cached here and only re-fetched when they expire or stop working.
+SECRET_CACHE_TTL_SECONDS = int(os.environ.get('SECRET_CACHE_TTL_SECONDS', '300'))
+DB_POOL_MAX_CONNECTIONS = int(os.environ.get('DB_POOL_MAX_CONNECTIONS', '4'))
+DB_HEALTH_CHECK_INTERVAL_SECONDS = int(os.environ.get('DB_HEALTH_CHECK_INTERVAL_SECONDS', '30'))
+DB_CONNECT_TIMEOUT_SECONDS = int(os.environ.get('DB_CONNECT_TIMEOUT_SECONDS', '10'))
+DB_POOL_WAIT_TIMEOUT_SECONDS = int(os.environ.get('DB_POOL_WAIT_TIMEOUT_SECONDS', '60'))
+
+# Catalog queries of one analysis section run concurrently, each on its own
+# pooled connection and under the same statement timeout.
+SECTION_MAX_WORKERS = int(os.environ.get('SECTION_MAX_WORKERS', str(DB_POOL_MAX_CONNECTIONS)))
+STATEMENT_TIMEOUT_MS = int(os.environ.get('STATEMENT_TIMEOUT_MS', '30000'))
+
+_aws_clients = {}
+_secret_cache = {}
+_parameter_cache = {}
+_connection_pools = {}
+_connection_owners = {}
+_connection_last_used = {}
+_connection_slots = {}
+_pool_slots = {}
+_aws_client_lock = threading.Lock()
+_pool_lock = threading.Lock()
+_cold_start = True
+_invocation_timings = {}
+_invocation_timings_lock = threading.Lock()
+_extensions_ready = set()
+
+def _get_aws_client(service_name):
+    """Return a boto3 client for the service, created once per container"""
+    client = _aws_clients.get(service_name)
+    if client is None:
+        with _aws_client_lock:
+            client = _aws_clients.get(service_name)
+            if client is None:
+                session = boto3.session.Session()
+                client = session.client(
+                    service_name=service_name,
+                    region_name=os.environ.get('REGION')
+                )
+                _aws_clients[service_name] = client
+    return client
+
+def _cache_get(cache, key):
+    entry = cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def _cache_put(cache, key, value):
+    cache[key] = (time.monotonic() + SECRET_CACHE_TTL_SECONDS, value)
+
+def _record_timing(name, started_at):
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    # Called from ThreadPoolExecutor workers, so the read-modify-write needs the lock
+    with _invocation_timings_lock:
+        _invocation_timings[name] = _invocation_timings.get(name, 0) + elapsed_ms
+
 def get_secret(secret_name):
-    """Get secret from AWS Secrets Manager """
-    #secret_name = os.environ['SECRET_NAME']
-    region_name = os.environ['REGION']
-    
-    session = boto3.session.Session()
-    client = session.client(
-        service_name='secretsmanager',
-        region_name=region_name
-    )
+    """Get secret from AWS Secrets Manager, cached for SECRET_CACHE_TTL_SECONDS"""
+    secret = _cache_get(_secret_cache, secret_name)
+    if secret is not None:
+        return secret
+
+    started_at = time.perf_counter()
+    client = _get_aws_client('secretsmanager')
     
     try:
         secret_value = client.get_secret_value(SecretId=secret_name)
         secret = json.loads(secret_value['SecretString'])
+        _cache_put(_secret_cache, secret_name, secret)
         return secret
     except ClientError as e:
         raise Exception(f"Failed to get secret: {str(e)}")
+    finally:
+        _record_timing('secret_ms', started_at)
+
+def ensure_pg_stat_statements(conn, secret_name):
+    """Create the pg_stat_statements extension once per database per container"""
+    if secret_name in _extensions_ready:
+        return
+    with conn.cursor() as cur:
+        cur.execute("""
+            CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
+        """)
+        conn.commit()
+    _extensions_ready.add(secret_name)
+
+class SectionResults(dict):
+    """Rows of each query in an analysis section, with per-query timings"""
+
+    def __init__(self):
+        super().__init__()
+        self.timings = {}
+
+def _run_section_query(secret_name, query):
+    """Run one catalog query on its own pooled connection"""
+    sql, params = query if isinstance(query, tuple) else (query, None)
+    started_at = time.perf_counter()
+    conn = connect_to_db(secret_name)
+    try:
+        with conn.cursor() as cur:
+            # SET LOCAL only lasts until the transaction is rolled back on release
+            cur.execute(f"SET LOCAL statement_timeout = {STATEMENT_TIMEOUT_MS}")
+            cur.execute(sql, params)
+            columns = [desc[0] for desc in cur.description]
+            rows = [dict(zip(columns, row)) for row in cur.fetchall()]
+        error = None
+    except psycopg2.Error as e:
+        rows = []
+        error = str(e).strip()
+    finally:
+        release_connection(conn)
+    return rows, error, (time.perf_counter() - started_at) * 1000
+
+def run_section_queries(secret_name, queries, requires_pg_stat_statements=True):
+    """
+    Run the independent queries of one analysis section concurrently.
+
+    queries maps a query name to its SQL, or to a (SQL, parameters) tuple.
+    A query that fails returns no rows and its error is reported with the
+    timings; failing to get a connection fails the whole section.
+    """
+    if requires_pg_stat_statements and secret_name not in _extensions_ready:
+        conn = connect_to_db(secret_name)
+        try:
+            ensure_pg_stat_statements(conn, secret_name)
+        finally:
+            release_connection(conn)
+
+    results = SectionResults()
+    max_workers = max(1, min(SECTION_MAX_WORKERS, DB_POOL_MAX_CONNECTIONS, len(queries)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            query_name: executor.submit(_run_section_query, secret_name, query)
+            for query_name, query in queries.items()
+        }
+        for query_name, future in futures.items():
+            rows, error, elapsed_ms = future.result()
+            if error:
+                print(f"Error executing {query_name}: {error}")
+            results[query_name] = rows
+            results.timings[query_name] = {
+                'elapsed_ms': elapsed_ms,
+                'rows': len(rows),
+                'error': error
+            }
+    return results
+
+def format_query_timings(timings):
+    """Format per-query timings of a section, slowest first"""
+    output = "\n=== QUERY TIMINGS ===\n"
+    for query_name, timing in sorted(timings.items(), key=lambda item: -item[1]['elapsed_ms']):
+        if timing['error']:
+            status = f"failed: {timing['error']}"
+        else:
+            status = f"{timing['rows']} rows"
+        output += f"• {query_name}: {timing['elapsed_ms']:.0f} ms ({status})\n"
+    return output
 
 def execute_slow_query(secret_name, min_exec_time):
     """Execute enhanced slow query analysis based on runbooks.py diagnostics"""
@@ -49,7 +196,7 @@ def execute_slow_query(secret_name, min_exec_time):
             ORDER BY calls DESC 
             LIMIT 10;
         """,
-        "slow_queries_detailed": """
+        "slow_queries_detailed": ("""
             -- Enhanced slow query analysis with detailed metrics
             SELECT 
                 CASE 
@@ -90,7 +237,7 @@ def execute_slow_query(secret_name, min_exec_time):
             WHERE mean_exec_time >= %s
             ORDER BY total_exec_time DESC
             LIMIT 10;
-        """,
+        """, (min_exec_time,)),
         "high_io_queries": """
             SELECT 
                 CASE 
@@ -150,42 +297,10 @@ def execute_slow_query(secret_name, min_exec_time):
         """
     }
     
-    print("Connecting to the database...")
-    conn = None
     try:
-        conn = connect_to_db(secret_name)
-        print("Connected to the database.")
-    
-        # First, ensure pg_stat_statements is installed
-        print(" I am here 1")
-        with conn.cursor() as cur:
-            print(" I am here 2")
-            cur.execute("""
-                CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
-            """)
-            conn.commit()
-        print(" I am here 3") 
-        # Execute the main query
-        
-        results = {}
-        # Execute each query and collect results
-        for query_name, query in queries.items():
-            print(" I am here 4")
-            with conn.cursor() as cur:
-                print(" I am here 5")
-                cur.execute(query)
-                print(" I am here 6")
-                columns = [desc[0] for desc in cur.description]
-                rows = cur.fetchall()
-                results[query_name] = [dict(zip(columns, row)) for row in rows]
-            print(" I am here 7")
-        return results
-            
+        return run_section_queries(secret_name, queries)
     except Exception as e:
         raise Exception(f"Failed to retrieve slow queries: {str(e)}")
-    finally:
-        if conn:
-            conn.close()
 
 def format_results_for_slow_query(results):
     """Format results in a human-readable string"""
@@ -324,44 +439,10 @@ def execute_connect_issues(secret_name, min_exec_time):
         """
     }
     
-    conn = None
     try:
-        conn = connect_to_db(secret_name)
-        # First, ensure pg_stat_statements is installed
-        
-        with conn.cursor() as cur:
-            cur.execute("""
-                CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
-            """)
-            conn.commit()
-            
-        # Execute the main query
-        
-        results = {}
-        
-        # Execute each query and collect results
-        for query_name, query in queries.items():
-            
-            try:
-                with conn.cursor() as cur:
-                    
-                    cur.execute(query)
-                   
-                    columns = [desc[0] for desc in cur.description]
-                    rows = cur.fetchall()
-                    results[query_name] = [dict(zip(columns, row)) for row in rows]
-                 
-            except Exception as e:
-                print(f"Error executing {query_name}: {str(e)}")
-                results[query_name] = []
-                
-        return results
-            
+        return run_section_queries(secret_name, queries)
     except Exception as e:
         raise Exception(f"Failed to retrieve connection metrics: {str(e)}")
-    finally:
-        if conn:
-            conn.close()
 
 def format_results_for_conn_issues(results):
     """Format connection management results in a human-readable string"""
@@ -477,40 +558,11 @@ def execute_index_analysis(secret_name):
         """
     }
     
-    conn = None
     try:
-        conn = connect_to_db(secret_name)
-        # First, ensure pg_stat_statements is installed
-        
-        with conn.cursor() as cur:
-            cur.execute("""
-                CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
-            """)
-            conn.commit()
-            
-        # Execute the main query    
-        results = {}
-        
-        # Execute each query and collect results
-        for query_name, query in queries.items():
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(query)
-                    columns = [desc[0] for desc in cur.description]
-                    rows = cur.fetchall()
-                    results[query_name] = [dict(zip(columns, row)) for row in rows]
-            except Exception as e:
-                print(f"Error executing {query_name}: {str(e)}")
-                results[query_name] = []
-                
-        return results
-            
+        return run_section_queries(secret_name, queries)
     except Exception as e:
         raise Exception(f"Failed to retrieve index metrics: {str(e)}")
-    finally:
-        if conn:
-            conn.close()
-    
+
 def format_results_for_index_analysis(results):
     """Format index analysis results in a human-readable string"""
     output = "Database Index Analysis Report\n\n"
@@ -692,39 +744,10 @@ def execute_autovacuum_analysis(secret_name):
         """
     }
     
-    conn = None
     try:
-        conn = connect_to_db(secret_name)
-        # First, ensure pg_stat_statements is installed
-        
-        with conn.cursor() as cur:
-            cur.execute("""
-                CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
-            """)
-            conn.commit()
-            
-        # Execute the main query    
-        results = {}
-        
-        # Execute each query and collect results
-        for query_name, query in queries.items():
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(query)
-                    columns = [desc[0] for desc in cur.description]
-                    rows = cur.fetchall()
-                    results[query_name] = [dict(zip(columns, row)) for row in rows]
-            except Exception as e:
-                print(f"Error executing {query_name}: {str(e)}")
-                results[query_name] = []
-                
-        return results
-            
+        return run_section_queries(secret_name, queries)
     except Exception as e:
         raise Exception(f"Failed to retrieve autovacuum metrics: {str(e)}")
-    finally:
-        if conn:
-            conn.close()
 
 def format_results_for_autovacuum_analysis(results):
     """Format autovacuum analysis results in a human-readable string"""
@@ -840,37 +863,10 @@ def execute_io_analysis(secret_name):
         """
     }
     
-    conn = connect_to_db(secret_name)
     try:
-        # First, ensure pg_stat_statements is installed
-        
-        with conn.cursor() as cur:
-            cur.execute("""
-                CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
-            """)
-            conn.commit()
-        
-        results = {}
-        
-        # Execute each query and collect results
-        for query_name, query in queries.items():
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(query)
-                    columns = [desc[0] for desc in cur.description]
-                    rows = cur.fetchall()
-                    results[query_name] = [dict(zip(columns, row)) for row in rows]
-            except Exception as e:
-                print(f"Error executing {query_name}: {str(e)}")
-                results[query_name] = []
-                
-        return results
-            
+        return run_section_queries(secret_name, queries)
     except Exception as e:
         raise Exception(f"Failed to retrieve I/O metrics: {str(e)}")
-    finally:
-        if conn:
-            conn.close()
 
 def format_results_for_io_analysis(results):
     """Format I/O analysis results in a human-readable string"""
@@ -981,36 +977,10 @@ def execute_replication_analysis(secret_name):
         """
     }
     
-    conn = connect_to_db(secret_name)
     try:
-        # First, ensure pg_stat_statements is installed
-        
-        with conn.cursor() as cur:
-            cur.execute("""
-                CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
-            """)
-            conn.commit()
-        results = {}
-        
-        # Execute each query and collect results
-        for query_name, query in queries.items():
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(query)
-                    columns = [desc[0] for desc in cur.description]
-                    rows = cur.fetchall()
-                    results[query_name] = [dict(zip(columns, row)) for row in rows]
-            except Exception as e:
-                print(f"Error executing {query_name}: {str(e)}")
-                results[query_name] = []
-                
-        return results
-            
+        return run_section_queries(secret_name, queries)
     except Exception as e:
         raise Exception(f"Failed to retrieve replication metrics: {str(e)}")
-    finally:
-        if conn:
-            conn.close()
 
 def format_results_for_replication_analysis(results):
     """Format replication analysis results in a human-readable string"""
@@ -1131,37 +1101,10 @@ def execute_system_health(secret_name):
         """
     }
     
-    conn = connect_to_db(secret_name)
     try:
-        # First, ensure pg_stat_statements is installed
-        
-        with conn.cursor() as cur:
-            cur.execute("""
-                CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
-            """)
-            conn.commit()
-        
-        results = {}
-        
-        # Execute each query and collect results
-        for query_name, query in queries.items():
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(query)
-                    columns = [desc[0] for desc in cur.description]
-                    rows = cur.fetchall()
-                    results[query_name] = [dict(zip(columns, row)) for row in rows]
-            except Exception as e:
-                print(f"Error executing {query_name}: {str(e)}")
-                results[query_name] = []
-                
-        return results
-            
+        return run_section_queries(secret_name, queries)
     except Exception as e:
         raise Exception(f"Failed to retrieve system health metrics: {str(e)}")
-    finally:
-        if conn:
-            conn.close()
 
 def format_results_for_system_health(results):
     """Format system health analysis results in a human-readable string"""
@@ -1255,53 +1198,150 @@ def format_results_for_system_health(results):
     
     return output
 
+def get_env_secret(environment):
+    """Retrieve the secret name for the specified environment"""
+    if environment not in ('prod', 'dev'):
+        print("environement does not exist")
+        raise ValueError(f"Unknown environment: {environment}")
+
+    parameter_name = f'/AuroraOps/{environment}'
+    secret_name = _cache_get(_parameter_cache, parameter_name)
+    if secret_name is not None:
+        return secret_name
+
+    started_at = time.perf_counter()
+    ssm_client = _get_aws_client('ssm')
+    try:
+        # Get the secret name from Parameter Store
+        response = ssm_client.get_parameter(Name=parameter_name)
+        secret_name = response['Parameter']['Value']
+    except ssm_client.exceptions.ParameterNotFound:
+        error_message = f"Parameter not found: {parameter_name}"
+        print(error_message)
+        raise Exception(error_message)
+    except Exception as e:
+        raise Exception(f"Failed to get {environment} secret name from Parameter Store: {str(e)}")
+    finally:
+        _record_timing('parameter_ms', started_at)
+
+    _cache_put(_parameter_cache, parameter_name, secret_name)
+    return secret_name
+
+def _create_pool(secret_name):
+    secret = get_secret(secret_name)
+    return psycopg2.pool.ThreadedConnectionPool(
+        1,
+        DB_POOL_MAX_CONNECTIONS,
+        host=secret['host'],
+        database=secret['dbname'],
+        user=secret['username'],
+        password=secret['password'],
+        port=secret['port'],
+        connect_timeout=DB_CONNECT_TIMEOUT_SECONDS
+    )
+
+def _get_pool(secret_name):
+    """Return the connection pool for a secret, creating it on first use"""
+    pool = _connection_pools.get(secret_name)
+    if pool is not None and not pool.closed:
+        return pool
+
+    with _pool_lock:
+        pool = _connection_pools.get(secret_name)
+        if pool is None or pool.closed:
+            try:
+                pool = _create_pool(secret_name)
+            except psycopg2.OperationalError:
+                # The secret may have been rotated: re-read it and retry once
+                _secret_cache.pop(secret_name, None)
+                pool = _create_pool(secret_name)
+            _connection_pools[secret_name] = pool
+    return pool
+
+def _is_healthy(conn):
+    """Check a pooled connection, probing the server if it has been idle"""
+    if conn.closed:
+        return False
+    last_used = _connection_last_used.get(id(conn))
+    if last_used is None or time.monotonic() - last_used < DB_HEALTH_CHECK_INTERVAL_SECONDS:
+        # Freshly opened or recently used
+        return True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+def _get_pool_slots(secret_name):
+    """Return the semaphore bounding checked-out connections for a secret"""
+    slots = _pool_slots.get(secret_name)
+    if slots is None:
+        with _pool_lock:
+            slots = _pool_slots.setdefault(
+                secret_name, threading.BoundedSemaphore(DB_POOL_MAX_CONNECTIONS)
+            )
+    return slots
+
 def connect_to_db(secret_name):
-    """Establish database connection"""
-    cur_secret = secret_name
-    secret = get_secret(cur_secret)
+    """
+    Get a healthy database connection from the warm pool for this secret.
+
+    Waits for a free slot when all DB_POOL_MAX_CONNECTIONS connections are
+    checked out, instead of failing with an exhausted pool.
+    """
+    started_at = time.perf_counter()
+    slots = _get_pool_slots(secret_name)
+    acquired = False
     try:
-        print("in connect_to_db")
-        conn = psycopg2.connect(
-            host=secret['host'],
-            database=secret['dbname'],
-            user=secret['username'],
-            password=secret['password'],
-            port=secret['port']
-        )
-        return conn
+        if not slots.acquire(timeout=DB_POOL_WAIT_TIMEOUT_SECONDS):
+            raise Exception("Timed out waiting for a free pooled connection")
+        acquired = True
+        pool = _get_pool(secret_name)
+        for _ in range(DB_POOL_MAX_CONNECTIONS + 1):
+            conn = pool.getconn()
+            if _is_healthy(conn):
+                _connection_owners[id(conn)] = pool
+                _connection_slots[id(conn)] = slots
+                return conn
+            # Drop broken connections (e.g. closed by the server while frozen)
+            print("Discarding unhealthy pooled database connection")
+            _connection_last_used.pop(id(conn), None)
+            pool.putconn(conn, close=True)
+        raise Exception("No healthy database connection available")
     except Exception as e:
+        if acquired:
+            slots.release()
         raise Exception(f"Failed to connect to the database: {str(e)}")
+    finally:
+        _record_timing('connect_ms', started_at)
 
-def get_env_secret(environment):
-    ssm_client = boto3.client('ssm')
-    print("in get_env_secret")
-    """Retrieve the secret name for the specified environment"""
-    if environment == 'prod':
-        print("in get_env_secret1")
-        try:
-            # Get the secret name from Parameter Store
-            print("in get_env_secret-try")
-            response = ssm_client.get_parameter(
-                Name=f'/AuroraOps/{environment}'
-            )
-            print(response['Parameter']['Value'])
-            return response['Parameter']['Value']
-        except ssm_client.exceptions.ParameterNotFound:
-            error_message = f"Parameter not found: /AuroraOps/{environment}"
-            print(error_message)
-            raise Exception(error_message)
-    elif environment == 'dev':
-        try:
-            # Get the secret name from Parameter Store
-            response = ssm_client.get_parameter(
-                Name=f'/AuroraOps/{environment}'
-            )
-            return response['Parameter']['Value']
-        except Exception as e:
-            raise Exception(f"Failed to get dev secret name from Parameter Store: {str(e)}")
-    else:
-        print("environement does not exist")
-        raise ValueError(f"Unknown environment: {environment}")
+def release_connection(conn):
+    """Return a connection to its pool with session state reset, or close it"""
+    pool = _connection_owners.pop(id(conn), None)
+    slots = _connection_slots.pop(id(conn), None)
+    try:
+        if conn.closed:
+            raise psycopg2.InterfaceError("connection already closed")
+        # Roll back any open transaction and RESET session settings
+        conn.reset()
+        keep = True
+    except psycopg2.Error:
+        keep = False
+
+    try:
+        if pool is None or pool.closed:
+            conn.close()
+            return
+        if keep:
+            _connection_last_used[id(conn)] = time.monotonic()
+        else:
+            _connection_last_used.pop(id(conn), None)
+        pool.putconn(conn, close=not keep)
+    finally:
+        if slots is not None:
+            slots.release()
 
 def execute_vacuum_progress_analysis(secret_name):
     """Execute current vacuum progress analysis based on runbooks.py"""
@@ -1338,7 +1378,7 @@ def execute_vacuum_progress_analysis(secret_name):
         raise Exception(f"Failed to retrieve vacuum progress: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
 
 def execute_xid_analysis(secret_name):
     """Execute XID wraparound analysis based on runbooks.py"""
@@ -1379,28 +1419,10 @@ def execute_xid_analysis(secret_name):
         """
     }
     
-    conn = None
     try:
-        conn = connect_to_db(secret_name)
-        results = {}
-        
-        for query_name, query in queries.items():
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(query)
-                    columns = [desc[0] for desc in cur.description]
-                    rows = cur.fetchall()
-                    results[query_name] = [dict(zip(columns, row)) for row in rows]
-            except Exception as e:
-                print(f"Error executing {query_name}: {str(e)}")
-                results[query_name] = []
-                
-        return results
+        return run_section_queries(secret_name, queries, requires_pg_stat_statements=False)
     except Exception as e:
         raise Exception(f"Failed to retrieve XID analysis: {str(e)}")
-    finally:
-        if conn:
-            conn.close()
 
 def execute_bloat_analysis(secret_name):
     """Execute table and index bloat analysis based on runbooks.py"""
@@ -1474,7 +1496,7 @@ def execute_bloat_analysis(secret_name):
         raise Exception(f"Failed to retrieve bloat analysis: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
 
 def execute_long_running_transactions(secret_name):
     """Execute long-running transaction analysis based on runbooks.py"""
@@ -1504,7 +1526,7 @@ def execute_long_running_transactions(secret_name):
         raise Exception(f"Failed to retrieve long-running transactions: {str(e)}")
     finally:
         if conn:
-            conn.close()
+            release_connection(conn)
 
 def format_results_for_vacuum_progress(results):
     """Format vacuum progress results for display"""
@@ -1596,7 +1618,129 @@ def format_results_for_long_running_transactions(results):
     
     return output
 
+def _log_invocation_latency(action_type, cold_start, started_at):
+    """Log per-action latency, split into setup time and tagged cold or warm"""
+    metrics = {
+        'metric': 'action_latency',
+        'action_type': action_type,
+        'start': 'cold' if cold_start else 'warm',
+        'total_ms': round((time.perf_counter() - started_at) * 1000, 1)
+    }
+    with _invocation_timings_lock:
+        metrics.update({name: round(value, 1) for name, value in _invocation_timings.items()})
+    print(json.dumps(metrics))
+
+MIN_EXEC_TIME = 1000
+BATCH_MAX_WORKERS = int(os.environ.get('BATCH_MAX_WORKERS', '3'))
+
+# action_type -> (report title, execute function, format function)
+ANALYSIS_ACTIONS = {
+    'slow_query': (
+        "Slow Query Analysis",
+        lambda secret_name: execute_slow_query(secret_name, MIN_EXEC_TIME),
+        format_results_for_slow_query
+    ),
+    'connection_management_issues': (
+        "Connection Management",
+        lambda secret_name: execute_connect_issues(secret_name, MIN_EXEC_TIME),
+        format_results_for_conn_issues
+    ),
+    'index_analysis': ("Index Analysis", execute_index_analysis, format_results_for_index_analysis),
+    'autovacuum_analysis': ("Autovacuum Analysis", execute_autovacuum_analysis, format_results_for_autovacuum_analysis),
+    'io_analysis': ("I/O Analysis", execute_io_analysis, format_results_for_io_analysis),
+    'replication_analysis': ("Replication Analysis", execute_replication_analysis, format_results_for_replication_analysis),
+    'system_health': ("System Health", execute_system_health, format_results_for_system_health),
+    'vacuum_progress': ("Vacuum Progress", execute_vacuum_progress_analysis, format_results_for_vacuum_progress),
+    'xid_analysis': ("XID Wraparound Analysis", execute_xid_analysis, format_results_for_xid_analysis),
+    'bloat_analysis': ("Table Bloat Analysis", execute_bloat_analysis, format_results_for_bloat_analysis),
+    'long_running_transactions': ("Long-Running Transactions", execute_long_running_transactions, format_results_for_long_running_transactions),
+}
+
+def run_analysis(secret_name, action_type):
+    """Run one analysis action and return its formatted output"""
+    _, execute, format_results = ANALYSIS_ACTIONS[action_type]
+    print(f"Executing {action_type}")
+    results = execute(secret_name)
+    output = format_results(results)
+    if isinstance(results, SectionResults):
+        output += format_query_timings(results.timings)
+    return output
+
+def _run_report_section(secret_name, action_type):
+    """Run one report section, capturing its output, error and duration"""
+    started_at = time.perf_counter()
+    try:
+        output = run_analysis(secret_name, action_type)
+        error = None
+    except Exception as e:
+        output = None
+        error = str(e)
+    return {
+        'action_type': action_type,
+        'output': output,
+        'error': error,
+        'elapsed_ms': (time.perf_counter() - started_at) * 1000
+    }
+
+def run_batch_analysis(secret_name, action_types):
+    """
+    Run several analysis actions and combine them into one report.
+
+    Sections run concurrently, each on its own connection from the warm pool,
+    bounded by BATCH_MAX_WORKERS and DB_POOL_MAX_CONNECTIONS. A failing
+    section is reported inline without aborting the others.
+    """
+    started_at = time.perf_counter()
+
+    # Create the extension once up front so concurrent sections never race on it
+    conn = connect_to_db(secret_name)
+    try:
+        ensure_pg_stat_statements(conn, secret_name)
+    finally:
+        release_connection(conn)
+
+    max_workers = max(1, min(BATCH_MAX_WORKERS, DB_POOL_MAX_CONNECTIONS, len(action_types)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        sections = list(executor.map(
+            lambda action_type: _run_report_section(secret_name, action_type),
+            action_types
+        ))
+
+    total_ms = (time.perf_counter() - started_at) * 1000
+    failed = sum(1 for section in sections if section['error'])
+
+    output = "=== DATABASE HEALTH REPORT ===\n"
+    output += f"Sections: {len(sections)} ({failed} failed), total time: {total_ms:.0f} ms\n\n"
+    output += "Section timings:\n"
+    for section in sections:
+        title = ANALYSIS_ACTIONS[section['action_type']][0]
+        status = "FAILED" if section['error'] else "ok"
+        output += f"• {title}: {section['elapsed_ms']:.0f} ms ({status})\n"
+
+    for section in sections:
+        title = ANALYSIS_ACTIONS[section['action_type']][0]
+        output += f"\n{'=' * 60}\n{title} ({section['elapsed_ms']:.0f} ms)\n{'=' * 60}\n"
+        if section['error']:
+            output += f"Error: {section['error']}\n"
+        else:
+            output += f"{section['output']}\n"
+
+    return output
+
+def _parse_action_types(action_types):
+    """Accept a list or a comma-separated string of action types"""
+    if isinstance(action_types, str):
+        action_types = action_types.split(',')
+    return [action.strip() for action in action_types if action and action.strip()]
+
 def lambda_handler(event, context):
+    global _cold_start
+    cold_start = _cold_start
+    _cold_start = False
+    with _invocation_timings_lock:
+        _invocation_timings.clear()
+    started_at = time.perf_counter()
+    action_type = None
     try:
         print(f"Received event: {json.dumps(event)}")
         
@@ -1604,79 +1748,50 @@ def lambda_handler(event, context):
         if 'arguments' in event:
             # Extract arguments from the nested structure
             args = event['arguments']
-            environment = args.get('environment')
-            action_type = args.get('action_type')
         else:
             # Use the flat structure
-            environment = event.get('environment')
-            action_type = event.get('action_type')
-        
-        if not environment or not action_type:
+            args = event
+        environment = args.get('environment')
+        action_type = args.get('action_type')
+        action_types = args.get('action_types')
+
+        if action_type == 'full_report' and not action_types:
+            action_types = list(ANALYSIS_ACTIONS)
+
+        if not environment or not (action_type or action_types):
             return {
                 "functionResponse": {
-                    "content": f"Error: Missing required parameters. Need 'environment' and 'action_type'."
+                    "content": f"Error: Missing required parameters. Need 'environment' and 'action_type' (or 'action_types')."
                 }
             }
-            
-        print(f"Environment: {environment}")
-        secret_name = get_env_secret(environment)
-        min_exec_time = 1000
-        # Get slow queries
-        #if tool_name == 'slow_query':
-        if action_type == 'slow_query':
-            print("Executing slow query scripts")
-            results = execute_slow_query(secret_name, min_exec_time)
-            # Format results for Bedrock Agent
-            formatted_output = format_results_for_slow_query(results)
-            print(formatted_output)
-        elif action_type == 'connection_management_issues':
-            print("Executing connection_management_issues")
-            results = execute_connect_issues(secret_name, min_exec_time)
-            # Format results for Bedrock Agent
-            formatted_output = format_results_for_conn_issues(results)
-        elif action_type == 'index_analysis':
-            print("Executing index_analysis")
-            results = execute_index_analysis(secret_name)
-            formatted_output = format_results_for_index_analysis(results)
-        elif action_type == 'autovacuum_analysis':
-            print("Executing autovacuum_analysis")
-            results = execute_autovacuum_analysis(secret_name)
-            formatted_output = format_results_for_autovacuum_analysis(results)
-        elif action_type == 'io_analysis':
-            print("Executing io_analysis")
-            results = execute_io_analysis(secret_name)
-            formatted_output = format_results_for_io_analysis(results)
-        elif action_type == 'replication_analysis':
-            print("Executing replication_analysis")
-            results = execute_replication_analysis(secret_name)
-            formatted_output = format_results_for_replication_analysis(results)
-        elif action_type == 'system_health':
-            print("Executing system_health")
-            results = execute_system_health(secret_name)
-            formatted_output = format_results_for_system_health(results)
-        elif action_type == 'vacuum_progress':
-            print("Executing vacuum_progress analysis")
-            results = execute_vacuum_progress_analysis(secret_name)
-            formatted_output = format_results_for_vacuum_progress(results)
-        elif action_type == 'xid_analysis':
-            print("Executing XID wraparound analysis")
-            results = execute_xid_analysis(secret_name)
-            formatted_output = format_results_for_xid_analysis(results)
-        elif action_type == 'bloat_analysis':
-            print("Executing table bloat analysis")
-            results = execute_bloat_analysis(secret_name)
-            formatted_output = format_results_for_bloat_analysis(results)
-        elif action_type == 'long_running_transactions':
-            print("Executing long-running transactions analysis")
-            results = execute_long_running_transactions(secret_name)
-            formatted_output = format_results_for_long_running_transactions(results)
-        else:
+
+        available = ", ".join(list(ANALYSIS_ACTIONS) + ['full_report'])
+        if action_types:
+            action_types = _parse_action_types(action_types)
+            unknown = [action for action in action_types if action not in ANALYSIS_ACTIONS]
+            if unknown or not action_types:
+                return {
+                    "functionResponse": {
+                        "content": f"Error: Unknown action_types {unknown}. Available actions: {available}"
+                    }
+                }
+        elif action_type not in ANALYSIS_ACTIONS:
             return {
                 "functionResponse": {
-                    "content": f"Error: Unknown action_type '{action_type}'. Available actions: slow_query, connection_management_issues, index_analysis, autovacuum_analysis, io_analysis, replication_analysis, system_health, vacuum_progress, xid_analysis, bloat_analysis, long_running_transactions"
+                    "content": f"Error: Unknown action_type '{action_type}'. Available actions: {available}"
                 }
             }
 
+        print(f"Environment: {environment}")
+        secret_name = get_env_secret(environment)
+
+        if action_types:
+            action_type = action_type or 'batch'
+            print(f"Executing batch analysis: {', '.join(action_types)}")
+            formatted_output = run_batch_analysis(secret_name, action_types)
+        else:
+            formatted_output = run_analysis(secret_name, action_type)
+
         response_body = {
         'TEXT': {
             'body': formatted_output
@@ -1698,4 +1813,6 @@ def lambda_handler(event, context):
             "functionResponse": {
                 "content": f"Error analyzing slow queries: {str(e)}"
             }
-        }
\ No newline at end of file
+        }
+    finally:
+        _log_invocation_latency(action_type, cold_start, started_at)
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""
+In-memory indexed data store shared by the demo backend servers.
+
+Each data file is parsed once and kept in memory together with per-field
+equality indexes and a time-sorted index, so request handlers resolve
+filters with dictionary lookups and binary search instead of re-reading
+and scanning the JSON on every call. Files are reloaded transparently when
+their modification time changes on disk.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def parse_epoch(timestamp_str: Optional[str]) -> Optional[float]:
+    """Parse an ISO timestamp string to epoch seconds, or None if unparseable"""
+    if not timestamp_str:
+        return None
+    try:
+        # Handle both with and without timezone
+        if timestamp_str.endswith("Z"):
+            dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+        else:
+            dt = datetime.fromisoformat(timestamp_str)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def query_epoch(timestamp_str: Optional[str]) -> Optional[float]:
+    """Convert a time query parameter to epoch seconds, or None if not given"""
+    if not timestamp_str:
+        return None
+    epoch = parse_epoch(timestamp_str)
+    if epoch is None:
+        # Fallback: assume current time if parsing fails
+        return datetime.now(timezone.utc).timestamp()
+    return epoch
+
+
+@dataclass(frozen=True)
+class CollectionSpec:
+    """
+    Describes a list of records inside a data file and how to index it.
+
+    A key of None refers to a file whose top-level JSON value is the list.
+    """
+
+    key: Optional[str]
+    index_fields: Tuple[str, ...] = ()
+    time_field: Optional[str] = None
+
+
+class IndexedCollection:
+    """A list of records with equality indexes and an optional time index"""
+
+    def __init__(
+        self,
+        records: List[Dict[str, Any]],
+        index_fields: Iterable[str] = (),
+        time_field: Optional[str] = None,
+    ):
+        self.records = records
+        self._indexes: Dict[str, Dict[Any, List[int]]] = {}
+        for field in index_fields:
+            index: Dict[Any, List[int]] = {}
+            for position, record in enumerate(records):
+                index.setdefault(record.get(field), []).append(position)
+            self._indexes[field] = index
+
+        self._time_keys: List[float] = []
+        self._time_positions: List[int] = []
+        if time_field:
+            timed = []
+            for position, record in enumerate(records):
+                timestamp = record.get(time_field)
+                if not timestamp:
+                    # Records without a timestamp never match a time window
+                    continue
+                epoch = parse_epoch(timestamp)
+                # Unparseable timestamps sort last so open-ended windows keep them
+                timed.append((math.inf if epoch is None else epoch, position))
+            timed.sort()
+            self._time_keys = [epoch for epoch, _ in timed]
+            self._time_positions = [position for _, position in timed]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def filter(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        **equals: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return records matching all equality filters and the time window.
+
+        Filters whose value is None are ignored. Results keep file order.
+
+        Args:
+            start: Inclusive lower bound in epoch seconds
+            end: Inclusive upper bound in epoch seconds
+            **equals: Field/value pairs resolved through the equality indexes
+
+        Returns:
+            Matching records in their original order
+        """
+        positions: Optional[List[int]] = None
+
+        for field, value in equals.items():
+            if value is None:
+                continue
+            if field not in self._indexes:
+                raise KeyError(f"Field '{field}' is not indexed")
+            matched = self._indexes[field].get(value, [])
+            if positions is None:
+                positions = matched
+            else:
+                positions = sorted(set(positions).intersection(matched))
+            if not positions:
+                return []
+
+        if start is not None or end is not None:
+            lo = bisect_left(self._time_keys, start) if start is not None else 0
+            hi = (
+                bisect_right(self._time_keys, end)
+                if end is not None
+                else len(self._time_keys)
+            )
+            window = self._time_positions[lo:hi]
+            if positions is None:
+                positions = sorted(window)
+            else:
+                positions = sorted(set(window).intersection(positions))
+
+        if positions is None:
+            return list(self.records)
+        return [self.records[position] for position in positions]
+
+
+class _LoadedFile:
+    """Parsed contents of a data file plus the collections built from it"""
+
+    def __init__(self, mtime_ns: int, data: Any, specs: Iterable[CollectionSpec]):
+        self.mtime_ns = mtime_ns
+        self.data = data
+        self.collections: Dict[str, IndexedCollection] = {}
+        for spec in specs:
+            if spec.key is None:
+                records = data if isinstance(data, list) else []
+            elif isinstance(data, dict):
+                records = data.get(spec.key, [])
+            else:
+                records = []
+            self.collections[spec.key] = IndexedCollection(
+                records, spec.index_fields, spec.time_field
+            )
+
+
+class DataStore:
+    """Caches parsed JSON data files and reloads them when they change"""
+
+    def __init__(self, data_path: Path):
+        self.data_path = Path(data_path)
+        self._specs: Dict[str, Tuple[CollectionSpec, ...]] = {}
+        self._files: Dict[str, _LoadedFile] = {}
+        self._lock = threading.Lock()
+
+    def register(self, filename: str, *specs: CollectionSpec) -> None:
+        """Declare the collections and indexes to build for a data file"""
+        self._specs[filename] = specs
+        self._files.pop(filename, None)
+
+    def preload(self) -> None:
+        """Load every registered file, skipping ones that do not exist"""
+        for filename in self._specs:
+            try:
+                self._get(filename)
+            except FileNotFoundError:
+                logger.warning(f"Data file not found, skipping preload: {filename}")
+
+    def data(self, filename: str) -> Any:
+        """Return the parsed JSON content of a data file"""
+        return self._get(filename).data
+
+    def collection(self, filename: str, key: Optional[str] = None) -> IndexedCollection:
+        """Return the indexed collection stored under key in a data file"""
+        loaded = self._get(filename)
+        if key not in loaded.collections:
+            raise KeyError(f"Collection '{key}' is not registered for {filename}")
+        return loaded.collections[key]
+
+    def _get(self, filename: str) -> _LoadedFile:
+        path = self.data_path / filename
+        mtime_ns = os.stat(path).st_mtime_ns
+
+        loaded = self._files.get(filename)
+        if loaded is not None and loaded.mtime_ns == mtime_ns:
+            return loaded
+
+        with self._lock:
+            loaded = self._files.get(filename)
+            if loaded is not None and loaded.mtime_ns == mtime_ns:
+                return loaded
+
+            with open(path, "r") as f:
+                data = json.load(f)
+            loaded = _LoadedFile(mtime_ns, data, self._specs.get(filename, ()))
+            self._files[filename] = loaded
+            logger.info(f"Loaded data file {path}")
+            return loaded
@@ -0,0 +1,309 @@
+"""
+Pre-parsed, time-sorted store for plain-text application logs.
+
+Log lines are parsed once into parallel columns (epoch milliseconds, level,
+service, message) kept in timestamp order, so time windows resolve with
+binary search. Pattern search goes through a trigram index over the
+lowercased lines and only verifies candidate rows. When the file grows the
+appended lines are ingested incrementally (tail mode); if it shrinks or is
+replaced it is reloaded from scratch. A final line without a trailing newline
+is ingested too, and re-parsed on the next refresh in case it was still being
+written.
+"""
+
+import logging
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from data_store import parse_epoch
+
+logger = logging.getLogger(__name__)
+
+TRIGRAM_SIZE = 3
+
+
+def _trigrams(text: str) -> set:
+    """Return the set of trigrams contained in text"""
+    return {text[i : i + TRIGRAM_SIZE] for i in range(len(text) - TRIGRAM_SIZE + 1)}
+
+
+def _parse_line(line: str) -> Tuple[Optional[str], str, str, str, bool]:
+    """
+    Split a log line into timestamp, level, service and message.
+
+    Returns:
+        Tuple of (timestamp, level, service, message, structured) where
+        structured is False for lines that do not follow the log format
+    """
+    parts = line.strip().split(" ", 3)
+    if len(parts) < 4:
+        return None, "", "", line.strip(), False
+
+    timestamp, level_part, service, message = parts
+
+    # Extract log level from [LEVEL] format
+    level = "INFO"
+    if "[" in level_part and "]" in level_part:
+        level = level_part.strip("[]")
+
+    return timestamp, level, service, message, True
+
+
+class LogStore:
+    """Columnar, time-sorted view of a text log file with a trigram index"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._inode: Optional[int] = None
+        # Bytes up to _offset hold complete lines; _read_to is the file size seen
+        self._offset = 0
+        self._read_to = 0
+        # Row of the unterminated last line, -1 if its position is unknown
+        self._tail_row: Optional[int] = None
+        self._epochs: List[int] = []
+        self._timestamps: List[Optional[str]] = []
+        self._levels: List[str] = []
+        self._services: List[str] = []
+        self._messages: List[str] = []
+        self._structured: List[bool] = []
+        self._lines_lower: List[str] = []
+        self._trigram_index: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._epochs)
+
+    def refresh(self) -> None:
+        """Ingest lines appended since the last refresh, reloading if rotated"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            if self._inode is not None:
+                with self._lock:
+                    self._reset()
+            raise
+
+        if stat.st_ino == self._inode and stat.st_size == self._read_to:
+            return
+
+        with self._lock:
+            if stat.st_ino != self._inode or stat.st_size < self._read_to:
+                if self._inode is not None:
+                    logger.info(f"Log file {self.path} was replaced, reloading")
+                self._reset()
+                self._inode = stat.st_ino
+
+            # The unterminated last line may have grown; parse it again below
+            if self._tail_row is not None:
+                self._drop_tail_row()
+
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                chunk = f.read()
+                self._read_to = f.tell()
+
+            if not chunk:
+                return
+
+            lines = chunk.split(b"\n")
+            tail = lines.pop()
+            self._offset += len(chunk) - len(tail)
+            if tail:
+                lines.append(tail)
+            if lines:
+                resorted = self._append(
+                    [line.decode("utf-8", errors="replace") for line in lines]
+                )
+                if tail:
+                    self._tail_row = -1 if resorted else len(self._epochs) - 1
+
+    def _drop_tail_row(self) -> None:
+        """Remove the unterminated last line's row so it can be re-parsed"""
+        row_id = self._tail_row
+        self._tail_row = None
+        if row_id != len(self._epochs) - 1:
+            # Rows were re-sorted after the tail was added: reload everything
+            inode = self._inode
+            self._reset()
+            self._inode = inode
+            return
+
+        for trigram in _trigrams(self._lines_lower[row_id]):
+            posting = self._trigram_index[trigram]
+            posting.pop()
+            if not posting:
+                del self._trigram_index[trigram]
+        for column in (
+            self._epochs,
+            self._timestamps,
+            self._levels,
+            self._services,
+            self._messages,
+            self._structured,
+            self._lines_lower,
+        ):
+            column.pop()
+
+    def _append(self, lines: List[str]) -> bool:
+        """Add parsed lines to the columns, returning True if rows were re-sorted"""
+        rows = []
+        previous_epoch = self._epochs[-1] if self._epochs else 0
+        for line in lines:
+            timestamp, level, service, message, structured = _parse_line(line)
+            epoch = parse_epoch(timestamp) if structured else None
+            if epoch is None:
+                # Continuation and unparseable lines stay with the preceding entry
+                epoch_ms = previous_epoch
+            else:
+                epoch_ms = int(epoch * 1000)
+                previous_epoch = epoch_ms
+            rows.append(
+                (epoch_ms, timestamp, level, service, message, structured, line)
+            )
+
+        in_order = not self._epochs or rows[0][0] >= self._epochs[-1]
+        in_order = in_order and all(
+            rows[i][0] <= rows[i + 1][0] for i in range(len(rows) - 1)
+        )
+        if not in_order:
+            # Out-of-order lines: rebuild the columns in timestamp order
+            rows = sorted(list(self._rows()) + rows, key=lambda row: row[0])
+            self._epochs, self._timestamps, self._levels = [], [], []
+            self._services, self._messages, self._structured = [], [], []
+            self._lines_lower, self._trigram_index = [], {}
+
+        for epoch_ms, timestamp, level, service, message, structured, line in rows:
+            row_id = len(self._epochs)
+            line_lower = line.lower()
+            self._epochs.append(epoch_ms)
+            self._timestamps.append(timestamp)
+            self._levels.append(level)
+            self._services.append(service)
+            self._messages.append(message)
+            self._structured.append(structured)
+            self._lines_lower.append(line_lower)
+            for trigram in _trigrams(line_lower):
+                self._trigram_index.setdefault(trigram, []).append(row_id)
+
+        logger.info(f"Ingested {len(rows)} log lines from {self.path}")
+        return not in_order
+
+    def _rows(self) -> Iterator[Tuple[Any, ...]]:
+        for row_id in range(len(self._epochs)):
+            yield (
+                self._epochs[row_id],
+                self._timestamps[row_id],
+                self._levels[row_id],
+                self._services[row_id],
+                self._messages[row_id],
+                self._structured[row_id],
+                self._lines_lower[row_id],
+            )
+
+    def _entry(self, row_id: int) -> Dict[str, Any]:
+        if not self._structured[row_id]:
+            return {"message": self._messages[row_id]}
+        return {
+            "timestamp": self._timestamps[row_id],
+            "level": self._levels[row_id],
+            "service": self._services[row_id],
+            "message": self._messages[row_id],
+        }
+
+    def _candidates(
+        self, pattern_lower: Optional[str], lo: int, hi: int
+    ) -> Iterator[int]:
+        """Yield row ids in [lo, hi) that may contain the pattern, in order"""
+        if not pattern_lower:
+            yield from range(lo, hi)
+            return
+
+        if len(pattern_lower) < TRIGRAM_SIZE:
+            for row_id in range(lo, hi):
+                if pattern_lower in self._lines_lower[row_id]:
+                    yield row_id
+            return
+
+        # Drive the scan from the rarest trigram and verify each candidate
+        postings = []
+        for trigram in _trigrams(pattern_lower):
+            posting = self._trigram_index.get(trigram)
+            if not posting:
+                return
+            postings.append(posting)
+        rarest = min(postings, key=len)
+
+        start = bisect_left(rarest, lo)
+        stop = bisect_left(rarest, hi)
+        for row_id in rarest[start:stop]:
+            if pattern_lower in self._lines_lower[row_id]:
+                yield row_id
+
+    def search(
+        self,
+        pattern: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        level: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search log entries in timestamp order.
+
+        Args:
+            pattern: Case-insensitive substring to match against the raw line
+            start: Inclusive lower time bound in epoch seconds
+            end: Inclusive upper time bound in epoch seconds
+            level: Exact log level to match
+            limit: Maximum number of entries to return
+
+        Returns:
+            Matching log entries, oldest first
+        """
+        self.refresh()
+
+        lo = bisect_left(self._epochs, int(start * 1000)) if start is not None else 0
+        hi = (
+            bisect_right(self._epochs, int(end * 1000))
+            if end is not None
+            else len(self._epochs)
+        )
+
+        results = []
+        pattern_lower = pattern.lower() if pattern else None
+        for row_id in self._candidates(pattern_lower, lo, hi):
+            if level and self._levels[row_id] != level:
+                continue
+            results.append(self._entry(row_id))
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def recent(self, limit: int, service: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return the latest log entries, most recent first.
+
+        Args:
+            limit: Maximum number of entries to return
+            service: Optional substring the service name must contain
+
+        Returns:
+            Log entries in reverse timestamp order
+        """
+        self.refresh()
+
+        results = []
+        for row_id in range(len(self._epochs) - 1, -1, -1):
+            if len(results) >= limit:
+                break
+            if service and service not in self._services[row_id]:
+                continue
+            results.append(self._entry(row_id))
+        return results
@@ -1,9 +1,8 @@
-import json
 import logging
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from data_store import CollectionSpec, DataStore, query_epoch
 from fastapi import (
     Depends,
     FastAPI,
@@ -12,6 +11,7 @@ from fastapi import (
     Query,
 )
 from fastapi.responses import JSONResponse
+from log_store import LogStore
 from retrieve_api_key import retrieve_api_key
 
 # Configure logging with basicConfig
@@ -25,6 +25,20 @@ app = FastAPI(title="Application Logs API", version="1.0.0")
 
 DATA_PATH = Path(__file__).parent.parent / "data" / "logs_data"
 
+# JSON data files are parsed and indexed once, then reloaded only when they change
+store = DataStore(DATA_PATH)
+store.register("error.log", CollectionSpec(None, ("service",), time_field="timestamp"))
+store.register("log_patterns.json")
+store.register("log_counts.json")
+store.preload()
+
+# Application log lines are parsed once into a time-sorted, indexed store
+application_logs = LogStore(DATA_PATH / "application.log")
+try:
+    application_logs.refresh()
+except FileNotFoundError:
+    logging.warning("application.log not found, log search will be empty until created")
+
 # API Key for authentication
 CREDENTIAL_PROVIDER_NAME = "sre-agent-api-key-credential-provider"
 
@@ -48,102 +62,6 @@ def _validate_api_key(x_api_key: str = Header(None, alias="X-API-Key")):
     return x_api_key
 
 
-def _parse_timestamp(timestamp_str: str) -> datetime:
-    """Parse ISO timestamp string to datetime object"""
-    try:
-        # Handle both with and without timezone
-        if timestamp_str.endswith("Z"):
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        elif "+" in timestamp_str or timestamp_str.endswith("0"):
-            return datetime.fromisoformat(timestamp_str)
-        else:
-            return datetime.fromisoformat(timestamp_str + "+00:00")
-    except:
-        # Fallback: assume current time if parsing fails
-        return datetime.now(timezone.utc)
-
-
-def _filter_by_time(
-    logs: list, start_time: Optional[str] = None, end_time: Optional[str] = None
-) -> list:
-    """Filter logs by time range"""
-    if not start_time and not end_time:
-        return logs
-
-    filtered_logs = []
-    start_dt = _parse_timestamp(start_time) if start_time else None
-    end_dt = _parse_timestamp(end_time) if end_time else None
-
-    for log in logs:
-        log_timestamp = log.get("timestamp")
-        if not log_timestamp:
-            continue
-
-        try:
-            log_dt = _parse_timestamp(log_timestamp)
-
-            if start_dt and log_dt < start_dt:
-                continue
-            if end_dt and log_dt > end_dt:
-                continue
-
-            filtered_logs.append(log)
-        except:
-            # Include logs with unparseable timestamps
-            filtered_logs.append(log)
-
-    return filtered_logs
-
-
-def _parse_log_file(file_path: Path, pattern: Optional[str] = None):
-    """Parse log file and filter by pattern"""
-    logs = []
-
-    if file_path.suffix == ".json":
-        with open(file_path, "r") as f:
-            data = json.load(f)
-            # Handle both array and object with array
-            if isinstance(data, list):
-                logs = data
-            elif isinstance(data, dict):
-                # Get the first array value in the dict
-                for key, value in data.items():
-                    if isinstance(value, list):
-                        logs = value
-                        break
-    else:
-        # Parse text log files
-        with open(file_path, "r") as f:
-            for line in f:
-                if pattern and pattern.lower() not in line.lower():
-                    continue
-                # Parse log line to extract timestamp, level, and message
-                parts = line.strip().split(" ", 3)
-                if len(parts) >= 4:
-                    timestamp = parts[0]
-                    level_part = parts[1]
-                    service = parts[2]
-                    message = parts[3] if len(parts) > 3 else ""
-
-                    # Extract log level from [LEVEL] format
-                    level = "INFO"
-                    if "[" in level_part and "]" in level_part:
-                        level = level_part.strip("[]")
-
-                    logs.append(
-                        {
-                            "timestamp": timestamp,
-                            "level": level,
-                            "service": service,
-                            "message": message,
-                        }
-                    )
-                else:
-                    logs.append({"message": line.strip()})
-
-    return logs
-
-
 @app.get("/logs/search")
 async def search_logs(
     pattern: str = Query(..., description="Search pattern or keyword"),
@@ -156,18 +74,16 @@ async def search_logs(
 ):
     """Search logs by pattern/timeframe"""
     try:
-        application_logs = _parse_log_file(DATA_PATH / "application.log", pattern)
-
-        # Filter by log level if provided
-        if log_level:
-            application_logs = [
-                log for log in application_logs if log.get("level") == log_level
-            ]
-
-        # Filter by time range
-        application_logs = _filter_by_time(application_logs, start_time, end_time)
+        # Filter by pattern, log level and time range
+        logs = application_logs.search(
+            pattern=pattern,
+            start=query_epoch(start_time),
+            end=query_epoch(end_time),
+            level=log_level,
+            limit=100,  # Limit results
+        )
 
-        return {"logs": application_logs[:100]}  # Limit results
+        return {"logs": logs}
     except Exception as e:
         logging.error(f"Error searching logs: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -181,15 +97,10 @@ async def get_error_logs(
 ):
     """Retrieve error-specific entries"""
     try:
-        with open(DATA_PATH / "error.log", "r") as f:
-            error_logs = json.load(f)
-
-        if service:
-            error_logs = [log for log in error_logs if log.get("service") == service]
-
-        # Filter by since timestamp
-        if since:
-            error_logs = _filter_by_time(error_logs, start_time=since)
+        # Filter by service and since timestamp
+        error_logs = store.collection("error.log").filter(
+            start=query_epoch(since), service=service
+        )
 
         return {"errors": error_logs}
     except Exception as e:
@@ -216,8 +127,7 @@ async def analyze_log_patterns(
         if not patterns_file.exists():
             return {"patterns": []}
 
-        with open(patterns_file, "r") as f:
-            data = json.load(f)
+        data = store.data("log_patterns.json")
 
         patterns = data.get("patterns", [])
 
@@ -240,14 +150,8 @@ async def get_recent_logs(
 ):
     """Fetch latest log entries"""
     try:
-        all_logs = _parse_log_file(DATA_PATH / "application.log")
-
-        if service:
-            all_logs = [log for log in all_logs if service in log.get("service", "")]
-
-        # Return the most recent logs (last N entries)
-        recent_logs = all_logs[-limit:] if len(all_logs) > limit else all_logs
-        recent_logs.reverse()  # Most recent first
+        # Return the most recent logs (last N entries), most recent first
+        recent_logs = application_logs.recent(limit, service=service)
 
         return {"logs": recent_logs}
     except Exception as e:
@@ -275,8 +179,7 @@ async def count_log_events(
         if not counts_file.exists():
             return {"total_count": 0, "counts": []}
 
-        with open(counts_file, "r") as f:
-            data = json.load(f)
+        data = store.data("log_counts.json")
 
         if event_type.lower() == "error":
             error_data = data.get("error_counts", {})
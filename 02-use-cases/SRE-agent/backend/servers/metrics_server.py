@@ -1,9 +1,8 @@
-import json
 import logging
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from data_store import CollectionSpec, DataStore, query_epoch
 from fastapi import (
     Depends,
     FastAPI,
@@ -25,6 +24,19 @@ app = FastAPI(title="Application Metrics API", version="1.0.0")
 
 DATA_PATH = Path(__file__).parent.parent / "data" / "metrics_data"
 
+# Data files are parsed and indexed once, then reloaded only when they change
+store = DataStore(DATA_PATH)
+for _filename in ("response_times.json", "throughput.json", "resource_usage.json"):
+    store.register(
+        _filename, CollectionSpec("metrics", ("service",), time_field="timestamp")
+    )
+store.register("error_rates.json", CollectionSpec("error_rates", ("service",)))
+store.register(
+    "availability.json", CollectionSpec("availability_metrics", ("service",))
+)
+store.register("trends.json")
+store.preload()
+
 # API Key for authentication
 CREDENTIAL_PROVIDER_NAME = "sre-agent-api-key-credential-provider"
 
@@ -48,53 +60,6 @@ def _validate_api_key(x_api_key: str = Header(None, alias="X-API-Key")):
     return x_api_key
 
 
-def _parse_timestamp(timestamp_str: str) -> datetime:
-    """Parse ISO timestamp string to datetime object"""
-    try:
-        # Handle both with and without timezone
-        if timestamp_str.endswith("Z"):
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        elif "+" in timestamp_str or timestamp_str.endswith("0"):
-            return datetime.fromisoformat(timestamp_str)
-        else:
-            return datetime.fromisoformat(timestamp_str + "+00:00")
-    except:
-        # Fallback: assume current time if parsing fails
-        return datetime.now(timezone.utc)
-
-
-def _filter_metrics_by_time(
-    metrics: list, start_time: Optional[str] = None, end_time: Optional[str] = None
-) -> list:
-    """Filter metrics by time range"""
-    if not start_time and not end_time:
-        return metrics
-
-    filtered_metrics = []
-    start_dt = _parse_timestamp(start_time) if start_time else None
-    end_dt = _parse_timestamp(end_time) if end_time else None
-
-    for metric in metrics:
-        metric_timestamp = metric.get("timestamp")
-        if not metric_timestamp:
-            continue
-
-        try:
-            metric_dt = _parse_timestamp(metric_timestamp)
-
-            if start_dt and metric_dt < start_dt:
-                continue
-            if end_dt and metric_dt > end_dt:
-                continue
-
-            filtered_metrics.append(metric)
-        except:
-            # Include metrics with unparseable timestamps
-            filtered_metrics.append(metric)
-
-    return filtered_metrics
-
-
 @app.get("/metrics/performance")
 async def get_performance_metrics(
     metric_type: Optional[str] = Query(
@@ -109,52 +74,44 @@ async def get_performance_metrics(
 ):
     """Retrieve performance data"""
     try:
-        metrics = []
-
         if metric_type == "response_time":
-            with open(DATA_PATH / "response_times.json", "r") as f:
-                data = json.load(f)
-                metrics = data.get("metrics", [])
+            filename = "response_times.json"
         elif metric_type == "throughput":
-            with open(DATA_PATH / "throughput.json", "r") as f:
-                data = json.load(f)
-                metrics = data.get("metrics", [])
-        elif metric_type in ["cpu_usage", "memory_usage"]:
-            with open(DATA_PATH / "resource_usage.json", "r") as f:
-                data = json.load(f)
-                raw_metrics = data.get("metrics", [])
-                # Transform resource metrics to match expected format
-                metrics = []
-                for m in raw_metrics:
-                    if metric_type == "cpu_usage":
-                        metrics.append(
-                            {
-                                "timestamp": m["timestamp"],
-                                "service": m["service"],
-                                "value": m["cpu_usage_percent"],
-                                "unit": "percent",
-                            }
-                        )
-                    else:  # memory_usage
-                        metrics.append(
-                            {
-                                "timestamp": m["timestamp"],
-                                "service": m["service"],
-                                "value": m["memory_usage_mb"],
-                                "unit": "MB",
-                            }
-                        )
+            filename = "throughput.json"
         else:
-            # Return combined metrics for demo
-            with open(DATA_PATH / "resource_usage.json", "r") as f:
-                data = json.load(f)
-                metrics = data.get("metrics", [])
-
-        if service:
-            metrics = [m for m in metrics if m.get("service") == service]
+            # cpu/memory usage and combined metrics for demo come from resource usage
+            filename = "resource_usage.json"
+
+        # Filter by service and time range
+        metrics = store.collection(filename, "metrics").filter(
+            start=query_epoch(start_time),
+            end=query_epoch(end_time),
+            service=service,
+        )
 
-        # Filter by time range
-        metrics = _filter_metrics_by_time(metrics, start_time, end_time)
+        if metric_type in ["cpu_usage", "memory_usage"]:
+            # Transform resource metrics to match expected format
+            raw_metrics = metrics
+            metrics = []
+            for m in raw_metrics:
+                if metric_type == "cpu_usage":
+                    metrics.append(
+                        {
+                            "timestamp": m["timestamp"],
+                            "service": m["service"],
+                            "value": m["cpu_usage_percent"],
+                            "unit": "percent",
+                        }
+                    )
+                else:  # memory_usage
+                    metrics.append(
+                        {
+                            "timestamp": m["timestamp"],
+                            "service": m["service"],
+                            "value": m["memory_usage_mb"],
+                            "unit": "MB",
+                        }
+                    )
 
         return {"metrics": metrics}
     except Exception as e:
@@ -172,13 +129,9 @@ async def get_error_rates(
 ):
     """Fetch error rate statistics"""
     try:
-        with open(DATA_PATH / "error_rates.json", "r") as f:
-            data = json.load(f)
-
-        error_rates = data.get("error_rates", [])
-
-        if service:
-            error_rates = [e for e in error_rates if e.get("service") == service]
+        error_rates = store.collection("error_rates.json", "error_rates").filter(
+            service=service
+        )
 
         # TODO: In real implementation, would filter by time window
 
@@ -203,13 +156,9 @@ async def get_resource_metrics(
 ):
     """Monitor resource utilization"""
     try:
-        with open(DATA_PATH / "resource_usage.json", "r") as f:
-            data = json.load(f)
-
-        metrics = data.get("metrics", [])
-
-        if service:
-            metrics = [m for m in metrics if m.get("service") == service]
+        metrics = store.collection("resource_usage.json", "metrics").filter(
+            service=service
+        )
 
         # Filter by resource type if specified
         if resource_type:
@@ -248,15 +197,9 @@ async def get_availability_metrics(
 ):
     """Check service availability"""
     try:
-        with open(DATA_PATH / "availability.json", "r") as f:
-            data = json.load(f)
-
-        availability_metrics = data.get("availability_metrics", [])
-
-        if service:
-            availability_metrics = [
-                a for a in availability_metrics if a.get("service") == service
-            ]
+        availability_metrics = store.collection(
+            "availability.json", "availability_metrics"
+        ).filter(service=service)
 
         # TODO: In real implementation, would calculate based on time window
 
@@ -292,8 +235,7 @@ async def analyze_trends(
                 "anomalies": [],
             }
 
-        with open(trends_file, "r") as f:
-            data = json.load(f)
+        data = store.data("trends.json")
 
         # Determine which trend data to use based on metric name
         if "response" in metric_name.lower():
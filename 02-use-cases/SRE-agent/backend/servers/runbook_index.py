@@ -0,0 +1,255 @@
+"""
+BM25 full-text index over the runbook corpora.
+
+Incident playbooks, troubleshooting guides and common resolutions are
+tokenized once into an inverted index; the markdown runbooks are folded
+into the document with the matching ID so their prose is searchable too.
+Queries score only the postings of their terms and return ranked, paged
+results. The index is rebuilt when any of the underlying files change;
+a missing data file contributes no documents.
+"""
+
+import heapq
+import logging
+import math
+import os
+import re
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from data_store import DataStore
+
+logger = logging.getLogger(__name__)
+
+# Source name -> (data file, collection key, fields to index)
+RUNBOOK_SOURCES = {
+    "playbook": (
+        "incident_playbooks.json",
+        "playbooks",
+        ("id", "title", "description", "triggers", "steps"),
+    ),
+    "guide": (
+        "troubleshooting_guides.json",
+        "guides",
+        ("id", "title", "category", "steps"),
+    ),
+    "resolution": (
+        "common_resolutions.json",
+        "resolutions",
+        ("id", "issue", "symptoms", "quick_fixes", "permanent_solutions"),
+    ),
+}
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_MARKDOWN_ID_PATTERN = re.compile(r"\*\*[A-Za-z ]+ID:\*\*\s*`([^`]+)`")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase text and split it into alphanumeric tokens"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _flatten(value: Any) -> Iterable[str]:
+    """Yield every string contained in a JSON value"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _flatten(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _flatten(item)
+
+
+def _markdown_sections(text: str) -> Iterable[Tuple[str, str]]:
+    """Yield (runbook id, section text) for each '## ' section with an ID line"""
+    for section in re.split(r"^## ", text, flags=re.MULTILINE)[1:]:
+        match = _MARKDOWN_ID_PATTERN.search(section)
+        if match:
+            yield match.group(1), section
+
+
+class RunbookIndex:
+    """Okapi BM25 inverted index over runbook documents"""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._documents: List[Tuple[str, str, Dict[str, Any]]] = []
+        self._lengths: List[int] = []
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._vocabulary: List[str] = []
+        self._expansions: Dict[str, List[str]] = {}
+        self._average_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(
+        self, source: str, doc_id: str, record: Dict[str, Any], texts: Iterable[str]
+    ) -> None:
+        """Add a document made of the given texts"""
+        doc_index = len(self._documents)
+        self._documents.append((source, doc_id, record))
+        length = 0
+        for text in texts:
+            for token in tokenize(text):
+                postings = self._postings.setdefault(token, {})
+                postings[doc_index] = postings.get(doc_index, 0) + 1
+                length += 1
+        self._lengths.append(length)
+
+    def finalize(self) -> None:
+        """Compute corpus statistics once all documents are added"""
+        self._vocabulary = sorted(self._postings)
+        if self._lengths:
+            self._average_length = max(sum(self._lengths) / len(self._lengths), 1.0)
+
+    def _expand(self, token: str) -> List[str]:
+        """Return the vocabulary terms that contain the token
+
+        Prefix matches come from a binary search of the sorted vocabulary; when
+        there are none, the vocabulary is scanned for the token as a substring
+        so infixes like 'loop' still match. Expansions are cached per token.
+        """
+        terms = self._expansions.get(token)
+        if terms is not None:
+            return terms
+
+        terms = []
+        position = bisect_left(self._vocabulary, token)
+        while position < len(self._vocabulary) and self._vocabulary[
+            position
+        ].startswith(token):
+            terms.append(self._vocabulary[position])
+            position += 1
+        if not terms:
+            terms = [term for term in self._vocabulary if token in term]
+        self._expansions[token] = terms
+        return terms
+
+    def search(
+        self,
+        query: str,
+        source: Optional[str] = None,
+        doc_ids: Optional[Set[str]] = None,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> Tuple[int, List[Tuple[float, Dict[str, Any]]]]:
+        """
+        Rank documents against a free-text query.
+
+        Query tokens also match vocabulary terms they are a prefix of, so
+        'crashloop' finds 'CrashLoopBackOff', or failing that terms that
+        contain them, so 'loop' does too.
+
+        Args:
+            query: Free-text query
+            source: Restrict results to one source (playbook, guide, resolution)
+            doc_ids: Restrict results to these document IDs
+            limit: Page size
+            offset: Number of ranked results to skip
+
+        Returns:
+            Tuple of (total matching documents, [(score, record), ...])
+        """
+        document_count = len(self._documents)
+        scores: Dict[int, float] = {}
+
+        for token in set(tokenize(query)):
+            for term in self._expand(token):
+                postings = self._postings[term]
+                idf = math.log(
+                    1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5)
+                )
+                for doc_index, frequency in postings.items():
+                    doc_source, doc_id, _ = self._documents[doc_index]
+                    if source and doc_source != source:
+                        continue
+                    if doc_ids is not None and doc_id not in doc_ids:
+                        continue
+                    relative_length = self._lengths[doc_index] / self._average_length
+                    norm = self.k1 * (1 - self.b + self.b * relative_length)
+                    scores[doc_index] = scores.get(doc_index, 0.0) + idf * (
+                        frequency * (self.k1 + 1) / (frequency + norm)
+                    )
+
+        top = heapq.nlargest(
+            offset + limit, scores.items(), key=lambda item: (item[1], -item[0])
+        )
+        page = [
+            (score, self._documents[doc_index][2]) for doc_index, score in top[offset:]
+        ]
+        return len(scores), page
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Return a file's modification time, or None if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class RunbookSearch:
+    """Keeps a RunbookIndex in sync with the runbook data files"""
+
+    def __init__(self, store: DataStore, markdown_path: Path):
+        self.store = store
+        self.markdown_path = Path(markdown_path)
+        self._index = RunbookIndex()
+        self._signature: Optional[Tuple[Any, ...]] = None
+        self._lock = threading.Lock()
+
+    def _current_signature(self) -> Tuple[Any, ...]:
+        signature = []
+        for filename, _, _ in RUNBOOK_SOURCES.values():
+            signature.append(_mtime_ns(self.store.data_path / filename))
+        if self.markdown_path.is_dir():
+            for path in sorted(self.markdown_path.glob("*.md")):
+                signature.append((path.name, _mtime_ns(path)))
+        return tuple(signature)
+
+    def index(self) -> RunbookIndex:
+        """Return the index, rebuilding it if any source file changed"""
+        signature = self._current_signature()
+        if signature == self._signature:
+            return self._index
+
+        with self._lock:
+            if signature != self._signature:
+                self._index = self._build()
+                self._signature = signature
+            return self._index
+
+    def _build(self) -> RunbookIndex:
+        markdown_text: Dict[str, List[str]] = {}
+        if self.markdown_path.is_dir():
+            for path in sorted(self.markdown_path.glob("*.md")):
+                try:
+                    text = path.read_text()
+                except FileNotFoundError:
+                    continue
+                for doc_id, section in _markdown_sections(text):
+                    markdown_text.setdefault(doc_id, []).append(section)
+
+        index = RunbookIndex()
+        for source, (filename, key, fields) in RUNBOOK_SOURCES.items():
+            try:
+                records = self.store.collection(filename, key).records
+            except FileNotFoundError:
+                logger.warning(f"Runbook data file not found, skipping: {filename}")
+                continue
+            for record in records:
+                doc_id = record.get("id", "")
+                texts = [
+                    text for field in fields for text in _flatten(record.get(field))
+                ]
+                texts.extend(markdown_text.get(doc_id, []))
+                index.add(source, doc_id, record, texts)
+        index.finalize()
+
+        logger.info(f"Built runbook search index over {len(index)} documents")
+        return index
@@ -3,6 +3,7 @@ import logging
 from pathlib import Path
 from typing import Optional
 
+from data_store import CollectionSpec, DataStore
 from fastapi import (
     Depends,
     FastAPI,
@@ -15,6 +16,7 @@ from fastapi import (
 )
 from fastapi.responses import JSONResponse
 from retrieve_api_key import retrieve_api_key
+from runbook_index import RunbookSearch
 
 # Configure logging with basicConfig
 logging.basicConfig(
@@ -27,6 +29,24 @@ app = FastAPI(title="DevOps Runbooks API", version="1.0.0")
 
 DATA_PATH = Path(__file__).parent.parent / "data" / "runbooks_data"
 
+# Data files are parsed and indexed once, then reloaded only when they change
+store = DataStore(DATA_PATH)
+store.register(
+    "incident_playbooks.json",
+    CollectionSpec("playbooks", ("id", "incident_type", "severity")),
+)
+store.register("troubleshooting_guides.json", CollectionSpec("guides", ("category",)))
+store.register(
+    "escalation_procedures.json",
+    CollectionSpec("escalation_procedures", ("severity",)),
+)
+store.register("common_resolutions.json", CollectionSpec("resolutions"))
+store.preload()
+
+# Ranked full-text search over playbooks, guides, resolutions and markdown runbooks
+runbook_search = RunbookSearch(store, DATA_PATH / "markdown")
+runbook_search.index()
+
 # API Key for authentication
 CREDENTIAL_PROVIDER_NAME = "sre-agent-api-key-credential-provider"
 
@@ -50,6 +70,27 @@ def _validate_api_key(x_api_key: str = Header(None, alias="X-API-Key")):
     return x_api_key
 
 
+def _log_response_details(label: str, items: list, title_key: str, response_data):
+    """Log per-item details and the full response, only when DEBUG is enabled"""
+    if not logging.getLogger().isEnabledFor(logging.DEBUG):
+        return
+
+    for i, item in enumerate(items):
+        logging.debug(
+            f"  📖 {label} {i + 1}: {item.get(title_key, 'No title')} (ID: {item.get('id', 'No ID')})"
+        )
+        steps = item.get("steps", [])
+        logging.debug(f"     Steps count: {len(steps)}")
+        for j, step in enumerate(steps[:3]):  # Show first 3 steps for brevity
+            logging.debug(f"     Step {j + 1}: {step}")
+        if len(steps) > 3:
+            logging.debug(f"     ... and {len(steps) - 3} more steps")
+
+    logging.debug(
+        f"📋 RUNBOOKS API: Full response data: {json.dumps(response_data, indent=2)}"
+    )
+
+
 @app.get("/runbooks/search")
 async def search_runbooks(
     incident_type: Optional[str] = Query(
@@ -65,64 +106,53 @@ async def search_runbooks(
         enum=["low", "medium", "high", "critical"],
         description="Incident severity level",
     ),
+    limit: int = Query(20, ge=1, le=100, description="Maximum runbooks to return"),
+    offset: int = Query(0, ge=0, description="Number of runbooks to skip"),
     api_key: str = Depends(_validate_api_key),
 ):
-    """Search runbooks by incident type/keyword"""
+    """Search runbooks by incident type/keyword, ranked by relevance"""
     try:
         logging.info(
-            f"🔍 RUNBOOKS API: search_runbooks called - incident_type={incident_type}, keyword={keyword}, severity={severity}"
+            f"🔍 RUNBOOKS API: search_runbooks called - incident_type={incident_type}, keyword={keyword}, severity={severity}, limit={limit}, offset={offset}"
         )
 
-        with open(DATA_PATH / "incident_playbooks.json", "r") as f:
-            data = json.load(f)
+        playbooks = store.collection("incident_playbooks.json", "playbooks")
+        original_count = len(playbooks)
 
-        runbooks = data.get("playbooks", [])
-        original_count = len(runbooks)
-
-        if incident_type:
-            runbooks = [r for r in runbooks if r.get("incident_type") == incident_type]
+        runbooks = playbooks.filter(incident_type=incident_type, severity=severity)
+        if incident_type or severity:
             logging.info(
-                f"📋 RUNBOOKS API: Filtered by incident_type '{incident_type}': {len(runbooks)} runbooks"
-            )
-
-        if severity:
-            runbooks = [r for r in runbooks if r.get("severity") == severity]
-            logging.info(
-                f"📋 RUNBOOKS API: Filtered by severity '{severity}': {len(runbooks)} runbooks"
+                f"📋 RUNBOOKS API: Filtered by incident_type '{incident_type}', severity '{severity}': {len(runbooks)} runbooks"
             )
 
         if keyword:
-            runbooks = [
-                r
-                for r in runbooks
-                if keyword.lower() in r.get("title", "").lower()
-                or keyword.lower() in r.get("description", "").lower()
-                or any(keyword.lower() in step.lower() for step in r.get("steps", []))
-            ]
-            logging.info(
-                f"📋 RUNBOOKS API: Filtered by keyword '{keyword}': {len(runbooks)} runbooks"
+            doc_ids = (
+                {r.get("id", "") for r in runbooks}
+                if incident_type or severity
+                else None
             )
-
-        response_data = {"runbooks": runbooks}
-
-        # Log detailed response
-        logging.info(
-            f"📤 RUNBOOKS API: Returning {len(runbooks)} runbooks out of {original_count} total"
-        )
-        for i, runbook in enumerate(runbooks):
+            total, ranked = runbook_search.index().search(
+                keyword, source="playbook", doc_ids=doc_ids, limit=limit, offset=offset
+            )
+            runbooks = [runbook for _, runbook in ranked]
             logging.info(
-                f"  📖 Runbook {i + 1}: {runbook.get('title', 'No title')} (ID: {runbook.get('id', 'No ID')})"
+                f"📋 RUNBOOKS API: Ranked by keyword '{keyword}': {total} matching runbooks"
             )
-            steps = runbook.get("steps", [])
-            logging.info(f"     Steps count: {len(steps)}")
-            for j, step in enumerate(steps[:3]):  # Show first 3 steps for brevity
-                logging.info(f"     Step {j + 1}: {step}")
-            if len(steps) > 3:
-                logging.info(f"     ... and {len(steps) - 3} more steps")
+        else:
+            total = len(runbooks)
+            runbooks = runbooks[offset : offset + limit]
+
+        response_data = {
+            "runbooks": runbooks,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+        }
 
         logging.info(
-            f"📋 RUNBOOKS API: Full response data: {json.dumps(response_data, indent=2)}"
+            f"📤 RUNBOOKS API: Returning {len(runbooks)} of {total} matching runbooks out of {original_count} total"
         )
+        _log_response_details("Runbook", runbooks, "title", response_data)
         return response_data
     except Exception as e:
         logging.error(f"❌ Error searching runbooks: {str(e)}")
@@ -140,10 +170,9 @@ async def get_incident_playbook(
             f"🔍 RUNBOOKS API: get_incident_playbook called for playbook_id='{playbook_id}'"
         )
 
-        with open(DATA_PATH / "incident_playbooks.json", "r") as f:
-            data = json.load(f)
-
-        playbooks = data.get("playbooks", [])
+        playbooks = store.collection("incident_playbooks.json", "playbooks").filter(
+            id=playbook_id
+        )
 
         for playbook in playbooks:
             if playbook.get("id") == playbook_id:
@@ -151,13 +180,13 @@ async def get_incident_playbook(
                     f"📖 RUNBOOKS API: Found playbook '{playbook.get('title', 'No title')}'"
                 )
                 steps = playbook.get("steps", [])
-                logging.info(f"📝 RUNBOOKS API: Playbook has {len(steps)} steps:")
-                for i, step in enumerate(steps):
-                    logging.info(f"   Step {i + 1}: {step}")
-
-                logging.info(
-                    f"📤 RUNBOOKS API: Returning complete playbook data: {json.dumps(playbook, indent=2)}"
-                )
+                logging.info(f"📝 RUNBOOKS API: Playbook has {len(steps)} steps")
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    for i, step in enumerate(steps):
+                        logging.debug(f"   Step {i + 1}: {step}")
+                    logging.debug(
+                        f"📤 RUNBOOKS API: Returning complete playbook data: {json.dumps(playbook, indent=2)}"
+                    )
                 return playbook
 
         logging.warning(f"❌ RUNBOOKS API: Playbook '{playbook_id}' not found")
@@ -183,49 +212,31 @@ async def get_troubleshooting_guide(
             f"🔍 RUNBOOKS API: get_troubleshooting_guide called - category={category}, issue_type={issue_type}"
         )
 
-        with open(DATA_PATH / "troubleshooting_guides.json", "r") as f:
-            data = json.load(f)
-
-        guides = data.get("guides", [])
-        original_count = len(guides)
+        all_guides = store.collection("troubleshooting_guides.json", "guides")
+        original_count = len(all_guides)
 
+        guides = all_guides.filter(category=category)
         if category:
-            guides = [g for g in guides if g.get("category") == category]
             logging.info(
                 f"📋 RUNBOOKS API: Filtered by category '{category}': {len(guides)} guides"
             )
 
         if issue_type:
-            guides = [
-                g
-                for g in guides
-                if issue_type.lower() in g.get("title", "").lower()
-                or issue_type.lower() in g.get("id", "").lower()
-            ]
+            doc_ids = {g.get("id", "") for g in guides} if category else None
+            _, ranked = runbook_search.index().search(
+                issue_type, source="guide", doc_ids=doc_ids, limit=len(all_guides)
+            )
+            guides = [guide for _, guide in ranked]
             logging.info(
-                f"📋 RUNBOOKS API: Filtered by issue_type '{issue_type}': {len(guides)} guides"
+                f"📋 RUNBOOKS API: Ranked by issue_type '{issue_type}': {len(guides)} guides"
             )
 
         response_data = {"guides": guides}
 
-        # Log detailed response
         logging.info(
             f"📤 RUNBOOKS API: Returning {len(guides)} guides out of {original_count} total"
         )
-        for i, guide in enumerate(guides):
-            logging.info(
-                f"  📖 Guide {i + 1}: {guide.get('title', 'No title')} (ID: {guide.get('id', 'No ID')})"
-            )
-            steps = guide.get("steps", [])
-            logging.info(f"     Steps count: {len(steps)}")
-            for j, step in enumerate(steps[:3]):  # Show first 3 steps for brevity
-                logging.info(f"     Step {j + 1}: {step}")
-            if len(steps) > 3:
-                logging.info(f"     ... and {len(steps) - 3} more steps")
-
-        logging.info(
-            f"📋 RUNBOOKS API: Full response data: {json.dumps(response_data, indent=2)}"
-        )
+        _log_response_details("Guide", guides, "title", response_data)
         return response_data
     except Exception as e:
         logging.error(f"❌ Error retrieving troubleshooting guides: {str(e)}")
@@ -244,13 +255,9 @@ async def get_escalation_procedures(
 ):
     """Retrieve escalation procedures"""
     try:
-        with open(DATA_PATH / "escalation_procedures.json", "r") as f:
-            data = json.load(f)
-
-        procedures = data.get("escalation_procedures", [])
-
-        if severity:
-            procedures = [p for p in procedures if p.get("severity") == severity]
+        procedures = store.collection(
+            "escalation_procedures.json", "escalation_procedures"
+        ).filter(severity=severity)
 
         if incident_type:
             procedures = [
@@ -281,24 +288,14 @@ async def get_common_resolutions(
             f"🔍 RUNBOOKS API: get_common_resolutions called - issue='{issue}', service={service}"
         )
 
-        with open(DATA_PATH / "common_resolutions.json", "r") as f:
-            data = json.load(f)
-
-        resolutions = data.get("resolutions", [])
+        resolutions = store.collection("common_resolutions.json", "resolutions")
         original_count = len(resolutions)
 
-        # Filter by issue
-        matching_resolutions = []
-        for resolution in resolutions:
-            if (
-                issue.lower() in resolution.get("issue", "").lower()
-                or issue.lower() in resolution.get("id", "").lower()
-                or any(
-                    issue.lower() in symptom.lower()
-                    for symptom in resolution.get("symptoms", [])
-                )
-            ):
-                matching_resolutions.append(resolution)
+        # Rank resolutions by how well issue, symptoms and fixes match
+        _, ranked = runbook_search.index().search(
+            issue, source="resolution", limit=original_count
+        )
+        matching_resolutions = [resolution for _, resolution in ranked]
 
         logging.info(
             f"📋 RUNBOOKS API: Found {len(matching_resolutions)} matching resolutions for issue '{issue}'"
@@ -313,23 +310,11 @@ async def get_common_resolutions(
 
         response_data = {"resolutions": matching_resolutions}
 
-        # Log detailed response
         logging.info(
             f"📤 RUNBOOKS API: Returning {len(matching_resolutions)} resolutions out of {original_count} total"
         )
-        for i, resolution in enumerate(matching_resolutions):
-            logging.info(
-                f"  📖 Resolution {i + 1}: {resolution.get('issue', 'No issue title')} (ID: {resolution.get('id', 'No ID')})"
-            )
-            steps = resolution.get("steps", [])
-            logging.info(f"     Steps count: {len(steps)}")
-            for j, step in enumerate(steps[:3]):  # Show first 3 steps for brevity
-                logging.info(f"     Step {j + 1}: {step}")
-            if len(steps) > 3:
-                logging.info(f"     ... and {len(steps) - 3} more steps")
-
-        logging.info(
-            f"📋 RUNBOOKS API: Full response data: {json.dumps(response_data, indent=2)}"
+        _log_response_details(
+            "Resolution", matching_resolutions, "issue", response_data
         )
         return response_data
     except Exception as e:
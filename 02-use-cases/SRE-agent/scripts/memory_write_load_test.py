@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Load test for the SRE agent memory write pipeline, run fully offline.
+
+Simulates concurrent agents storing conversation messages against the local
+in-process memory backend and compares inline create_event calls with the
+background write queue.
+
+Usage:
+    uv run python scripts/memory_write_load_test.py [OPTIONS]
+
+Examples:
+    uv run python scripts/memory_write_load_test.py                       # Defaults
+    uv run python scripts/memory_write_load_test.py --latency-ms 100      # Slower backend
+    uv run python scripts/memory_write_load_test.py --failure-rate 0.1    # Exercise retries
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, List
+
+# Add the project root to path so we can import sre_agent
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sre_agent.memory.local_backend import LocalMemoryBackend  # noqa: E402
+from sre_agent.memory.write_queue import MemoryWriteQueue  # noqa: E402
+
+
+def _run_producers(
+    write: Callable[[str, str, list], None],
+    producers: int,
+    messages_per_producer: int,
+) -> List[float]:
+    """Run producer threads and return per-write latencies in milliseconds."""
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def _producer(index: int) -> None:
+        actor_id = f"user-{index % 4}"
+        session_id = f"session-{index}"
+        for n in range(messages_per_producer):
+            message = (f"Agent {index} finding {n}: pod restarted", "ASSISTANT")
+            start = time.perf_counter()
+            write(actor_id, session_id, [message])
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                latencies.append(elapsed)
+
+    threads = [threading.Thread(target=_producer, args=(i,)) for i in range(producers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def _report(label: str, latencies: List[float], total_seconds: float, calls: int):
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1] if ordered else 0.0
+    print(f"\n{label}")
+    print(f"  writes:            {len(latencies)}")
+    print(f"  create_event calls: {calls}")
+    print(f"  producer p50:      {statistics.median(ordered):.2f} ms")
+    print(f"  producer p95:      {p95:.2f} ms")
+    print(f"  total time:        {total_seconds:.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline memory write load test")
+    parser.add_argument("--producers", type=int, default=8)
+    parser.add_argument("--messages", type=int, default=25)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    latency_seconds = args.latency_ms / 1000
+
+    # Inline writes: each producer waits for create_event
+    backend = LocalMemoryBackend(
+        latency_seconds=latency_seconds, failure_rate=args.failure_rate
+    )
+
+    def _inline_write(actor_id: str, session_id: str, messages: list) -> None:
+        try:
+            backend.create_event(
+                memory_id=backend.memory_id,
+                actor_id=actor_id,
+                session_id=session_id,
+                messages=messages,
+            )
+        except RuntimeError:
+            pass
+
+    start = time.perf_counter()
+    latencies = _run_producers(_inline_write, args.producers, args.messages)
+    _report(
+        "Inline create_event",
+        latencies,
+        time.perf_counter() - start,
+        backend.create_event_calls,
+    )
+
+    # Queued writes: producers only enqueue, the writer batches in the background
+    backend = LocalMemoryBackend(
+        latency_seconds=latency_seconds, failure_rate=args.failure_rate
+    )
+    writer = MemoryWriteQueue(
+        SimpleNamespace(client=backend, memory_id=backend.memory_id),
+        retry_backoff_seconds=0.05,
+    )
+
+    start = time.perf_counter()
+    latencies = _run_producers(writer.submit, args.producers, args.messages)
+    writer.flush()
+    _report(
+        "Background write queue",
+        latencies,
+        time.perf_counter() - start,
+        backend.create_event_calls,
+    )
+    print(f"  queue stats:       {writer.stats()}")
+    writer.close()
+
+
+if __name__ == "__main__":
+    main()
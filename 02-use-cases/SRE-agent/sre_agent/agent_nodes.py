@@ -14,7 +14,7 @@ from langgraph.prebuilt import create_react_agent
 from .agent_state import AgentState
 from .constants import AgentMetadata
 from .llm_utils import create_llm_with_error_handling
-from .memory import SREMemoryClient, create_conversation_memory_manager
+from .memory import create_conversation_memory_manager, get_memory_client
 from .prompt_loader import prompt_loader
 
 # Logging will be configured by the main entry point
@@ -179,7 +179,7 @@ class BaseAgentNode:
                 try:
                     # Get region from llm_kwargs if available
                     region = self.llm_kwargs.get("region_name", "us-east-1") if self.llm_provider == "bedrock" else "us-east-1"
-                    memory_client = SREMemoryClient(region=region)
+                    memory_client = get_memory_client(region=region)
                     conversation_manager = create_conversation_memory_manager(
                         memory_client
                     )
@@ -376,10 +376,10 @@ class BaseAgentNode:
                     # Check if memory hooks are available through the memory client
                     from .memory.hooks import MemoryHookProvider
 
-                    # Use the SREMemoryClient that's already imported at the top
+                    # Reuse the process-wide memory client for this region
                     # Get region from llm_kwargs if available
                     region = self.llm_kwargs.get("region_name", "us-east-1") if self.llm_provider == "bedrock" else "us-east-1"
-                    memory_client = SREMemoryClient(region=region)
+                    memory_client = get_memory_client(region=region)
                     memory_hooks = MemoryHookProvider(memory_client)
 
                     # Create response object for hooks
@@ -16,6 +16,7 @@ from .constants import SREConstants
 
 # Import logging config
 from .logging_config import configure_logging
+from .memory import flush_memory_clients
 from .multi_agent_langgraph import create_multi_agent_system
 
 # Configure logging based on DEBUG environment variable
@@ -111,6 +112,12 @@ async def startup_event():
     await initialize_agent()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush queued memory writes before the process exits."""
+    await asyncio.to_thread(flush_memory_clients, 30.0)
+
+
 @app.post("/invocations", response_model=InvocationResponse)
 async def invoke_agent(request: InvocationRequest):
     """Main agent invocation endpoint."""
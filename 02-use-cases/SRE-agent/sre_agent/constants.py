@@ -201,6 +201,21 @@ class MemoryConfig(BaseModel):
         description="Maximum number of past investigation memories to retrieve",
     )
 
+    # Retrieval cache
+    retrieval_cache_ttl_seconds: int = Field(
+        default=60,
+        ge=0,
+        le=3600,
+        description="Seconds to reuse memory retrieval results for the same user and query",
+    )
+
+    retrieval_cache_max_entries: int = Field(
+        default=1000,
+        ge=1,
+        le=100000,
+        description="Maximum cached memory retrieval results before the least recently used are evicted",
+    )
+
     # Content length limits for memory storage
     max_content_length: int = Field(
         default=9000,
@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Literal
+from typing import Any, Callable, Dict, List, Literal, Optional
 
 from langchain_core.messages import HumanMessage
 from langchain_core.tools import BaseTool
 from langgraph.graph import END, StateGraph
 
 from .agent_nodes import (
+    BaseAgentNode,
+    _load_agent_config,
     create_kubernetes_agent,
     create_logs_agent,
     create_metrics_agent,
@@ -66,6 +69,137 @@ def _route_supervisor(state: AgentState) -> str:
     return agent_map.get(next_agent, "aggregate")
 
 
+def _pending_parallel_agents(
+    state: AgentState,
+    agent_nodes: Dict[str, BaseAgentNode],
+    independent_agents: List[str],
+) -> List[str]:
+    """Return independent agents left in the plan that have not run yet."""
+    metadata = state.get("metadata", {})
+    plan = metadata.get("investigation_plan") or {}
+    remaining = plan.get("agents_sequence", [])[metadata.get("plan_step", 0) :]
+    agents_invoked = state.get("agents_invoked", [])
+
+    pending = []
+    for agent in remaining:
+        node_name = _route_supervisor({"next": agent})
+        if (
+            node_name in independent_agents
+            and node_name not in pending
+            and agent_nodes[node_name].name not in agents_invoked
+        ):
+            pending.append(node_name)
+    return pending
+
+
+def _create_parallel_router(
+    agent_nodes: Dict[str, BaseAgentNode], independent_agents: List[str]
+) -> Callable[[AgentState], str]:
+    """Create a supervisor router that fans out independent plan steps."""
+
+    def _route(state: AgentState) -> str:
+        destination = _route_supervisor(state)
+        if destination in independent_agents:
+            pending = _pending_parallel_agents(state, agent_nodes, independent_agents)
+            if len(pending) > 1:
+                return "parallel_agents"
+        return destination
+
+    return _route
+
+
+def _create_parallel_executor(
+    agent_nodes: Dict[str, BaseAgentNode],
+    independent_agents: List[str],
+    max_concurrency: int,
+    agent_timeout: float,
+):
+    """Create a graph node that runs independent plan steps concurrently.
+
+    The node runs every independent agent left in the investigation plan
+    with at most max_concurrency in flight, merges their results into
+    agent_results, and moves the completed agents to the front of the plan
+    so the supervisor continues with the dependent steps sequentially.
+    """
+
+    async def _run_parallel_agents(state: AgentState) -> Dict[str, Any]:
+        batch = _pending_parallel_agents(state, agent_nodes, independent_agents)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        logger.info(
+            f"Running {len(batch)} agents in parallel "
+            f"(max_concurrency={max_concurrency}, timeout={agent_timeout}s): {batch}"
+        )
+
+        async def _run_agent(node_name: str) -> Dict[str, Any]:
+            agent = agent_nodes[node_name]
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(agent(state), timeout=agent_timeout)
+                except asyncio.TimeoutError:
+                    logger.error(f"{agent.name} timed out after {agent_timeout}s")
+                    return {
+                        "agent_results": {
+                            agent.name: f"Error: timed out after {agent_timeout}s"
+                        },
+                        "agents_invoked": [agent.name],
+                    }
+
+        outputs = await asyncio.gather(*(_run_agent(name) for name in batch))
+
+        existing_messages = state.get("messages", [])
+        agent_results = dict(state.get("agent_results", {}))
+        agents_invoked = list(state.get("agents_invoked", []))
+        metadata = dict(state.get("metadata", {}))
+        new_messages = []
+
+        for output in outputs:
+            agent_results.update(output.get("agent_results", {}))
+            for agent_name in output.get("agents_invoked", []):
+                if agent_name not in agents_invoked:
+                    agents_invoked.append(agent_name)
+            # Agent nodes return the input messages plus their own
+            new_messages.extend(output.get("messages", [])[len(existing_messages) :])
+            for key, value in output.get("metadata", {}).items():
+                if key.endswith("_trace"):
+                    metadata[key] = value
+
+        # Completed agents move up to the current step so the plan resumes
+        # at the first dependent step after the batch; step descriptions are
+        # reordered with them so "Executing plan step N" stays accurate
+        plan = dict(metadata.get("investigation_plan") or {})
+        sequence = plan.get("agents_sequence", [])
+        steps = plan.get("steps", [])
+        current_step = metadata.get("plan_step", 0)
+        moved, kept, claimed = [], [], set()
+        for index in range(current_step, len(sequence)):
+            node_name = _route_supervisor({"next": sequence[index]})
+            if node_name not in batch:
+                kept.append(index)
+            elif node_name not in claimed:
+                claimed.add(node_name)
+                moved.append(index)
+        order = list(range(current_step)) + moved + kept
+        plan["agents_sequence"] = [sequence[index] for index in order]
+        if steps:
+            plan["steps"] = [
+                steps[index] for index in order if index < len(steps)
+            ] + steps[len(sequence) :]
+        metadata["investigation_plan"] = plan
+        metadata["plan_step"] = current_step + len(batch) - 1
+        metadata["routing_reasoning"] = (
+            f"Executed {len(batch)} independent plan steps in parallel"
+        )
+
+        return {
+            "agent_results": agent_results,
+            "agents_invoked": agents_invoked,
+            "messages": new_messages,
+            "metadata": metadata,
+        }
+
+    return _run_parallel_agents
+
+
 async def _prepare_initial_state(state: AgentState) -> Dict[str, Any]:
     """Prepare the initial state with the user's query."""
     messages = state.get("messages", [])
@@ -92,6 +226,9 @@ def build_multi_agent_graph(
     force_delete_memory: bool = False,
     export_graph: bool = False,
     graph_output_path: str = "./docs/sre_agent_architecture.md",
+    parallel: Optional[bool] = None,
+    max_concurrency: Optional[int] = None,
+    agent_timeout: Optional[float] = None,
     **llm_kwargs,
 ) -> StateGraph:
     """Build the multi-agent collaboration graph.
@@ -102,6 +239,9 @@ def build_multi_agent_graph(
         force_delete_memory: Whether to force delete existing memory
         export_graph: Whether to export the graph as a Mermaid diagram
         graph_output_path: Path to save the exported Mermaid diagram (default: ./docs/sre_agent_architecture.md)
+        parallel: Run independent plan steps concurrently (default: parallel_execution.enabled in agent_config.yaml)
+        max_concurrency: Maximum agents running at once in parallel mode
+        agent_timeout: Per-agent timeout in seconds in parallel mode
         **llm_kwargs: Additional arguments for LLM
 
     Returns:
@@ -143,6 +283,18 @@ def build_multi_agent_graph(
         **llm_kwargs,
     )
 
+    # Resolve parallel execution settings, explicit arguments win over config
+    parallel_config = _load_agent_config().get("parallel_execution") or {}
+    if parallel is None:
+        parallel = parallel_config.get("enabled", False)
+    if max_concurrency is None:
+        max_concurrency = parallel_config.get("max_concurrency", 3)
+    if agent_timeout is None:
+        agent_timeout = parallel_config.get("agent_timeout_seconds", 120)
+    independent_agents = parallel_config.get(
+        "independent_agents", ["kubernetes_agent", "logs_agent", "metrics_agent"]
+    )
+
     # Add nodes to the graph
     workflow.add_node("prepare", _prepare_initial_state)
     workflow.add_node("supervisor", supervisor.route)
@@ -158,18 +310,38 @@ def build_multi_agent_graph(
     # Add edges from prepare to supervisor
     workflow.add_edge("prepare", "supervisor")
 
+    supervisor_routes = {
+        "kubernetes_agent": "kubernetes_agent",
+        "logs_agent": "logs_agent",
+        "metrics_agent": "metrics_agent",
+        "runbooks_agent": "runbooks_agent",
+        "aggregate": "aggregate",
+    }
+    supervisor_router = _route_supervisor
+
+    if parallel:
+        logger.info(
+            f"Parallel execution enabled for {independent_agents} "
+            f"(max_concurrency={max_concurrency}, agent_timeout={agent_timeout}s)"
+        )
+        agent_nodes = {
+            "kubernetes_agent": kubernetes_agent,
+            "logs_agent": logs_agent,
+            "metrics_agent": metrics_agent,
+            "runbooks_agent": runbooks_agent,
+        }
+        workflow.add_node(
+            "parallel_agents",
+            _create_parallel_executor(
+                agent_nodes, independent_agents, max_concurrency, agent_timeout
+            ),
+        )
+        workflow.add_edge("parallel_agents", "supervisor")
+        supervisor_routes["parallel_agents"] = "parallel_agents"
+        supervisor_router = _create_parallel_router(agent_nodes, independent_agents)
+
     # Add conditional edges from supervisor
-    workflow.add_conditional_edges(
-        "supervisor",
-        _route_supervisor,
-        {
-            "kubernetes_agent": "kubernetes_agent",
-            "logs_agent": "logs_agent",
-            "metrics_agent": "metrics_agent",
-            "runbooks_agent": "runbooks_agent",
-            "aggregate": "aggregate",
-        },
-    )
+    workflow.add_conditional_edges("supervisor", supervisor_router, supervisor_routes)
 
     # Add edges from agents back to supervisor
     workflow.add_edge("kubernetes_agent", "supervisor")
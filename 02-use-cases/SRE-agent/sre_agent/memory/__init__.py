@@ -1,12 +1,18 @@
 """Memory module for SRE Agent long-term memory capabilities."""
 
-from .client import SREMemoryClient
+from .client import (
+    SREMemoryClient,
+    clear_memory_clients,
+    flush_memory_clients,
+    get_memory_client,
+)
 from .config import MemoryConfig
 from .conversation_manager import (
     ConversationMemoryManager,
     ConversationMessage,
     create_conversation_memory_manager,
 )
+from .local_backend import LocalMemoryBackend
 from .strategies import (
     InfrastructureKnowledge,
     InvestigationSummary,
@@ -18,9 +24,15 @@ from .tools import (
     SaveInvestigationTool,
     SavePreferenceTool,
 )
+from .write_queue import MemoryWriteQueue
 
 __all__ = [
     "SREMemoryClient",
+    "get_memory_client",
+    "clear_memory_clients",
+    "flush_memory_clients",
+    "MemoryWriteQueue",
+    "LocalMemoryBackend",
     "MemoryConfig",
     "UserPreference",
     "InfrastructureKnowledge",
@@ -1,10 +1,14 @@
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from bedrock_agentcore.memory import MemoryClient
 
 from .config import _load_memory_config
+from .local_backend import LocalMemoryBackend
+from .write_queue import MemoryWriteQueue
 
 # Configure logging with basicConfig
 logging.basicConfig(
@@ -25,15 +29,47 @@ class SREMemoryClient:
         region: str = "us-east-1",
         force_delete: bool = False,
     ):
-        self.client = MemoryClient(region_name=region)
         self.memory_name = memory_name
+        self.region = region
         self.config = _load_memory_config()
         self.memory_ids = {}
         self.force_delete = force_delete
-        self._initialize_memories()
+        self._writer: Optional[MemoryWriteQueue] = None
+        self._writer_lock = threading.Lock()
+        if self.config.backend == "local":
+            # Offline stand-in: no control plane, memory is ready immediately
+            self.client = LocalMemoryBackend(memory_id=f"{memory_name}-local")
+            self.memory_id = self.client.memory_id
+        else:
+            self.client = MemoryClient(region_name=region)
+            self.memory_id = self._initialize_memories()
+        self._initialized_at = time.monotonic()
+
+    def is_status_stale(self) -> bool:
+        """Check whether the cached memory id and strategy status have expired."""
+        if self.config.backend == "local":
+            return False
+        age = time.monotonic() - self._initialized_at
+        return age >= self.config.status_cache_ttl_seconds
+
+    def refresh_status(self) -> None:
+        """Re-check memory and strategy status against the control plane."""
+        logger.info(f"Refreshing cached memory status for {self.memory_name}")
+        previous_memory_id = self.memory_id
+        # Never delete an existing memory on a background refresh
+        self.force_delete = False
+        # Resolve into a local so concurrent readers never see memory_id unset
+        memory_id = self._initialize_memories()
+        if memory_id is None and previous_memory_id:
+            logger.warning(
+                f"Memory status refresh failed, keeping cached memory id {previous_memory_id}"
+            )
+            memory_id = previous_memory_id
+        self.memory_id = memory_id
+        self._initialized_at = time.monotonic()
 
-    def _initialize_memories(self):
-        """Initialize different memory strategies."""
+    def _initialize_memories(self) -> Optional[str]:
+        """Initialize different memory strategies and return the memory id."""
         try:
             logger.info(f"Initializing memory system with name: {self.memory_name}")
 
@@ -42,16 +78,16 @@ class SREMemoryClient:
 
             if existing_memory and not self.force_delete:
                 # Use existing memory
-                self.memory_id = existing_memory["id"]
+                memory_id = existing_memory["id"]
                 logger.info(
-                    f"Using existing memory: {self.memory_id} (name: {existing_memory['name']})"
+                    f"Using existing memory: {memory_id} (name: {existing_memory['name']})"
                 )
                 logger.info(
                     f"Memory status: {existing_memory.get('status', 'unknown')}"
                 )
 
                 # Write memory ID to file for helper scripts
-                self._write_memory_id_to_file()
+                self._write_memory_id_to_file(memory_id)
 
                 # Check if strategies are already configured
                 existing_strategies = existing_memory.get("strategies", [])
@@ -69,7 +105,7 @@ class SREMemoryClient:
                         logger.warning(
                             f"{creating_count} strategies are still in CREATING state - memory system may not be fully operational"
                         )
-                    return  # Memory is already configured
+                    return memory_id  # Memory is already configured
                 else:
                     logger.info(
                         f"Found {strategy_count} strategies, expected 3 - will add missing ones"
@@ -104,11 +140,11 @@ class SREMemoryClient:
                     description="SRE Agent long-term memory system",
                     event_expiry_days=max_retention,
                 )
-                self.memory_id = base_memory["id"]
-                logger.info(f"Created new memory: {self.memory_id}")
+                memory_id = base_memory["id"]
+                logger.info(f"Created new memory: {memory_id}")
 
                 # Write memory ID to file for helper scripts
-                self._write_memory_id_to_file()
+                self._write_memory_id_to_file(memory_id)
 
             # Check what strategies need to be added (in case of partial configuration)
             existing_names = set()
@@ -121,7 +157,7 @@ class SREMemoryClient:
             if "user_preferences" not in existing_names:
                 logger.info("Adding user preferences strategy...")
                 self.client.add_user_preference_strategy_and_wait(
-                    memory_id=self.memory_id,
+                    memory_id=memory_id,
                     name="user_preferences",
                     description="User preferences for escalation, notification, and workflows",
                     namespaces=["/sre/users/{actorId}/preferences"],
@@ -134,7 +170,7 @@ class SREMemoryClient:
             if "infrastructure_knowledge" not in existing_names:
                 logger.info("Adding infrastructure knowledge strategy...")
                 self.client.add_semantic_strategy_and_wait(
-                    memory_id=self.memory_id,
+                    memory_id=memory_id,
                     name="infrastructure_knowledge",
                     description="Infrastructure knowledge including dependencies and patterns",
                     namespaces=["/sre/infrastructure/{actorId}/{sessionId}"],
@@ -149,7 +185,7 @@ class SREMemoryClient:
             if "investigation_summaries" not in existing_names:
                 logger.info("Adding investigation summaries strategy...")
                 self.client.add_summary_strategy_and_wait(
-                    memory_id=self.memory_id,
+                    memory_id=memory_id,
                     name="investigation_summaries",
                     description="Investigation summaries with timeline and findings",
                     namespaces=["/sre/investigations/{actorId}/{sessionId}"],
@@ -158,12 +194,13 @@ class SREMemoryClient:
             else:
                 logger.info("Investigation summaries strategy already exists, skipping")
             logger.info(f"Memory system initialization complete for {self.memory_name}")
+            return memory_id
 
         except Exception as e:
             logger.error(f"Failed to initialize memories: {e}", exc_info=True)
             # For development, we'll continue without failing completely
             # In production, you might want to raise the exception
-            self.memory_id = None
+            return None
             logger.warning("Memory system will operate in offline mode")
 
     def save_event(
@@ -214,21 +251,17 @@ class SREMemoryClient:
             # but the namespace doesn't use it
             actual_session_id = session_id if session_id else "preferences-default"
 
-            result = self.client.create_event(
-                memory_id=self.memory_id,
+            success = self.write_event(
                 actor_id=actor_id,
                 session_id=actual_session_id,
                 messages=messages,
             )
 
-            event_id = result.get("eventId", "unknown")
-            logger.info(f"create_event result: {result}")
             logger.info("=== SAVE_EVENT TRACE END ===")
-            logger.info(
-                f"Saved {memory_type} event for {actor_id} (event_id: {event_id})"
-            )
-            logger.info(f"Event data size: {len(str(event_data))} characters")
-            return True
+            if success:
+                logger.info(f"Saved {memory_type} event for {actor_id}")
+                logger.info(f"Event data size: {len(str(event_data))} characters")
+            return success
 
         except Exception as e:
             logger.error(
@@ -236,6 +269,59 @@ class SREMemoryClient:
             )
             return False
 
+    def write_event(
+        self, actor_id: str, session_id: str, messages: List[Tuple[str, str]]
+    ) -> bool:
+        """Write messages as a memory event for an actor and session.
+
+        With async_writes enabled the messages are handed to the background
+        write queue and this returns as soon as they are queued; otherwise
+        create_event is called inline. Returns False if the write was dropped.
+        """
+        if not self.memory_id:
+            logger.warning("Memory system not initialized, skipping write")
+            return False
+
+        if self.config.async_writes:
+            return self._get_writer().submit(actor_id, session_id, messages)
+
+        result = self.client.create_event(
+            memory_id=self.memory_id,
+            actor_id=actor_id,
+            session_id=session_id,
+            messages=messages,
+        )
+        logger.info(
+            f"Wrote {len(messages)} memory messages for {actor_id} (event_id: {result.get('eventId', 'unknown')})"
+        )
+        return True
+
+    def flush_writes(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued memory writes to finish; returns False on timeout."""
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout=timeout)
+
+    def get_write_stats(self) -> Dict[str, int]:
+        """Return counters from the background write queue."""
+        if self._writer is None:
+            return {}
+        return self._writer.stats()
+
+    def _get_writer(self) -> MemoryWriteQueue:
+        if self._writer is None:
+            with self._writer_lock:
+                if self._writer is None:
+                    self._writer = MemoryWriteQueue(
+                        self,
+                        max_queue_size=self.config.write_queue_size,
+                        max_batch_messages=self.config.write_batch_messages,
+                        flush_interval_seconds=self.config.write_flush_interval_seconds,
+                        max_retries=self.config.write_max_retries,
+                        retry_backoff_seconds=self.config.write_retry_backoff_seconds,
+                    )
+        return self._writer
+
     def retrieve_memories(
         self,
         memory_type: str,
@@ -365,15 +451,71 @@ class SREMemoryClient:
             logger.warning(f"Failed to list memories: {e}")
             return None
 
-    def _write_memory_id_to_file(self) -> None:
+    def _write_memory_id_to_file(self, memory_id: str) -> None:
         """Write memory ID to .memory_id file for helper scripts."""
         try:
             # Write to project root only (where manage_memories.py expects it)
             project_root = Path(__file__).parent.parent.parent
             memory_id_file = project_root / ".memory_id"
 
-            memory_id_file.write_text(self.memory_id)
-            logger.info(f"Wrote memory ID {self.memory_id} to {memory_id_file}")
+            memory_id_file.write_text(memory_id)
+            logger.info(f"Wrote memory ID {memory_id} to {memory_id_file}")
 
         except Exception as e:
             logger.warning(f"Failed to write memory ID to file: {e}")
+
+
+# Process-wide registry of memory clients keyed by (memory_name, region)
+_client_registry: Dict[Tuple[str, str], SREMemoryClient] = {}
+_client_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_registry_lock = threading.Lock()
+
+
+def get_memory_client(
+    memory_name: str = "sre_agent_memory",
+    region: str = "us-east-1",
+    force_delete: bool = False,
+) -> SREMemoryClient:
+    """Return the shared SREMemoryClient for a memory name and region.
+
+    The client is created lazily on first use and reused by every agent in
+    the process, so memory lookup and strategy checks run once instead of on
+    every agent turn. The cached memory id and strategy status are
+    re-validated once status_cache_ttl_seconds have elapsed.
+
+    Args:
+        memory_name: Base name of the memory resource
+        region: AWS region for memory storage
+        force_delete: Recreate the memory; always builds a fresh client
+    """
+    key = (memory_name, region)
+    with _registry_lock:
+        client_lock = _client_locks.setdefault(key, threading.Lock())
+
+    # Per-key lock so a slow initialization does not block other regions
+    with client_lock:
+        client = _client_registry.get(key)
+        if client is None or force_delete:
+            client = SREMemoryClient(
+                memory_name=memory_name, region=region, force_delete=force_delete
+            )
+            _client_registry[key] = client
+        elif client.is_status_stale():
+            client.refresh_status()
+        return client
+
+
+def flush_memory_clients(timeout: Optional[float] = None) -> None:
+    """Flush queued memory writes of every shared client (call on shutdown)."""
+    with _registry_lock:
+        clients = list(_client_registry.values())
+    for client in clients:
+        if not client.flush_writes(timeout=timeout):
+            logger.warning(f"Timed out flushing memory writes for {client.memory_name}")
+
+
+def clear_memory_clients() -> None:
+    """Drop all cached memory clients (used by tests and after config changes)."""
+    with _registry_lock:
+        _client_registry.clear()
+        _client_locks.clear()
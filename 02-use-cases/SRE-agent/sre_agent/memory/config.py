@@ -1,4 +1,5 @@
 import logging
+import os
 
 from pydantic import BaseModel, Field
 
@@ -22,6 +23,10 @@ class MemoryConfig(BaseModel):
     region: str = Field(
         default="us-east-1", description="AWS region for memory storage"
     )
+    backend: str = Field(
+        default_factory=lambda: os.getenv("SRE_MEMORY_BACKEND", "agentcore"),
+        description="Memory backend: 'agentcore', or 'local' for an in-process stand-in used offline",
+    )
 
     # Retention settings
     preferences_retention_days: int = Field(
@@ -34,6 +39,33 @@ class MemoryConfig(BaseModel):
         default=60, description="Days to retain investigation summaries"
     )
 
+    # Client caching
+    status_cache_ttl_seconds: int = Field(
+        default=300,
+        description="Seconds before a shared memory client re-checks memory and strategy status",
+    )
+
+    # Background write pipeline
+    async_writes: bool = Field(
+        default=True,
+        description="Write memory events through a background batching queue",
+    )
+    write_queue_size: int = Field(
+        default=1000, description="Maximum number of queued memory writes"
+    )
+    write_batch_messages: int = Field(
+        default=50, description="Maximum number of messages per create_event call"
+    )
+    write_flush_interval_seconds: float = Field(
+        default=0.5, description="Seconds to gather queued writes into one batch"
+    )
+    write_max_retries: int = Field(
+        default=3, description="Retries for a failed memory write before dropping it"
+    )
+    write_retry_backoff_seconds: float = Field(
+        default=0.5, description="Initial retry delay, doubled on each attempt"
+    )
+
     # Feature flags
     auto_capture_preferences: bool = Field(
         default=True, description="Automatically capture user preferences"
@@ -81,19 +81,16 @@ class ConversationMemoryManager:
             # Format message as tuple for AgentCore memory
             message_tuple = (content, role)
 
-            # Use AgentCore's create_event with user_id as actor_id
-            result = self.memory_client.client.create_event(
-                memory_id=self.memory_client.memory_id,
+            # Write through the memory client (queued in the background by default)
+            success = self.memory_client.write_event(
                 actor_id=user_id,  # Use user_id as actor_id as specified
                 session_id=session_id,  # Use provided session_id
                 messages=[message_tuple],  # AgentCore expects list of tuples
             )
 
-            event_id = result.get("eventId", "unknown")
-            logger.info(
-                f"Successfully stored conversation message (event_id: {event_id})"
-            )
-            return True
+            if success:
+                logger.info("Successfully stored conversation message")
+            return success
 
         except Exception as e:
             logger.error(f"Failed to store conversation message: {e}", exc_info=True)
@@ -153,19 +150,18 @@ class ConversationMemoryManager:
                 else:
                     truncated_messages.append((content, role))
 
-            # Use AgentCore's create_event with batch of messages
-            result = self.memory_client.client.create_event(
-                memory_id=self.memory_client.memory_id,
+            # Write the batch through the memory client (queued in the background by default)
+            success = self.memory_client.write_event(
                 actor_id=user_id,  # Use user_id as actor_id as specified
                 session_id=session_id,  # Use provided session_id
                 messages=truncated_messages,  # AgentCore expects list of tuples
             )
 
-            event_id = result.get("eventId", "unknown")
-            logger.info(
-                f"Successfully stored conversation batch of {len(messages)} messages (event_id: {event_id})"
-            )
-            return True
+            if success:
+                logger.info(
+                    f"Successfully stored conversation batch of {len(messages)} messages"
+                )
+            return success
 
         except Exception as e:
             logger.error(f"Failed to store conversation batch: {e}", exc_info=True)
@@ -1,11 +1,14 @@
+import asyncio
 import json
 import logging
 import re
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from ..constants import SREConstants
 from .client import SREMemoryClient
+from .retrieval_cache import get_shared_retrieval_cache
 from .strategies import (
     InfrastructureKnowledge,
     InvestigationSummary,
@@ -30,8 +33,47 @@ class MemoryHookProvider:
 
     def __init__(self, memory_client: SREMemoryClient):
         self.memory_client = memory_client
+        # Shared per memory so saves made through short-lived providers
+        # invalidate reads cached by the long-lived supervisor provider
+        self.retrieval_cache = get_shared_retrieval_cache(
+            memory_client.memory_id,
+            ttl_seconds=SREConstants.memory.retrieval_cache_ttl_seconds,
+            max_entries=SREConstants.memory.retrieval_cache_max_entries,
+        )
+
+    async def _retrieve_memories(
+        self,
+        memory_type: str,
+        actor_id: str,
+        query: str,
+        max_results: int,
+        session_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Retrieve memories off the event loop, serving repeats from the cache."""
+        key = (memory_type, actor_id, query, max_results, session_id)
+        cached = self.retrieval_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Memory retrieval cache hit for {memory_type}/{actor_id}")
+            return cached
+
+        start = time.perf_counter()
+        results = await asyncio.to_thread(
+            self.memory_client.retrieve_memories,
+            memory_type=memory_type,
+            actor_id=actor_id,
+            query=query,
+            max_results=max_results,
+            session_id=session_id,
+        )
+        self.retrieval_cache.record_latency(memory_type, time.perf_counter() - start)
+        self.retrieval_cache.put(key, results)
+        return results
 
-    def on_investigation_start(
+    def get_retrieval_metrics(self) -> Dict[str, Any]:
+        """Return memory retrieval cache hit rate and latency metrics."""
+        return self.retrieval_cache.stats()
+
+    async def on_investigation_start(
         self,
         query: str,
         user_id: str,
@@ -41,25 +83,40 @@ class MemoryHookProvider:
     ) -> Dict[str, Any]:
         """Hook called when investigation starts."""
         try:
-            # Retrieve relevant memories to provide context
-            # Use comprehensive query to get all user preference types
-            preferences = self.memory_client.retrieve_memories(
-                memory_type="preferences",
-                actor_id=user_id,
-                query=SREConstants.memory.user_preferences_query,
-                max_results=SREConstants.memory.max_preferences_results,
-            )
-
-            # Get infrastructure knowledge for specific user only
+            # Retrieve relevant memories to provide context. The three lookups are
+            # independent, so issue them concurrently.
+            # Preferences use a comprehensive query to get all user preference types;
+            # infrastructure knowledge and investigations are searched cross-session
+            # for planning purposes, and only for the current user.
             logger.info(
-                f"Retrieving infrastructure knowledge for user '{user_id}' for query: '{query}'"
+                f"Retrieving preferences, infrastructure knowledge and investigation summaries for user '{user_id}' for query: '{query}'"
+            )
+            start = time.perf_counter()
+            preferences, all_knowledge, investigations = await asyncio.gather(
+                self._retrieve_memories(
+                    memory_type="preferences",
+                    actor_id=user_id,
+                    query=SREConstants.memory.user_preferences_query,
+                    max_results=SREConstants.memory.max_preferences_results,
+                ),
+                self._retrieve_memories(
+                    memory_type="infrastructure",
+                    actor_id=user_id,
+                    query=query,
+                    max_results=SREConstants.memory.max_infrastructure_results,
+                ),
+                self._retrieve_memories(
+                    memory_type="investigations",
+                    actor_id=user_id,
+                    query=query,
+                    max_results=SREConstants.memory.max_investigation_results,
+                ),
             )
-            all_knowledge = self.memory_client.retrieve_memories(
-                memory_type="infrastructure",
-                actor_id=user_id,  # Only retrieve memories for the current user
-                query=query,
-                max_results=SREConstants.memory.max_infrastructure_results,
-                session_id=None,  # Cross-session search for planning purposes
+            metrics = self.get_retrieval_metrics()
+            logger.info(
+                f"Memory retrieval took {(time.perf_counter() - start) * 1000:.1f}ms "
+                f"(cache hit rate {metrics['hit_rate']:.0%}, "
+                f"{metrics['hits']} hits / {metrics['misses']} misses)"
             )
 
             # Organize knowledge by agent for later distribution
@@ -78,18 +135,6 @@ class MemoryHookProvider:
             else:
                 logger.info(f"No infrastructure knowledge found for user '{user_id}'")
 
-            # Get past investigation summaries for similar issues (cross-session search for planning)
-            logger.info(
-                f"Retrieving investigation summaries for user '{user_id}' for query: '{query}'"
-            )
-            investigations = self.memory_client.retrieve_memories(
-                memory_type="investigations",
-                actor_id=user_id,  # Use user_id to retrieve only user-specific investigations
-                query=query,
-                max_results=SREConstants.memory.max_investigation_results,
-                session_id=None,  # Cross-session search for planning purposes
-            )
-
             if investigations:
                 logger.info(
                     f"Retrieved {len(investigations)} past investigation summaries for user '{user_id}'"
@@ -238,6 +283,7 @@ class MemoryHookProvider:
             )
 
             if success:
+                self.retrieval_cache.invalidate(actor_id, "investigations")
                 logger.info(f"Saved investigation summary for incident {incident_id}")
             else:
                 logger.warning(
@@ -281,6 +327,7 @@ class MemoryHookProvider:
 
                 if success:
                     escalation_found += 1
+                    self.retrieval_cache.invalidate(user_id, "preferences")
                     logger.info(f"Captured escalation preference: {contact}")
                 else:
                     logger.warning(f"Failed to save escalation preference: {contact}")
@@ -316,6 +363,7 @@ class MemoryHookProvider:
 
                 if success:
                     channels_found += 1
+                    self.retrieval_cache.invalidate(user_id, "preferences")
                     logger.info(f"Captured notification preference: {channel}")
                 else:
                     logger.warning(f"Failed to save notification preference: {channel}")
@@ -408,6 +456,7 @@ class MemoryHookProvider:
 
                         if success:
                             knowledge_extracted += 1
+                            self.retrieval_cache.invalidate(user_id, "infrastructure")
                             logger.info(
                                 f"Captured {knowledge_type} knowledge for {service_name}: {knowledge_data}"
                             )
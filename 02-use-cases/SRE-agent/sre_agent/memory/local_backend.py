@@ -0,0 +1,133 @@
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+# Configure logging with basicConfig
+logging.basicConfig(
+    level=logging.INFO,  # Set the log level to INFO
+    # Define log message format
+    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
+)
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class LocalMemoryBackend:
+    """In-process stand-in for the AgentCore memory data plane.
+
+    Implements the subset of MemoryClient used by SREMemoryClient
+    (create_event, retrieve_memories, list_events) so the agent and the
+    memory write pipeline can be exercised and load-tested offline. Events
+    are kept in memory and retrieval ranks them by keyword overlap; there is
+    no strategy-based extraction, so every event of an actor is searchable
+    from any of that actor's namespaces.
+    """
+
+    def __init__(
+        self,
+        memory_id: str = "local-sre-memory",
+        latency_seconds: float = 0.0,
+        failure_rate: float = 0.0,
+    ):
+        """
+        Args:
+            memory_id: Memory id reported to callers
+            latency_seconds: Simulated service latency added to every call
+            failure_rate: Fraction of create_event calls that raise an error
+        """
+        self.memory_id = memory_id
+        self.latency_seconds = latency_seconds
+        self.failure_rate = failure_rate
+        self._events: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.create_event_calls = 0
+        logger.info(f"Using local in-process memory backend: {memory_id}")
+
+    def create_event(
+        self,
+        memory_id: str,
+        actor_id: str,
+        session_id: str,
+        messages: List[Tuple[str, str]],
+        event_timestamp: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Store messages as one event for an actor and session."""
+        self._simulate_latency()
+        with self._lock:
+            self.create_event_calls += 1
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise RuntimeError("Simulated memory service failure")
+
+        event = {
+            "eventId": f"local-{uuid.uuid4().hex[:12]}",
+            "memoryId": memory_id,
+            "actorId": actor_id,
+            "sessionId": session_id,
+            "eventTimestamp": event_timestamp or datetime.now(timezone.utc),
+            "payload": [
+                {"conversational": {"content": {"text": content}, "role": role}}
+                for content, role in messages
+            ],
+        }
+        with self._lock:
+            self._events.setdefault((actor_id, session_id), []).append(event)
+        return event
+
+    def list_events(
+        self, memory_id: str, actor_id: str, session_id: str, max_results: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Return the events stored for an actor and session, oldest first."""
+        with self._lock:
+            return list(self._events.get((actor_id, session_id), []))[:max_results]
+
+    def retrieve_memories(
+        self, memory_id: str, namespace: str, query: str, top_k: int = 3
+    ) -> List[Dict[str, Any]]:
+        """Return the messages that best match a query within a namespace.
+
+        Namespaces follow /sre/<type>/<actorId>[/<sessionId>]; the actor and
+        optional session segments select which events are searched.
+        """
+        self._simulate_latency()
+        parts = namespace.strip("/").split("/")
+        actor_id = parts[2] if len(parts) > 2 else None
+        session_id = parts[3] if len(parts) > 3 and parts[1] != "users" else None
+
+        query_tokens = set(_TOKEN_PATTERN.findall(query.lower()))
+        scored = []
+        with self._lock:
+            for (event_actor, event_session), events in self._events.items():
+                if event_actor != actor_id:
+                    continue
+                if session_id is not None and event_session != session_id:
+                    continue
+                for event in events:
+                    for message in event["payload"]:
+                        text = message["conversational"]["content"]["text"]
+                        tokens = set(_TOKEN_PATTERN.findall(text.lower()))
+                        overlap = len(query_tokens & tokens)
+                        if overlap:
+                            scored.append((overlap / len(query_tokens), event, text))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [
+            {
+                "memoryRecordId": f"{event['eventId']}-{index}",
+                "content": {"text": text},
+                "namespaces": [namespace],
+                "score": score,
+                "createdAt": event["eventTimestamp"],
+            }
+            for index, (score, event, text) in enumerate(scored[:top_k])
+        ]
+
+    def _simulate_latency(self) -> None:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
@@ -0,0 +1,116 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# (memory_type, actor_id, query, max_results, session_id)
+CacheKey = Tuple[str, str, str, int, Optional[str]]
+
+
+class MemoryRetrievalCache:
+    """Short-lived cache of memory retrieval results with hit-rate and latency metrics.
+
+    Repeated turns in the same session usually ask for the same preferences,
+    infrastructure knowledge and investigation summaries; serving those from
+    the cache avoids a round trip per memory type per turn. Keys include the
+    query text, so expired entries are swept on every put and at most
+    max_entries are kept, evicting the least recently used.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, Tuple[float, List[Dict[str, Any]]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._latency_totals: Dict[str, float] = {}
+        self._latency_counts: Dict[str, int] = {}
+
+    def get(self, key: CacheKey) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for key, or None on a miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: CacheKey, results: List[Dict[str, Any]]) -> None:
+        """Store retrieval results for key."""
+        now = time.monotonic()
+        with self._lock:
+            # Entries are in insertion/use order, not expiry order, so scan all
+            expired = [
+                cached_key
+                for cached_key, (stored_at, _) in self._entries.items()
+                if now - stored_at >= self.ttl_seconds
+            ]
+            for cached_key in expired:
+                del self._entries[cached_key]
+            self._entries[key] = (now, results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, actor_id: str, memory_type: Optional[str] = None) -> None:
+        """Drop cached results for an actor, optionally only for one memory type."""
+        with self._lock:
+            for key in list(self._entries):
+                if key[1] == actor_id and (
+                    memory_type is None or key[0] == memory_type
+                ):
+                    del self._entries[key]
+
+    def record_latency(self, memory_type: str, seconds: float) -> None:
+        """Record the latency of an uncached retrieval."""
+        with self._lock:
+            self._latency_totals[memory_type] = (
+                self._latency_totals.get(memory_type, 0.0) + seconds
+            )
+            self._latency_counts[memory_type] = (
+                self._latency_counts.get(memory_type, 0) + 1
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit rate and average retrieval latency per memory type."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "avg_latency_ms": {
+                    memory_type: 1000 * total / self._latency_counts[memory_type]
+                    for memory_type, total in self._latency_totals.items()
+                },
+            }
+
+
+_shared_caches: Dict[Any, MemoryRetrievalCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_shared_retrieval_cache(
+    memory_id: Any, ttl_seconds: float = 60.0, max_entries: int = 1000
+) -> MemoryRetrievalCache:
+    """Return the process-wide retrieval cache for a memory id.
+
+    Every hook provider on the same memory must see the same cache, otherwise
+    a save through one provider cannot invalidate results cached by another.
+    """
+    with _shared_caches_lock:
+        cache = _shared_caches.get(memory_id)
+        if cache is None:
+            cache = MemoryRetrievalCache(
+                ttl_seconds=ttl_seconds, max_entries=max_entries
+            )
+            _shared_caches[memory_id] = cache
+        return cache
@@ -0,0 +1,228 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Configure logging with basicConfig
+logging.basicConfig(
+    level=logging.INFO,  # Set the log level to INFO
+    # Define log message format
+    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
+)
+
+logger = logging.getLogger(__name__)
+
+# Sentinel telling the writer thread to exit once earlier writes are done
+_STOP = object()
+
+
+class MemoryWriteQueue:
+    """Background writer that batches memory events off the agent's critical path.
+
+    Writes are queued on a bounded queue and drained by a single daemon thread.
+    Events that arrive within flush_interval_seconds of each other are grouped
+    by (actor_id, session_id) and sent as one create_event call per group.
+    Failed writes are retried with exponential backoff, and pending writes are
+    flushed when the queue is closed or the process exits.
+    """
+
+    def __init__(
+        self,
+        memory_client: Any,
+        max_queue_size: int = 1000,
+        max_batch_messages: int = 50,
+        flush_interval_seconds: float = 0.5,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.5,
+        enqueue_timeout_seconds: float = 1.0,
+    ):
+        """
+        Args:
+            memory_client: Object exposing memory_id and a client with create_event
+            max_queue_size: Maximum number of queued writes before producers block
+            max_batch_messages: Maximum number of messages sent in one create_event
+            flush_interval_seconds: How long to gather writes into a batch
+            max_retries: Retries per batch before the write is dropped
+            retry_backoff_seconds: Initial retry delay, doubled on each attempt
+            enqueue_timeout_seconds: How long a producer waits on a full queue
+        """
+        self.memory_client = memory_client
+        self.max_batch_messages = max_batch_messages
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.enqueue_timeout_seconds = enqueue_timeout_seconds
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._pending = 0
+        # Producers between the _closed check and the end of their enqueue;
+        # close() waits for them so no write lands behind the _STOP sentinel
+        self._submitting = 0
+        self._pending_changed = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        self._stats = {
+            "queued": 0,
+            "dropped": 0,
+            "events_written": 0,
+            "messages_written": 0,
+            "retries": 0,
+            "failed_messages": 0,
+        }
+        atexit.register(self.close)
+
+    def submit(
+        self, actor_id: str, session_id: str, messages: List[Tuple[str, str]]
+    ) -> bool:
+        """Queue messages for an actor/session; returns False if the write was dropped."""
+        with self._pending_changed:
+            if self._closed:
+                logger.warning("Memory write queue is closed, dropping write")
+                return False
+            self._pending += 1
+            self._submitting += 1
+
+        try:
+            self._ensure_started()
+            self._queue.put(
+                (actor_id, session_id, list(messages)),
+                timeout=self.enqueue_timeout_seconds,
+            )
+        except queue.Full:
+            with self._pending_changed:
+                self._stats["dropped"] += len(messages)
+            self._mark_done(1)
+            logger.warning(
+                f"Memory write queue full, dropped {len(messages)} messages for actor_id={actor_id}, session_id={session_id}"
+            )
+            return False
+        finally:
+            with self._pending_changed:
+                self._submitting -= 1
+                self._pending_changed.notify_all()
+
+        with self._pending_changed:
+            self._stats["queued"] += len(messages)
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued writes are done; returns False on timeout."""
+        with self._pending_changed:
+            return self._pending_changed.wait_for(
+                lambda: self._pending == 0, timeout=timeout
+            )
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """Flush pending writes and stop the writer thread."""
+        with self._pending_changed:
+            if self._closed:
+                return
+            self._closed = True
+            self._pending_changed.wait_for(
+                lambda: self._submitting == 0, timeout=self.enqueue_timeout_seconds
+            )
+        if self._thread is None:
+            return
+
+        logger.info(f"Flushing {self._pending} pending memory writes")
+        self._queue.put(_STOP)
+        self._thread.join(timeout=timeout)
+        if self._thread.is_alive():
+            logger.warning(
+                f"Memory writer did not finish within {timeout}s, {self._pending} writes pending"
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """Return write counters and the current number of pending writes."""
+        return {**self._stats, "pending": self._pending}
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="memory-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _mark_done(self, count: int) -> None:
+        with self._pending_changed:
+            self._pending -= count
+            self._pending_changed.notify_all()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            # Gather whatever else arrives within the flush interval
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval_seconds
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Unexpected memory writer error: {e}", exc_info=True)
+            finally:
+                self._mark_done(len(batch))
+
+    def _write_batch(self, batch: List[Tuple[str, str, List[Tuple[str, str]]]]) -> None:
+        # Group by actor/session, keeping message order within each group
+        groups: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        for actor_id, session_id, messages in batch:
+            groups.setdefault((actor_id, session_id), []).extend(messages)
+
+        for (actor_id, session_id), messages in groups.items():
+            for start in range(0, len(messages), self.max_batch_messages):
+                chunk = messages[start : start + self.max_batch_messages]
+                self._write_with_retry(actor_id, session_id, chunk)
+
+    def _write_with_retry(
+        self, actor_id: str, session_id: str, messages: List[Tuple[str, str]]
+    ) -> bool:
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = self.memory_client.client.create_event(
+                    memory_id=self.memory_client.memory_id,
+                    actor_id=actor_id,
+                    session_id=session_id,
+                    messages=messages,
+                )
+                self._stats["events_written"] += 1
+                self._stats["messages_written"] += len(messages)
+                logger.info(
+                    f"Wrote {len(messages)} memory messages for actor_id={actor_id}, session_id={session_id} (event_id: {result.get('eventId', 'unknown')})"
+                )
+                return True
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self._stats["failed_messages"] += len(messages)
+                    logger.error(
+                        f"Failed to write {len(messages)} memory messages for actor_id={actor_id}, session_id={session_id} after {attempt + 1} attempts: {e}"
+                    )
+                    return False
+                delay = self.retry_backoff_seconds * (2**attempt)
+                self._stats["retries"] += 1
+                logger.warning(
+                    f"Memory write failed ({e}), retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})"
+                )
+                time.sleep(delay)
+        return False
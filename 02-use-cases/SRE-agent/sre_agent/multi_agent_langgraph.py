@@ -26,6 +26,7 @@ from .agent_state import AgentState
 from .constants import SREConstants
 from .graph_builder import build_multi_agent_graph
 from .logging_config import configure_logging, should_show_debug_traces
+from .prompt_loader import prompt_loader
 
 # Configure logging if not already configured (e.g., when imported by agent_runtime)
 if not logging.getLogger().handlers:
@@ -379,6 +380,9 @@ async def create_multi_agent_system(
     """Create multi-agent system with MCP tools."""
     logger.info(f"Creating multi-agent system with provider: {provider}")
 
+    # Compile all prompt templates once so agent turns only re-validate mtimes
+    prompt_loader.preload()
+
     # Get Anthropic API key if needed
     if provider == "anthropic" and not llm_kwargs.get("api_key"):
         llm_kwargs["api_key"] = _get_anthropic_api_key()
@@ -460,7 +464,7 @@ async def create_multi_agent_system(
     # Add memory tools if memory system is enabled
     memory_tools = []
     try:
-        from .memory.client import SREMemoryClient
+        from .memory.client import get_memory_client
         from .memory.config import _load_memory_config
         from .memory.tools import create_memory_tools
 
@@ -469,7 +473,7 @@ async def create_multi_agent_system(
             logger.debug("Adding memory tools to agent tool list")
             # Use the region from parameter if provided, otherwise use config default
             memory_region = region_name if region_name else memory_config.region
-            memory_client = SREMemoryClient(
+            memory_client = get_memory_client(
                 memory_name=memory_config.memory_name,
                 region=memory_region,
                 force_delete=force_delete_memory,
@@ -1048,6 +1052,20 @@ async def _run_interactive_session(
                                         print(f"      {result}")
                                         logger.info(f"      {result}")
 
+                        elif node_name == "parallel_agents":
+                            agent_results = node_output.get("agent_results", {})
+                            print(
+                                f"\n⚡ Parallel Agents: {', '.join(agent_results.keys())}"
+                            )
+                            logger.info(
+                                f"⚡ Parallel Agents: {', '.join(agent_results.keys())}"
+                            )
+                            for agent_key, result in agent_results.items():
+                                if result:
+                                    print(f"   💡 {agent_key}:")
+                                    print(f"      {result}")
+                                    logger.info(f"   💡 {agent_key}: {result}")
+
                         elif node_name == "aggregate":
                             final_response = node_output.get("final_response", "")
                             if final_response:
@@ -1463,6 +1481,20 @@ async def main():
                                         print(f"      {result}")
                                         logger.info(f"      {result}")
 
+                        elif node_name == "parallel_agents":
+                            agent_results = node_output.get("agent_results", {})
+                            print(
+                                f"\n⚡ Parallel Agents: {', '.join(agent_results.keys())}"
+                            )
+                            logger.info(
+                                f"⚡ Parallel Agents: {', '.join(agent_results.keys())}"
+                            )
+                            for agent_key, result in agent_results.items():
+                                if result:
+                                    print(f"   💡 {agent_key}:")
+                                    print(f"      {result}")
+                                    logger.info(f"   💡 {agent_key}: {result}")
+
                         elif node_name == "aggregate":
                             final_response = node_output.get("final_response", "")
                             if final_response:
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 
 import logging
-from functools import lru_cache
+import os
+import string
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Configure logging with basicConfig
 logging.basicConfig(
@@ -14,15 +16,50 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+_FORMATTER = string.Formatter()
+
+
+class PromptTemplate:
+    """A prompt file parsed once into literal text and str.format fields."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self._parts: Optional[List[Tuple[str, Optional[str], str, Optional[str]]]]
+        try:
+            self._parts = list(_FORMATTER.parse(content))
+        except ValueError:
+            # Malformed braces: let str.format report the error at render time
+            self._parts = None
+        else:
+            # Nested replacement fields in format specs need full str.format
+            if any(spec and "{" in spec for _, _, spec, _ in self._parts):
+                self._parts = None
+
+    def render(self, **kwargs: Any) -> str:
+        """Substitute variables, with the same semantics as str.format."""
+        if self._parts is None:
+            return self.content.format(**kwargs)
+
+        pieces = []
+        for literal, field_name, format_spec, conversion in self._parts:
+            pieces.append(literal)
+            if field_name is None:
+                continue
+            value, _ = _FORMATTER.get_field(field_name, (), kwargs)
+            value = _FORMATTER.convert_field(value, conversion)
+            pieces.append(format(value, format_spec))
+        return "".join(pieces)
+
 
 class PromptLoader:
     """Utility class for loading and managing prompt templates."""
 
-    def __init__(self, prompts_dir: Optional[str] = None):
+    def __init__(self, prompts_dir: Optional[str] = None, preload: bool = False):
         """Initialize the prompt loader.
 
         Args:
             prompts_dir: Directory containing prompt files. If None, uses default relative path.
+            preload: Load and compile every prompt file up front.
         """
         if prompts_dir:
             self.prompts_dir = Path(prompts_dir)
@@ -30,17 +67,46 @@ class PromptLoader:
             # Default to config/prompts relative to this file
             self.prompts_dir = Path(__file__).parent / "config" / "prompts"
 
+        # filename -> (mtime_ns, compiled template)
+        self._cache: Dict[str, Tuple[int, PromptTemplate]] = {}
+        # (agent_type, agent_name, agent_description) -> (base, specific, prompt)
+        self._agent_prompts: Dict[
+            Tuple[str, str, str],
+            Tuple[PromptTemplate, Optional[PromptTemplate], str],
+        ] = {}
+        self._lock = threading.Lock()
+
         logger.debug(f"PromptLoader initialized with prompts_dir: {self.prompts_dir}")
 
-    @lru_cache(maxsize=32)
-    def _load_prompt_file(self, filename: str) -> str:
-        """Load a prompt file with caching.
+        if preload:
+            self.preload()
+
+    def preload(self) -> int:
+        """Load and compile every prompt file so later calls only stat the files.
+
+        Returns:
+            Number of prompt files loaded
+        """
+        names = self.list_available_prompts()
+        for name in names:
+            self._load_compiled(f"{name}.txt")
+        logger.info(f"Preloaded {len(names)} prompt templates from {self.prompts_dir}")
+        return len(names)
+
+    def clear_cache(self) -> None:
+        """Drop all cached prompt templates."""
+        with self._lock:
+            self._cache.clear()
+            self._agent_prompts.clear()
+
+    def _load_compiled(self, filename: str) -> PromptTemplate:
+        """Return the compiled template for a prompt file, re-reading it if it changed.
 
         Args:
             filename: Name of the prompt file to load
 
         Returns:
-            Content of the prompt file
+            Compiled template of the prompt file
 
         Raises:
             FileNotFoundError: If the prompt file doesn't exist
@@ -48,19 +114,43 @@ class PromptLoader:
         """
         filepath = self.prompts_dir / filename
 
-        if not filepath.exists():
+        try:
+            mtime_ns = os.stat(filepath).st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(f"Prompt file not found: {filepath}")
 
+        cached = self._cache.get(filename)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         try:
             with open(filepath, "r", encoding="utf-8") as f:
                 content = f.read().strip()
-
-            logger.debug(f"Loaded prompt file: {filename}")
-            return content
         except Exception as e:
             logger.error(f"Error loading prompt file {filename}: {e}")
             raise IOError(f"Failed to read prompt file {filename}: {e}")
 
+        template = PromptTemplate(content)
+        with self._lock:
+            self._cache[filename] = (mtime_ns, template)
+        logger.debug(f"Loaded prompt file: {filename}")
+        return template
+
+    def _load_prompt_file(self, filename: str) -> str:
+        """Load a prompt file with caching.
+
+        Args:
+            filename: Name of the prompt file to load
+
+        Returns:
+            Content of the prompt file
+
+        Raises:
+            FileNotFoundError: If the prompt file doesn't exist
+            IOError: If there's an error reading the file
+        """
+        return self._load_compiled(filename).content
+
     def load_prompt(self, prompt_name: str) -> str:
         """Load a prompt by name.
 
@@ -83,10 +173,10 @@ class PromptLoader:
         Returns:
             Template content with variables substituted
         """
-        template_content = self.load_prompt(template_name)
+        template = self._load_compiled(f"{template_name}.txt")
 
         try:
-            return template_content.format(**kwargs)
+            return template.render(**kwargs)
         except KeyError as e:
             logger.error(f"Missing template variable {e} in template {template_name}")
             raise ValueError(f"Missing required template variable: {e}")
@@ -113,20 +203,43 @@ class PromptLoader:
             Complete system prompt for the agent with memory context
         """
         try:
-            # Load base prompt template
-            base_prompt = self.load_template(
-                "agent_base_prompt",
-                agent_name=agent_name,
-                agent_description=agent_description,
-            )
+            base_template = self._load_compiled("agent_base_prompt.txt")
 
             # Load agent-specific prompt if it exists
             try:
-                agent_specific_prompt = self.load_prompt(f"{agent_type}_agent_prompt")
-                combined_prompt = f"{base_prompt}\n\n{agent_specific_prompt}"
+                specific_template = self._load_compiled(
+                    f"{agent_type}_agent_prompt.txt"
+                )
             except FileNotFoundError:
-                logger.warning(f"No specific prompt found for agent type: {agent_type}")
-                combined_prompt = base_prompt
+                specific_template = None
+
+            # Reuse the combined prompt while neither file has changed
+            key = (agent_type, agent_name, agent_description)
+            cached = self._agent_prompts.get(key)
+            if (
+                cached is not None
+                and cached[0] is base_template
+                and cached[1] is specific_template
+            ):
+                combined_prompt = cached[2]
+            else:
+                combined_prompt = base_template.render(
+                    agent_name=agent_name, agent_description=agent_description
+                )
+                if specific_template is not None:
+                    combined_prompt = (
+                        f"{combined_prompt}\n\n{specific_template.content}"
+                    )
+                else:
+                    logger.warning(
+                        f"No specific prompt found for agent type: {agent_type}"
+                    )
+                with self._lock:
+                    self._agent_prompts[key] = (
+                        base_template,
+                        specific_template,
+                        combined_prompt,
+                    )
 
             # Add memory context if provided
             if memory_context:
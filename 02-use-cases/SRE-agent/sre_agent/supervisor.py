@@ -15,7 +15,7 @@ from .agent_state import AgentState
 from .constants import SREConstants
 from .llm_utils import create_llm_with_error_handling
 from .memory import create_conversation_memory_manager
-from .memory.client import SREMemoryClient
+from .memory.client import get_memory_client
 from .memory.config import _load_memory_config
 from .memory.hooks import MemoryHookProvider
 from .memory.tools import create_memory_tools
@@ -217,7 +217,7 @@ class SupervisorAgent:
         if self.memory_config.enabled:
             # Use region from llm_kwargs if provided for bedrock
             memory_region = llm_kwargs.get("region_name", self.memory_config.region) if llm_provider == "bedrock" else self.memory_config.region
-            self.memory_client = SREMemoryClient(
+            self.memory_client = get_memory_client(
                 memory_name=self.memory_config.memory_name,
                 region=memory_region,
                 force_delete=force_delete_memory,
@@ -317,7 +317,7 @@ class SupervisorAgent:
                         "session_id is required for memory retrieval but not found in state"
                     )
 
-                memory_context = self.memory_hooks.on_investigation_start(
+                memory_context = await self.memory_hooks.on_investigation_start(
                     query=current_query,
                     user_id=user_id,
                     actor_id=actor_id,
@@ -0,0 +1 @@
+"""Tests for the demo backend servers."""
@@ -0,0 +1,54 @@
+"""Tests for the demo backend's in-memory log store."""
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+SERVERS_DIR = Path(__file__).parents[3] / "backend" / "servers"
+
+
+@pytest.fixture
+def log_store(monkeypatch):
+    """Import log_store the way the backend servers do, from their directory."""
+    monkeypatch.syspath_prepend(str(SERVERS_DIR))
+    return importlib.import_module("log_store")
+
+
+class TestLogStore:
+    """Tests for LogStore tail ingestion."""
+
+    def test_ingests_last_line_without_trailing_newline(self, log_store, tmp_path):
+        """Test that a final line with no newline is searchable and counted."""
+        path = tmp_path / "app.log"
+        path.write_text(
+            "2024-01-15T14:00:00Z [INFO] api-service started\n"
+            "2024-01-15T14:01:00Z [ERROR] api-service boom"
+        )
+        store = log_store.LogStore(path)
+
+        assert len(store) == 2
+        assert [entry["message"] for entry in store.search("boom")] == ["boom"]
+        assert store.recent(1)[0]["message"] == "boom"
+
+    def test_unterminated_line_is_not_double_counted_when_completed(
+        self, log_store, tmp_path
+    ):
+        """Test that finishing the last line and appending more re-parses it once."""
+        path = tmp_path / "app.log"
+        path.write_text("2024-01-15T14:00:00Z [INFO] api-service started\n2024-01-15")
+        store = log_store.LogStore(path)
+        assert len(store) == 2
+
+        with open(path, "a") as f:
+            f.write("T14:01:00Z [ERROR] api-service boom\n")
+            f.write("2024-01-15T14:02:00Z [WARN] api-service slow")
+
+        assert len(store) == 3
+        assert [entry["level"] for entry in store.search("api-service")] == [
+            "INFO",
+            "ERROR",
+            "WARN",
+        ]
+        assert store.search("2024-01-15 ") == []
+        assert len(store.search("boom")) == 1
@@ -0,0 +1,73 @@
+"""Tests for the demo backend's runbook search index."""
+
+import importlib
+import json
+from pathlib import Path
+
+import pytest
+
+SERVERS_DIR = Path(__file__).parents[3] / "backend" / "servers"
+
+
+@pytest.fixture
+def runbook_index(monkeypatch):
+    """Import runbook_index the way the backend servers do, from their directory."""
+    monkeypatch.syspath_prepend(str(SERVERS_DIR))
+    return importlib.import_module("runbook_index")
+
+
+@pytest.fixture
+def runbook_search(runbook_index, tmp_path):
+    """Build a RunbookSearch over a data directory with only the playbooks file."""
+    data_store = importlib.import_module("data_store")
+    (tmp_path / "incident_playbooks.json").write_text(
+        json.dumps(
+            {
+                "playbooks": [
+                    {
+                        "id": "pod-restart",
+                        "title": "Pod stuck in CrashLoopBackOff",
+                        "description": "Recover crashing pods",
+                    },
+                    {
+                        "id": "db-latency",
+                        "title": "Database latency",
+                        "description": "Slow queries",
+                    },
+                ]
+            }
+        )
+    )
+    store = data_store.DataStore(tmp_path)
+    for filename, key, _ in runbook_index.RUNBOOK_SOURCES.values():
+        store.register(filename, data_store.CollectionSpec(key))
+    return runbook_index.RunbookSearch(store, tmp_path / "markdown")
+
+
+class TestRunbookSearch:
+    """Tests for RunbookSearch ranking and source file handling."""
+
+    def test_missing_data_files_do_not_break_search(self, runbook_search):
+        """Test that search works when some runbook data files do not exist."""
+        total, ranked = runbook_search.index().search("database")
+
+        assert total == 1
+        assert ranked[0][1]["id"] == "db-latency"
+
+    def test_infix_query_matches(self, runbook_search):
+        """Test that a query matching only inside a term still finds it."""
+        total, ranked = runbook_search.index().search("loop")
+
+        assert total == 1
+        assert ranked[0][1]["id"] == "pod-restart"
+
+    def test_created_data_file_rebuilds_index(self, runbook_search, tmp_path):
+        """Test that a data file appearing later is picked up."""
+        runbook_search.index()
+        (tmp_path / "common_resolutions.json").write_text(
+            json.dumps({"resolutions": [{"id": "oom", "issue": "Out of memory"}]})
+        )
+
+        total, _ = runbook_search.index().search("memory")
+
+        assert total == 1
@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+import pytest
+
+from sre_agent.memory import client as client_module
+from sre_agent.memory.client import clear_memory_clients, get_memory_client
+
+
+class TestGetMemoryClient:
+    """Tests for the process-wide memory client registry."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_registry(self):
+        """Reset the registry and stub out AWS calls for each test."""
+        clear_memory_clients()
+        with (
+            patch.object(client_module, "MemoryClient"),
+            patch.object(
+                client_module.SREMemoryClient, "_initialize_memories", autospec=True
+            ) as mock_init,
+        ):
+
+            def _init(instance):
+                return "sre_agent_memory-abc"
+
+            mock_init.side_effect = _init
+            self.mock_init = mock_init
+            yield
+        clear_memory_clients()
+
+    def test_reuses_client_for_same_key(self):
+        """Test that repeated calls return the same initialized client."""
+        first = get_memory_client(region="us-east-1")
+        second = get_memory_client(region="us-east-1")
+
+        assert first is second
+        assert self.mock_init.call_count == 1
+
+    def test_separate_clients_per_region(self):
+        """Test that different regions get different clients."""
+        east = get_memory_client(region="us-east-1")
+        west = get_memory_client(region="us-west-2")
+
+        assert east is not west
+        assert self.mock_init.call_count == 2
+
+    def test_refreshes_status_after_ttl(self):
+        """Test that cached status is re-checked once the TTL expires."""
+        client = get_memory_client(region="us-east-1")
+        client._initialized_at -= client.config.status_cache_ttl_seconds + 1
+
+        assert get_memory_client(region="us-east-1") is client
+        assert self.mock_init.call_count == 2
+
+    def test_refresh_failure_keeps_memory_id(self):
+        """Test that a failed refresh does not drop a working memory id."""
+        client = get_memory_client(region="us-east-1")
+
+        def _fail(instance):
+            return None
+
+        self.mock_init.side_effect = _fail
+        client.refresh_status()
+
+        assert client.memory_id == "sre_agent_memory-abc"
+
+    def test_force_delete_builds_new_client(self):
+        """Test that force_delete bypasses the cached client."""
+        first = get_memory_client(region="us-east-1")
+        second = get_memory_client(region="us-east-1", force_delete=True)
+
+        assert first is not second
+        assert get_memory_client(region="us-east-1") is second
@@ -0,0 +1,131 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from sre_agent.memory.hooks import MemoryHookProvider
+from sre_agent.memory.retrieval_cache import MemoryRetrievalCache
+
+
+class TestMemoryRetrievalCache:
+    """Tests for the memory retrieval result cache."""
+
+    def test_hit_and_miss_counts(self):
+        """Test that lookups are counted and reflected in the hit rate."""
+        cache = MemoryRetrievalCache(ttl_seconds=60)
+        key = ("preferences", "alice", "query", 10, None)
+
+        assert cache.get(key) is None
+        cache.put(key, [{"content": {"text": "pref"}}])
+        assert cache.get(key) == [{"content": {"text": "pref"}}]
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_expired_entries_miss(self):
+        """Test that entries older than the TTL are not served."""
+        cache = MemoryRetrievalCache(ttl_seconds=0)
+        key = ("preferences", "alice", "query", 10, None)
+        cache.put(key, [])
+
+        assert cache.get(key) is None
+
+    def test_invalidate_by_actor_and_type(self):
+        """Test that invalidation only drops the matching actor and memory type."""
+        cache = MemoryRetrievalCache(ttl_seconds=60)
+        prefs = ("preferences", "alice", "q", 10, None)
+        infra = ("infrastructure", "alice", "q", 50, None)
+        other = ("preferences", "bob", "q", 10, None)
+        for key in (prefs, infra, other):
+            cache.put(key, [])
+
+        cache.invalidate("alice", "preferences")
+
+        assert cache.get(prefs) is None
+        assert cache.get(infra) == []
+        assert cache.get(other) == []
+
+    def test_put_sweeps_expired_entries(self):
+        """Test that storing a result drops entries whose TTL has passed."""
+        cache = MemoryRetrievalCache(ttl_seconds=0)
+        cache.put(("preferences", "alice", "first", 10, None), [])
+        cache.put(("preferences", "alice", "second", 10, None), [])
+
+        assert cache.stats()["entries"] == 1
+
+    def test_evicts_least_recently_used_beyond_max_entries(self):
+        """Test that the cache keeps at most max_entries, dropping the LRU one."""
+        cache = MemoryRetrievalCache(ttl_seconds=60, max_entries=2)
+        first = ("preferences", "alice", "first", 10, None)
+        second = ("preferences", "alice", "second", 10, None)
+        third = ("preferences", "alice", "third", 10, None)
+        cache.put(first, [])
+        cache.put(second, [])
+        cache.get(first)
+
+        cache.put(third, [])
+
+        assert cache.get(second) is None
+        assert cache.get(first) == []
+        assert cache.get(third) == []
+
+
+class TestOnInvestigationStart:
+    """Tests for concurrent, cached memory retrieval at investigation start."""
+
+    @pytest.mark.asyncio
+    async def test_retrievals_run_concurrently(self):
+        """Test that all three memory types are retrieved at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _retrieve(memory_type, **kwargs):
+            # Each call blocks until all three are in flight
+            barrier.wait()
+            return []
+
+        memory_client = Mock()
+        memory_client.retrieve_memories.side_effect = _retrieve
+        hooks = MemoryHookProvider(memory_client)
+
+        context = await hooks.on_investigation_start(
+            query="pod crash", user_id="alice", actor_id="alice", session_id="s1"
+        )
+
+        assert memory_client.retrieve_memories.call_count == 3
+        assert context["past_investigations"] == []
+
+    @pytest.mark.asyncio
+    async def test_repeated_turn_served_from_cache(self):
+        """Test that a repeated query does not hit the memory service again."""
+        memory_client = Mock()
+        memory_client.retrieve_memories.return_value = []
+        hooks = MemoryHookProvider(memory_client)
+
+        for _ in range(2):
+            await hooks.on_investigation_start(
+                query="pod crash", user_id="alice", actor_id="alice", session_id="s1"
+            )
+
+        assert memory_client.retrieve_memories.call_count == 3
+        metrics = hooks.get_retrieval_metrics()
+        assert metrics["hits"] == 3
+        assert set(metrics["avg_latency_ms"]) == {
+            "preferences",
+            "infrastructure",
+            "investigations",
+        }
+
+    def test_providers_on_same_memory_share_cache(self):
+        """Test that a save through one provider invalidates another provider's cache."""
+        memory_client = Mock()
+        memory_client.memory_id = "shared-cache-test"
+        reader = MemoryHookProvider(memory_client)
+        writer = MemoryHookProvider(memory_client)
+        key = ("investigations", "alice", "pod crash", 5, None)
+        reader.retrieval_cache.put(key, [{"content": {"text": "old"}}])
+
+        writer.retrieval_cache.invalidate("alice", "investigations")
+
+        assert reader.retrieval_cache.get(key) is None
@@ -0,0 +1,127 @@
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from sre_agent.memory.local_backend import LocalMemoryBackend
+from sre_agent.memory.write_queue import MemoryWriteQueue
+
+
+def _memory_client(backend):
+    return SimpleNamespace(client=backend, memory_id="test-memory")
+
+
+class TestMemoryWriteQueue:
+    """Tests for the background memory write pipeline."""
+
+    def test_batches_writes_by_actor_and_session(self):
+        """Test that queued writes for the same session share one event."""
+        backend = LocalMemoryBackend()
+        writer = MemoryWriteQueue(_memory_client(backend), flush_interval_seconds=0.2)
+
+        for n in range(5):
+            assert writer.submit("alice", "s1", [(f"message {n}", "USER")])
+        assert writer.submit("bob", "s2", [("other", "USER")])
+        assert writer.flush(timeout=5)
+
+        alice_events = backend.list_events("test-memory", "alice", "s1")
+        assert len(alice_events) == 1
+        assert len(alice_events[0]["payload"]) == 5
+        assert backend.create_event_calls == 2
+        writer.close()
+
+    def test_splits_large_batches(self):
+        """Test that batches are capped at max_batch_messages per event."""
+        backend = LocalMemoryBackend()
+        writer = MemoryWriteQueue(
+            _memory_client(backend), max_batch_messages=2, flush_interval_seconds=0.2
+        )
+
+        writer.submit("alice", "s1", [(f"message {n}", "USER") for n in range(5)])
+        writer.flush(timeout=5)
+
+        assert len(backend.list_events("test-memory", "alice", "s1")) == 3
+        writer.close()
+
+    def test_retries_failed_writes(self):
+        """Test that a failed write is retried with backoff until it succeeds."""
+        backend = Mock()
+        backend.create_event.side_effect = [
+            RuntimeError("throttled"),
+            {"eventId": "e1"},
+        ]
+        writer = MemoryWriteQueue(
+            _memory_client(backend),
+            flush_interval_seconds=0.01,
+            retry_backoff_seconds=0.01,
+        )
+
+        writer.submit("alice", "s1", [("hello", "USER")])
+        writer.flush(timeout=5)
+
+        assert backend.create_event.call_count == 2
+        stats = writer.stats()
+        assert stats["retries"] == 1
+        assert stats["messages_written"] == 1
+        writer.close()
+
+    def test_gives_up_after_max_retries(self):
+        """Test that a write is dropped once retries are exhausted."""
+        backend = Mock()
+        backend.create_event.side_effect = RuntimeError("unavailable")
+        writer = MemoryWriteQueue(
+            _memory_client(backend),
+            flush_interval_seconds=0.01,
+            max_retries=2,
+            retry_backoff_seconds=0.01,
+        )
+
+        writer.submit("alice", "s1", [("hello", "USER")])
+        writer.flush(timeout=5)
+
+        assert backend.create_event.call_count == 3
+        assert writer.stats()["failed_messages"] == 1
+        writer.close()
+
+    def test_close_flushes_pending_writes(self):
+        """Test that closing the queue writes everything still queued."""
+        backend = LocalMemoryBackend(latency_seconds=0.01)
+        writer = MemoryWriteQueue(_memory_client(backend), flush_interval_seconds=1.0)
+
+        writer.submit("alice", "s1", [("hello", "USER")])
+        writer.close()
+
+        assert len(backend.list_events("test-memory", "alice", "s1")) == 1
+        assert not writer.submit("alice", "s1", [("late", "USER")])
+
+    def test_close_waits_for_in_flight_submit(self):
+        """Test that a write being enqueued while close() runs is still written."""
+        backend = LocalMemoryBackend()
+        writer = MemoryWriteQueue(_memory_client(backend), flush_interval_seconds=0.01)
+        writer.submit("alice", "s1", [("first", "USER")])
+        writer.flush(timeout=5)
+
+        entered = threading.Event()
+        real_put = writer._queue.put
+
+        def _slow_put(item, *args, **kwargs):
+            if isinstance(item, tuple):
+                entered.set()
+                time.sleep(0.2)
+            return real_put(item, *args, **kwargs)
+
+        writer._queue.put = _slow_put
+        results = []
+        producer = threading.Thread(
+            target=lambda: results.append(
+                writer.submit("alice", "s1", [("late", "USER")])
+            )
+        )
+        producer.start()
+        entered.wait(timeout=5)
+        writer.close()
+        producer.join()
+
+        assert results == [True]
+        assert writer.flush(timeout=1)
+        assert len(backend.list_events("test-memory", "alice", "s1")) == 2
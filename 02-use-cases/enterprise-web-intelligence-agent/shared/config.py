@@ -45,6 +45,14 @@ class AgentConfig:
     browser_timeout: int = 60000  # 60 seconds
     browser_session_timeout: int = 3600  # 1 hour
     
+    # Parallel analysis: browser tabs analyzing sites at once, and time allowed per site
+    max_parallel_sites: int = int(os.environ.get("MAX_PARALLEL_SITES", "4"))
+    site_timeout_seconds: int = int(os.environ.get("SITE_TIMEOUT_SECONDS", "300"))
+    
+    # Page readiness wait cap, and how long extracted page results are reused
+    page_ready_timeout_ms: int = int(os.environ.get("PAGE_READY_TIMEOUT_MS", "5000"))
+    page_cache_ttl_seconds: int = int(os.environ.get("PAGE_CACHE_TTL_SECONDS", "900"))
+    
     # Code Interpreter Configuration
     code_session_timeout: int = 1800  # 30 minutes
     
@@ -186,24 +186,15 @@ class CompetitiveIntelligenceAgent:
             if not competitor_data:
                 return "No competitor data to analyze yet"
             
-            # Analyze each competitor
-            for competitor_name, data in competitor_data.items():
-                console.print(f"[cyan]Analyzing {competitor_name}...[/cyan]")
-                analysis_result = agent_instance.analysis_tools.analyze_competitor_data(
-                    competitor_name, data
-                )
-                
-                # Store analysis results
-                analysis_results = agent_instance._safe_state_get("analysis_results", {})
-                analysis_results[competitor_name] = analysis_result
-                agent_instance.agent.state.set("analysis_results", analysis_results)
-            
-            # Create visualizations
-            console.print("[cyan]Creating comparison visualizations...[/cyan]")
-            viz_result = agent_instance.analysis_tools.create_comparison_visualization(competitor_data)
+            # Analyze each competitor and create visualizations in one execution
+            batch_result = agent_instance.analysis_tools.analyze_all_competitors(competitor_data)
+            if batch_result.get("status") != "success":
+                return f"Analysis failed: {batch_result.get('error', 'unknown error')}"
             
+            # Store analysis results
             analysis_results = agent_instance._safe_state_get("analysis_results", {})
-            analysis_results["visualizations"] = viz_result
+            analysis_results.update(batch_result["analyses"])
+            analysis_results["visualizations"] = batch_result["visualizations"]
             agent_instance.agent.state.set("analysis_results", analysis_results)
             
             return "Analysis completed successfully"
@@ -240,25 +231,35 @@ class CompetitiveIntelligenceAgent:
         
         return tools
     
-    async def _analyze_website_impl(self, competitor_name: str, competitor_url: str) -> str:
-        """Implementation of website analysis."""
+    async def _analyze_website_impl(self, competitor_name: str, competitor_url: str,
+                                    browser_tools: Optional[BrowserTools] = None,
+                                    show_progress: bool = True) -> str:
+        """Implementation of website analysis.
+        
+        browser_tools selects the page to use (the main one by default); the
+        progress bar is hidden for concurrent runs since only one can be live.
+        """
+        browser_tools = browser_tools or self.browser_tools
         console.print(f"\n[bold blue]🔍 Analyzing: {competitor_name}[/bold blue]")
         console.print(f"[cyan]URL: {competitor_url}[/cyan]")
         
         competitor_data = {}
+        screenshots_before = len(browser_tools._screenshots_taken)
+        apis_before = len(browser_tools._discovered_apis)
         
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
-            console=console
+            console=console,
+            disable=not show_progress
         ) as progress:
             task = progress.add_task(f"Analyzing {competitor_name}...", total=10)
             
             try:
                 # Navigate to website
                 progress.update(task, description="Navigating to website...", advance=1)
-                nav_result = await self.browser_tools.navigate_to_url(competitor_url)
+                nav_result = await browser_tools.navigate_to_url(competitor_url)
                 competitor_data['navigation'] = nav_result
                 
                 if nav_result.get('status') != 'success':
@@ -267,46 +268,46 @@ class CompetitiveIntelligenceAgent:
                 
                 # Take screenshot
                 progress.update(task, description="Taking homepage screenshot...", advance=1)
-                await self.browser_tools.take_annotated_screenshot(f"{competitor_name} - Homepage")
+                await browser_tools.take_annotated_screenshot(f"{competitor_name} - Homepage")
                 
                 # Discover sections
                 progress.update(task, description="Discovering page sections...", advance=1)
-                discovered_sections = await self.browser_tools.intelligent_scroll_and_discover()
+                discovered_sections = await browser_tools.intelligent_scroll_and_discover()
                 competitor_data['discovered_sections'] = discovered_sections
                 console.print(f"[green]Found {len(discovered_sections)} key sections[/green]")
                 
                 # Try to find pricing page
                 progress.update(task, description="Looking for pricing page...", advance=1)
-                found_pricing = await self.browser_tools.smart_navigation("pricing")
+                found_pricing = await browser_tools.smart_navigation("pricing")
                 if found_pricing:
-                    await asyncio.sleep(3)
-                    await self.browser_tools.take_annotated_screenshot(f"{competitor_name} - Pricing")
+                    await browser_tools.wait_for_page_ready()
+                    await browser_tools.take_annotated_screenshot(f"{competitor_name} - Pricing")
                 
                 # Analyze forms
                 progress.update(task, description="Checking interactive elements...", advance=1)
-                form_data = await self.browser_tools.analyze_forms_and_inputs()
+                form_data = await browser_tools.analyze_forms_and_inputs()
                 competitor_data['interactive_elements'] = form_data
                 
                 # Extract pricing
                 progress.update(task, description="Extracting pricing...", advance=1)
-                pricing_result = await self.browser_tools.extract_pricing_info()
+                pricing_result = await browser_tools.extract_pricing_info()
                 competitor_data['pricing'] = pricing_result
                 
                 # Extract features
                 progress.update(task, description="Extracting features...", advance=1)
-                features_result = await self.browser_tools.extract_product_features()
+                features_result = await browser_tools.extract_product_features()
                 competitor_data['features'] = features_result
                 
                 # Explore additional pages
                 progress.update(task, description="Exploring additional pages...", advance=1)
-                additional_pages = await self.browser_tools.explore_multi_page_workflow(
+                additional_pages = await browser_tools.explore_multi_page_workflow(
                     ["features", "docs", "api", "about"]
                 )
                 competitor_data['additional_pages'] = additional_pages
                 
                 # Capture metrics
                 progress.update(task, description="Capturing metrics...", advance=1)
-                metrics = await self.browser_tools.capture_performance_metrics()
+                metrics = await browser_tools.capture_performance_metrics()
                 competitor_data['performance_metrics'] = metrics
                 
                 # Save to state
@@ -320,12 +321,22 @@ class CompetitiveIntelligenceAgent:
                 }
                 self.agent.state.set("competitor_data", all_competitor_data)
                 
+                # Stage this competitor's data in the CodeInterpreter now, so
+                # perform_analysis only ships what changed since
+                try:
+                    await asyncio.to_thread(
+                        self.analysis_tools.stage_competitor_data,
+                        competitor_name, all_competitor_data[competitor_name]
+                    )
+                except Exception as e:
+                    console.print(f"[yellow]Could not stage {competitor_name} data: {e}[/yellow]")
+                
                 # Update metrics in state
                 total_screenshots = self._safe_state_get("total_screenshots", 0)
-                self.agent.state.set("total_screenshots", total_screenshots + len(self.browser_tools._screenshots_taken))
+                self.agent.state.set("total_screenshots", total_screenshots + len(browser_tools._screenshots_taken) - screenshots_before)
                 
                 discovered_apis = self._safe_state_get("discovered_apis", [])
-                discovered_apis.extend(self.browser_tools._discovered_apis)
+                discovered_apis.extend(browser_tools._discovered_apis[apis_before:])
                 self.agent.state.set("discovered_apis", discovered_apis)
                 
             except Exception as e:
@@ -360,37 +371,146 @@ class CompetitiveIntelligenceAgent:
         return callback_handler
     
 
+    async def _analyze_competitors_parallel(self, competitors: List[Dict]):
+        """Analyze competitors concurrently on a bounded pool of browser tabs.
+        
+        At most config.max_parallel_sites sites are analyzed at once, each in
+        its own tab of the recorded browser session. A site that fails or runs
+        past config.site_timeout_seconds is recorded as an error without
+        affecting the others; a timed-out tab is replaced with a fresh one, or
+        dropped from the pool if no new tab can be opened.
+        """
+        pool_size = max(1, min(self.config.max_parallel_sites, len(competitors)))
+        console.print(f"\n[bold cyan]⚡ Parallel mode: {pool_size} browser tabs, "
+                      f"{self.config.site_timeout_seconds}s per site[/bold cyan]")
+        if self.browser_viewer:
+            console.print("[dim]The live viewer shows the main tab; worker tabs are still recorded[/dim]")
+        
+        workers = asyncio.Queue()
+        for worker in await asyncio.gather(*[
+            self.browser_tools.open_worker_page() for _ in range(pool_size)
+        ], return_exceptions=True):
+            if isinstance(worker, Exception):
+                console.print(f"[yellow]⚠️ Could not open a worker tab: {worker}[/yellow]")
+                continue
+            self.parallel_browser_sessions.append(worker)
+            workers.put_nowait(worker)
+        if not self.parallel_browser_sessions:
+            # No tabs at all: let every analysis fail fast instead of waiting
+            workers.put_nowait(None)
+        
+        def record_error(competitor: Dict, error: str):
+            all_competitor_data = self._safe_state_get("competitor_data", {})
+            all_competitor_data[competitor['name']] = {
+                "url": competitor['url'],
+                "timestamp": datetime.now().isoformat(),
+                "status": "error",
+                "error": error
+            }
+            self.agent.state.set("competitor_data", all_competitor_data)
+        
+        async def replace_worker(worker):
+            """Close a worker tab and open a fresh one; None shrinks the pool"""
+            self.parallel_browser_sessions.remove(worker)
+            try:
+                await worker.cleanup()
+            except Exception as e:
+                console.print(f"[yellow]⚠️ Could not close worker tab: {e}[/yellow]")
+            try:
+                replacement = await self.browser_tools.open_worker_page()
+            except Exception as e:
+                console.print(f"[yellow]⚠️ Could not replace worker tab, continuing with "
+                              f"{len(self.parallel_browser_sessions)}: {e}[/yellow]")
+                return None
+            self.parallel_browser_sessions.append(replacement)
+            return replacement
+        
+        async def analyze(competitor: Dict):
+            worker = await workers.get()
+            if worker is None:
+                workers.put_nowait(None)
+                record_error(competitor, "No browser tabs available")
+                return f"Error analyzing {competitor['name']}: no browser tabs available"
+            started_at = datetime.now()
+            try:
+                result = await asyncio.wait_for(
+                    self._analyze_website_impl(
+                        competitor['name'], competitor['url'],
+                        browser_tools=worker, show_progress=False
+                    ),
+                    timeout=self.config.site_timeout_seconds
+                )
+                elapsed = (datetime.now() - started_at).total_seconds()
+                console.print(f"[green]✓ {competitor['name']} analysis complete ({elapsed:.1f}s)[/green]")
+                return result
+            except asyncio.TimeoutError:
+                console.print(f"[red]⏱️ {competitor['name']} timed out after {self.config.site_timeout_seconds}s[/red]")
+                record_error(competitor, f"Timed out after {self.config.site_timeout_seconds}s")
+                # The tab may be mid-navigation; replace it before reuse
+                worker = await replace_worker(worker)
+                return f"Error analyzing {competitor['name']}: timed out"
+            except Exception as e:
+                console.print(f"[red]❌ Error analyzing {competitor['name']}: {e}[/red]")
+                record_error(competitor, str(e))
+                return f"Error analyzing {competitor['name']}: {str(e)}"
+            finally:
+                if worker is not None:
+                    workers.put_nowait(worker)
+                elif not self.parallel_browser_sessions:
+                    workers.put_nowait(None)
+        
+        started_at = datetime.now()
+        try:
+            await asyncio.gather(
+                *[analyze(competitor) for competitor in competitors],
+                return_exceptions=True
+            )
+            duration = (datetime.now() - started_at).total_seconds()
+            console.print(f"\n[green]✅ Parallel analysis of {len(competitors)} competitors took {duration:.1f}s[/green]")
+        finally:
+            # Close the worker tabs; the main session stays open for later steps
+            for worker in self.parallel_browser_sessions:
+                try:
+                    await worker.cleanup()
+                except Exception as e:
+                    console.print(f"[yellow]⚠️ Could not close worker tab: {e}[/yellow]")
+            self.parallel_browser_sessions = []
+    
     async def run(self, competitors: List[Dict], parallel: bool = False) -> Dict:
         """Run the competitive intelligence analysis."""
         try:
             # Store competitors in state
             self.agent.state.set("competitors", competitors)
+            self.agent.state.set("parallel_mode", parallel and len(competitors) > 1)
             
             console.print("\n[cyan]🤖 Starting competitive analysis workflow...[/cyan]")
             console.print(f"[bold]Analyzing {len(competitors)} competitors[/bold]")
             
-            # Analyze each competitor sequentially
-            for i, competitor in enumerate(competitors, 1):
-                console.print(f"\n[bold yellow]📊 Competitor {i}/{len(competitors)}: {competitor['name']}[/bold yellow]")
+            if parallel and len(competitors) > 1:
+                await self._analyze_competitors_parallel(competitors)
+            else:
+                # Analyze each competitor sequentially
+                for i, competitor in enumerate(competitors, 1):
+                    console.print(f"\n[bold yellow]📊 Competitor {i}/{len(competitors)}: {competitor['name']}[/bold yellow]")
                 
-                try:
-                    # Directly invoke the tool
-                    result = self.agent.tool.analyze_website(
-                        competitor_name=competitor['name'],
-                        competitor_url=competitor['url']
-                    )
-                    console.print(f"[green]✓ {competitor['name']} analysis complete[/green]")
-                    console.print(f"[dim]Result: {result[:200]}...[/dim]" if len(result) > 200 else f"[dim]Result: {result}[/dim]")
+                    try:
+                        # Directly invoke the tool
+                        result = self.agent.tool.analyze_website(
+                            competitor_name=competitor['name'],
+                            competitor_url=competitor['url']
+                        )
+                        console.print(f"[green]✓ {competitor['name']} analysis complete[/green]")
+                        console.print(f"[dim]Result: {result[:200]}...[/dim]" if len(result) > 200 else f"[dim]Result: {result}[/dim]")
                     
-                    # Add a small delay between competitors to avoid overwhelming
-                    if i < len(competitors):
-                        console.print(f"[dim]Waiting 2 seconds before next competitor...[/dim]")
-                        await asyncio.sleep(2)
+                        # Add a small delay between competitors to avoid overwhelming
+                        if i < len(competitors):
+                            console.print(f"[dim]Waiting 2 seconds before next competitor...[/dim]")
+                            await asyncio.sleep(2)
                         
-                except Exception as comp_error:
-                    console.print(f"[red]❌ Error analyzing {competitor['name']}: {comp_error}[/red]")
-                    # Continue with next competitor even if one fails
-                    continue
+                    except Exception as comp_error:
+                        console.print(f"[red]❌ Error analyzing {competitor['name']}: {comp_error}[/red]")
+                        # Continue with next competitor even if one fails
+                        continue
             
             console.print("\n[bold cyan]All competitors analyzed, generating insights...[/bold cyan]")
             
@@ -1,6 +1,8 @@
 """Analysis tools using BedrockAgentCore SDK's CodeInterpreter."""
 
+import hashlib
 import json
+import re
 from typing import Dict, List, Any
 from rich.console import Console
 from datetime import datetime
@@ -10,6 +12,175 @@ from bedrock_agentcore.tools.code_interpreter_client import CodeInterpreter
 
 console = Console()
 
+# Prefix of the per-competitor result lines printed by COMPETITOR_ANALYSIS_CODE
+ANALYSIS_MARKER = "ANALYSIS_RESULT "
+
+VISUALIZATION_FILES = [
+    "visualizations/competitive_analysis_dashboard.png",
+    "analysis/comparison_matrix.csv"
+]
+
+# The code below runs after the data loader from _load_competitors_code, so it
+# only ever references the staged files by path, never inlines the data.
+COMPETITOR_ANALYSIS_CODE = """
+for competitor_name, competitor_data in all_data.items():
+    # Name output files after the staged file, whose name is already path-safe
+    data_file = competitor_files[competitor_name]
+    file_prefix = 'analysis/' + os.path.basename(data_file)[len('competitor_'):-len('.json')]
+    
+    # Create analysis summary
+    analysis = {
+        "competitor": competitor_name,
+        "analyzed_at": datetime.now().isoformat(),
+        "data_points_collected": {
+            "has_pricing": bool(competitor_data.get('pricing', {}).get('data')),
+            "has_features": bool(competitor_data.get('features', {}).get('data')),
+            "navigation_success": competitor_data.get('navigation', {}).get('status') == 'success',
+            "screenshots_taken": competitor_data.get('screenshots_taken', 0),
+            "pages_explored": len(competitor_data.get('additional_pages', [])),
+            "forms_found": len(competitor_data.get('interactive_elements', {}).get('forms', []))
+        }
+    }
+    
+    # Keep a copy of the raw data alongside the analysis
+    shutil.copyfile(data_file, f'{file_prefix}_raw_data.json')
+    
+    # Extract and analyze pricing if available
+    if competitor_data.get('pricing', {}).get('data'):
+        pricing_data = competitor_data['pricing']['data']
+        analysis['pricing_analysis'] = {
+            'data_length': len(str(pricing_data)),
+            'extracted_successfully': True
+        }
+        with open(f'{file_prefix}_pricing.txt', 'w') as f:
+            f.write(str(pricing_data))
+    
+    # Extract and analyze features if available
+    if competitor_data.get('features', {}).get('data'):
+        features_data = competitor_data['features']['data']
+        analysis['features_analysis'] = {
+            'data_length': len(str(features_data)),
+            'extracted_successfully': True
+        }
+        with open(f'{file_prefix}_features.txt', 'w') as f:
+            f.write(str(features_data))
+    
+    print("ANALYSIS_RESULT " + json.dumps(analysis))
+    
+    created_files = [
+        f'{file_prefix}_{file}' for file in ['raw_data.json', 'pricing.txt', 'features.txt']
+        if os.path.exists(f'{file_prefix}_{file}')
+    ]
+    print(f"Created {len(created_files)} analysis files for {competitor_name}:")
+    for file in created_files:
+        print(f"  - {file}")
+"""
+
+VISUALIZATION_CODE = """
+# Create figure
+fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+fig.suptitle('Competitive Intelligence Analysis - ' + datetime.now().strftime('%Y-%m-%d'), fontsize=16)
+
+# Prepare summary data
+competitors = list(all_data.keys())
+success_rates = []
+data_collected = []
+screenshots = []
+pages_explored = []
+
+for comp in competitors:
+    comp_data = all_data[comp]
+    # Success rate
+    success = 1 if comp_data.get('status') == 'success' else 0
+    success_rates.append(success)
+    
+    # Data collection
+    has_pricing = 1 if comp_data.get('pricing', {}).get('status') == 'success' else 0
+    has_features = 1 if comp_data.get('features', {}).get('status') == 'success' else 0
+    data_collected.append(has_pricing + has_features)
+    
+    # Screenshots
+    screenshots.append(comp_data.get('screenshots_taken', 0))
+    
+    # Pages explored
+    pages_explored.append(len(comp_data.get('additional_pages', [])))
+
+# Plot 1: Success Rate
+ax1 = axes[0, 0]
+ax1.bar(competitors, success_rates, color='green', alpha=0.7)
+ax1.set_title('Navigation Success Rate')
+ax1.set_ylabel('Success (1) / Failure (0)')
+ax1.set_ylim(0, 1.2)
+
+# Plot 2: Data Collection
+ax2 = axes[0, 1]
+ax2.bar(competitors, data_collected, color='blue', alpha=0.7)
+ax2.set_title('Data Points Collected')
+ax2.set_ylabel('Count (Pricing + Features)')
+ax2.set_ylim(0, 2.5)
+
+# Plot 3: Pages Explored
+ax3 = axes[1, 0]
+ax3.bar(competitors, pages_explored, color='orange', alpha=0.7)
+ax3.set_title('Additional Pages Explored')
+ax3.set_ylabel('Page Count')
+
+# Plot 4: Summary Table
+ax4 = axes[1, 1]
+ax4.axis('off')
+
+# Create summary table
+summary_data = []
+for comp in competitors:
+    comp_data = all_data[comp]
+    summary_data.append([
+        comp,
+        '✓' if comp_data.get('status') == 'success' else '✗',
+        '✓' if comp_data.get('pricing', {}).get('status') == 'success' else '✗',
+        str(len(comp_data.get('additional_pages', [])))
+    ])
+
+table = ax4.table(cellText=summary_data,
+                  colLabels=['Competitor', 'Nav', 'Pricing', 'Pages'],
+                  cellLoc='center',
+                  loc='center')
+table.auto_set_font_size(False)
+table.set_fontsize(10)
+table.scale(1, 2)
+
+plt.tight_layout()
+plt.savefig('visualizations/competitive_analysis_dashboard.png', dpi=300, bbox_inches='tight')
+plt.close()
+
+# Create detailed comparison matrix
+comparison_df = pd.DataFrame({
+    'Competitor': competitors,
+    'Navigation': ['Success' if all_data[c].get('status') == 'success' else 'Failed' for c in competitors],
+    'Pricing Data': ['Collected' if all_data[c].get('pricing', {}).get('status') == 'success' else 'Missing' for c in competitors],
+    'Features Data': ['Collected' if all_data[c].get('features', {}).get('status') == 'success' else 'Missing' for c in competitors],
+    'Screenshots': [all_data[c].get('screenshots_taken', 0) for c in competitors],
+    'Pages Explored': [len(all_data[c].get('additional_pages', [])) for c in competitors]
+})
+
+comparison_df.to_csv('analysis/comparison_matrix.csv', index=False)
+
+print(f"Visualizations created successfully!")
+print(f"Dashboard: visualizations/competitive_analysis_dashboard.png")
+print(f"Matrix: analysis/comparison_matrix.csv")
+print(f"Analyzed {len(competitors)} competitors")
+
+# Verify files were created
+created_files = []
+for file_pattern in ['visualizations/*.png', 'analysis/*.csv']:
+    for file_path in glob.glob(file_pattern):
+        if os.path.isfile(file_path):
+            created_files.append(file_path)
+            
+print(f"\\nVerified {len(created_files)} files were created:")
+for file in created_files:
+    print(f"  - {file}")
+"""
+
 
 class AnalysisTools:
     """Data analysis tools using BedrockAgentCore SDK's CodeInterpreter."""
@@ -18,6 +189,8 @@ class AnalysisTools:
         self.config = config
         self.code_interpreter = CodeInterpreter(config.region)
         self.session_active = False
+        # Staged data file path -> digest of its contents, to skip unchanged writes
+        self._staged_digests: Dict[str, str] = {}
 
     def _extract_output(self, result: Dict) -> str:
         """Extract output from CodeInterpreter result."""
@@ -52,6 +225,7 @@ class AnalysisTools:
         )
         
         self.session_active = True
+        self._staged_digests = {}
         console.print(f"✅ CodeInterpreter session: {session_id}")
         
         # Set up the analysis environment
@@ -99,6 +273,54 @@ except Exception as e:
         
         return session_id
     
+    def _write_files(self, files: Dict[str, str]):
+        """Write text files into the CodeInterpreter session in one call."""
+        result = self.code_interpreter.invoke("writeFiles", {
+            "content": [{"path": path, "text": text} for path, text in files.items()]
+        })
+        for event in result.get("stream", []):
+            if event.get("result", {}).get("isError"):
+                raise RuntimeError(self._extract_output({"stream": [event]}) or "writeFiles failed")
+        return result
+    
+    def _competitor_file(self, competitor_name: str) -> str:
+        """Path of a competitor's staged data file inside the session."""
+        return f"data/competitor_{re.sub(r'[^A-Za-z0-9_.-]', '_', competitor_name)}.json"
+    
+    def stage_competitor_data(self, competitor_name: str, data: Dict) -> bool:
+        """Write one competitor's data into the session, if it changed.
+        
+        Returns True when the file was written.
+        """
+        return bool(self._stage_competitors({competitor_name: data}, only_changed=True))
+    
+    def _stage_competitors(self, all_competitors_data: Dict, only_changed: bool = False) -> Dict[str, str]:
+        """Write competitor data files in one writeFiles call.
+        
+        Competitors whose data is unchanged since it was last staged are
+        skipped. Returns competitor name -> file path for every competitor,
+        or only the written ones when only_changed is set.
+        """
+        paths = {}
+        pending = {}
+        digests = {}
+        for name, data in all_competitors_data.items():
+            path = self._competitor_file(name)
+            text = json.dumps(self._make_serializable(data))
+            digest = hashlib.sha256(text.encode()).hexdigest()
+            if self._staged_digests.get(path) != digest:
+                pending[path] = text
+                digests[path] = digest
+                paths[name] = path
+            elif not only_changed:
+                paths[name] = path
+        
+        if pending:
+            console.print(f"[dim]Staging data for {len(pending)} competitor(s) in CodeInterpreter[/dim]")
+            self._write_files(pending)
+            self._staged_digests.update(digests)
+        return paths
+    
     def save_session_state(self, session_name: str, data: Dict) -> Dict:
         """NEW: Save session state for later resumption."""
         try:
@@ -106,48 +328,27 @@ except Exception as e:
 
             # Create a JSON-serializable copy of the data
             serializable_data = self._make_serializable(data)
+            session_text = json.dumps(serializable_data, indent=2)
             
-            save_code = f"""
-import json
-import os
-from datetime import datetime
-
-session_data = {json.dumps(serializable_data)}
-session_name = "{session_name}"
-
-# Create session metadata
-session_metadata = {{
-    "session_name": session_name,
-    "saved_at": datetime.now().isoformat(),
-    "data_size": len(json.dumps(session_data))
-}}
-
-# Save session data
-os.makedirs('sessions', exist_ok=True)
-session_file = f'sessions/{{session_name}}_data.json'
-with open(session_file, 'w') as f:
-    json.dump(session_data, f, indent=2)
-
-# Save metadata
-metadata_file = f'sessions/{{session_name}}_metadata.json'
-with open(metadata_file, 'w') as f:
-    json.dump(session_metadata, f, indent=2)
-
-print(f"Session saved: {{session_name}}")
-print(f"Data file: {{session_file}} ({{os.path.getsize(session_file)}} bytes)")
-print(f"Metadata file: {{metadata_file}}")
-
-# List all saved sessions
-all_sessions = [f.replace('_metadata.json', '') for f in os.listdir('sessions') if f.endswith('_metadata.json')]
-print(f"Total saved sessions: {{len(all_sessions)}}")
-"""
+            session_metadata = {
+                "session_name": session_name,
+                "saved_at": datetime.now().isoformat(),
+                "data_size": len(json.dumps(serializable_data))
+            }
             
-            result = self.code_interpreter.invoke("executeCode", {
-                "code": save_code,
-                "language": "python"
+            # Ship both files directly instead of generating code that embeds the data
+            session_file = f'sessions/{session_name}_data.json'
+            metadata_file = f'sessions/{session_name}_metadata.json'
+            self._write_files({
+                session_file: session_text,
+                metadata_file: json.dumps(session_metadata, indent=2)
             })
             
-            output = self._extract_output(result)
+            output = (
+                f"Session saved: {session_name}\n"
+                f"Data file: {session_file} ({len(session_text.encode())} bytes)\n"
+                f"Metadata file: {metadata_file}"
+            )
             
             return {
                 "status": "success",
@@ -439,76 +640,48 @@ print(json.dumps(insights, indent=2))
             console.print(f"[red]❌ Insights generation error: {e}[/red]")
             return {"status": "error", "error": str(e)}
     
-    def analyze_competitor_data(self, competitor_name: str, data: Dict) -> Dict:
-        """Analyze data for a specific competitor."""
-        try:
-            console.print(f"[cyan]📊 Analyzing {competitor_name}...[/cyan]")
-            
-            analysis_code = f"""
+    def _load_competitors_code(self, competitor_files: Dict[str, str]) -> str:
+        """Code that loads staged competitor files into all_data."""
+        return f"""
 import json
 import pandas as pd
-import os  # Make sure os is imported
+import matplotlib.pyplot as plt
+import seaborn as sns
+import os
+import glob
+import shutil
 from datetime import datetime
 
-# Load competitor data
-competitor_data = {json.dumps(data)}
-competitor_name = "{competitor_name}"
-
-# Create analysis summary
-analysis = {{
-    "competitor": competitor_name,
-    "analyzed_at": datetime.now().isoformat(),
-    "data_points_collected": {{
-        "has_pricing": bool(competitor_data.get('pricing', {{}}).get('data')),
-        "has_features": bool(competitor_data.get('features', {{}}).get('data')),
-        "navigation_success": competitor_data.get('navigation', {{}}).get('status') == 'success',
-        "screenshots_taken": competitor_data.get('screenshots_taken', 0),
-        "pages_explored": len(competitor_data.get('additional_pages', [])),
-        "forms_found": len(competitor_data.get('interactive_elements', {{}}).get('forms', []))
-    }}
-}}
-
-# Save raw data
-with open(f'analysis/{{competitor_name.replace(" ", "_")}}_raw_data.json', 'w') as f:
-    json.dump(competitor_data, f, indent=2)
-
-# Extract and analyze pricing if available
-if competitor_data.get('pricing', {{}}).get('data'):
-    pricing_data = competitor_data['pricing']['data']
-    analysis['pricing_analysis'] = {{
-        'data_length': len(str(pricing_data)),
-        'extracted_successfully': True
-    }}
+# Load staged competitor data files
+competitor_files = {json.dumps(competitor_files)}
+all_data = {{}}
+for name, data_file in competitor_files.items():
+    with open(data_file) as f:
+        all_data[name] = json.load(f)
+"""
     
-    # Save pricing data
-    with open(f'analysis/{{competitor_name.replace(" ", "_")}}_pricing.txt', 'w') as f:
-        f.write(str(pricing_data))
-
-# Extract and analyze features if available
-if competitor_data.get('features', {{}}).get('data'):
-    features_data = competitor_data['features']['data']
-    analysis['features_analysis'] = {{
-        'data_length': len(str(features_data)),
-        'extracted_successfully': True
-    }}
+    def _parse_analyses(self, output: str) -> Dict[str, Dict]:
+        """Collect per-competitor analysis results printed by COMPETITOR_ANALYSIS_CODE."""
+        analyses = {}
+        for line in output.split('\n'):
+            if line.startswith(ANALYSIS_MARKER):
+                try:
+                    analysis = json.loads(line[len(ANALYSIS_MARKER):])
+                    analyses[analysis["competitor"]] = analysis
+                except (ValueError, KeyError):
+                    continue
+        return analyses
     
-    # Save features data
-    with open(f'analysis/{{competitor_name.replace(" ", "_")}}_features.txt', 'w') as f:
-        f.write(str(features_data))
-
-print(json.dumps(analysis, indent=2))
-
-# Define created_files variable before using it
-created_files = []
-for file in ['raw_data.json', 'pricing.txt', 'features.txt']:
-    file_path = f'analysis/{{competitor_name.replace(" ", "_")}}_{{file}}'
-    if os.path.exists(file_path):
-        created_files.append(file_path)
-
-print(f"\\nCreated {{len(created_files)}} analysis files for {{competitor_name}}:")
-for file in created_files:
-    print(f"  - {{file}}")
-"""
+    def analyze_competitor_data(self, competitor_name: str, data: Dict) -> Dict:
+        """Analyze data for a specific competitor."""
+        try:
+            console.print(f"[cyan]📊 Analyzing {competitor_name}...[/cyan]")
+            
+            self._stage_competitors({competitor_name: data})
+            analysis_code = (
+                self._load_competitors_code({competitor_name: self._competitor_file(competitor_name)})
+                + COMPETITOR_ANALYSIS_CODE
+            )
             
             # Execute using SDK
             result = self.code_interpreter.invoke("executeCode", {
@@ -517,18 +690,7 @@ for file in created_files:
             })
             
             output = self._extract_output(result)
-            
-            try:
-                # Try to extract JSON from output
-                lines = output.split('\n')
-                for line in lines:
-                    if line.strip().startswith('{'):
-                        analysis_result = json.loads(line)
-                        break
-                else:
-                    analysis_result = {"raw_output": output}
-            except:
-                analysis_result = {"raw_output": output}
+            analysis_result = self._parse_analyses(output).get(competitor_name, {"raw_output": output})
             
             return {
                 "status": "success",
@@ -545,121 +707,8 @@ for file in created_files:
         try:
             console.print("[cyan]📈 Creating visualizations...[/cyan]")
             
-            viz_code = f"""
-import json
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import os
-import glob
-from datetime import datetime
-
-# Load all competitor data
-all_data = {json.dumps(all_competitors_data)}
-
-# Create figure
-fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-fig.suptitle('Competitive Intelligence Analysis - ' + datetime.now().strftime('%Y-%m-%d'), fontsize=16)
-
-# Prepare summary data
-competitors = list(all_data.keys())
-success_rates = []
-data_collected = []
-screenshots = []
-pages_explored = []
-
-for comp in competitors:
-    comp_data = all_data[comp]
-    # Success rate
-    success = 1 if comp_data.get('status') == 'success' else 0
-    success_rates.append(success)
-    
-    # Data collection
-    has_pricing = 1 if comp_data.get('pricing', {{}}).get('status') == 'success' else 0
-    has_features = 1 if comp_data.get('features', {{}}).get('status') == 'success' else 0
-    data_collected.append(has_pricing + has_features)
-    
-    # Screenshots
-    screenshots.append(comp_data.get('screenshots_taken', 0))
-    
-    # Pages explored
-    pages_explored.append(len(comp_data.get('additional_pages', [])))
-
-# Plot 1: Success Rate
-ax1 = axes[0, 0]
-ax1.bar(competitors, success_rates, color='green', alpha=0.7)
-ax1.set_title('Navigation Success Rate')
-ax1.set_ylabel('Success (1) / Failure (0)')
-ax1.set_ylim(0, 1.2)
-
-# Plot 2: Data Collection
-ax2 = axes[0, 1]
-ax2.bar(competitors, data_collected, color='blue', alpha=0.7)
-ax2.set_title('Data Points Collected')
-ax2.set_ylabel('Count (Pricing + Features)')
-ax2.set_ylim(0, 2.5)
-
-# Plot 3: Pages Explored
-ax3 = axes[1, 0]
-ax3.bar(competitors, pages_explored, color='orange', alpha=0.7)
-ax3.set_title('Additional Pages Explored')
-ax3.set_ylabel('Page Count')
-
-# Plot 4: Summary Table
-ax4 = axes[1, 1]
-ax4.axis('off')
-
-# Create summary table
-summary_data = []
-for comp in competitors:
-    comp_data = all_data[comp]
-    summary_data.append([
-        comp,
-        '✓' if comp_data.get('status') == 'success' else '✗',
-        '✓' if comp_data.get('pricing', {{}}).get('status') == 'success' else '✗',
-        str(len(comp_data.get('additional_pages', [])))
-    ])
-
-table = ax4.table(cellText=summary_data,
-                  colLabels=['Competitor', 'Nav', 'Pricing', 'Pages'],
-                  cellLoc='center',
-                  loc='center')
-table.auto_set_font_size(False)
-table.set_fontsize(10)
-table.scale(1, 2)
-
-plt.tight_layout()
-plt.savefig('visualizations/competitive_analysis_dashboard.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# Create detailed comparison matrix
-comparison_df = pd.DataFrame({{
-    'Competitor': competitors,
-    'Navigation': ['Success' if all_data[c].get('status') == 'success' else 'Failed' for c in competitors],
-    'Pricing Data': ['Collected' if all_data[c].get('pricing', {{}}).get('status') == 'success' else 'Missing' for c in competitors],
-    'Features Data': ['Collected' if all_data[c].get('features', {{}}).get('status') == 'success' else 'Missing' for c in competitors],
-    'Screenshots': [all_data[c].get('screenshots_taken', 0) for c in competitors],
-    'Pages Explored': [len(all_data[c].get('additional_pages', [])) for c in competitors]
-}})
-
-comparison_df.to_csv('analysis/comparison_matrix.csv', index=False)
-
-print(f"Visualizations created successfully!")
-print(f"Dashboard: visualizations/competitive_analysis_dashboard.png")
-print(f"Matrix: analysis/comparison_matrix.csv")
-print(f"Analyzed {{len(competitors)}} competitors")
-
-# Verify files were created
-created_files = []
-for file_pattern in ['visualizations/*.png', 'analysis/*.csv']:
-    for file_path in glob.glob(file_pattern):
-        if os.path.isfile(file_path):
-            created_files.append(file_path)
-            
-print(f"\\nVerified {{len(created_files)}} files were created:")
-for file in created_files:
-    print(f"  - {{file}}")
-"""
+            competitor_files = self._stage_competitors(all_competitors_data)
+            viz_code = self._load_competitors_code(competitor_files) + VISUALIZATION_CODE
             
             # Execute using SDK
             result = self.code_interpreter.invoke("executeCode", {
@@ -672,15 +721,58 @@ for file in created_files:
             return {
                 "status": "success",
                 "output": output,
-                "files_created": [
-                    "visualizations/competitive_analysis_dashboard.png",
-                    "analysis/comparison_matrix.csv"
-                ]
+                "files_created": VISUALIZATION_FILES
             }
             
         except Exception as e:
             console.print(f"[red]❌ Visualization error: {e}[/red]")
             return {"status": "error", "error": str(e)}
+    
+    def analyze_all_competitors(self, all_competitors_data: Dict) -> Dict:
+        """Analyze every competitor and build the visualizations in one execution.
+        
+        Returns per-competitor results shaped like analyze_competitor_data
+        under "analyses", and the create_comparison_visualization result
+        under "visualizations".
+        """
+        try:
+            console.print(f"[cyan]📊 Analyzing {len(all_competitors_data)} competitors and creating visualizations...[/cyan]")
+            
+            competitor_files = self._stage_competitors(all_competitors_data)
+            batch_code = (
+                self._load_competitors_code(competitor_files)
+                + COMPETITOR_ANALYSIS_CODE
+                + VISUALIZATION_CODE
+            )
+            
+            result = self.code_interpreter.invoke("executeCode", {
+                "code": batch_code,
+                "language": "python"
+            })
+            
+            output = self._extract_output(result)
+            analyses = self._parse_analyses(output)
+            
+            return {
+                "status": "success",
+                "analyses": {
+                    name: {
+                        "status": "success" if name in analyses else "error",
+                        "analysis": analyses.get(name, {"raw_output": output}),
+                        "competitor": name
+                    }
+                    for name in all_competitors_data
+                },
+                "visualizations": {
+                    "status": "success",
+                    "output": output,
+                    "files_created": VISUALIZATION_FILES
+                }
+            }
+            
+        except Exception as e:
+            console.print(f"[red]❌ Batch analysis error: {e}[/red]")
+            return {"status": "error", "error": str(e)}
 
     def _extract_file_content(self, result: Dict) -> str:
         """Extract file content from readFiles result."""
@@ -755,6 +847,7 @@ else:
             console.print(f"[dim]Test output: {test_output}[/dim]")
             
             # Now create the full report
+            competitor_files = self._stage_competitors(all_data)
             report_code = f'''
 import json
 import os
@@ -786,8 +879,10 @@ This report analyzes {len(all_data)} competitor websites, examining their pricin
 ## Detailed Competitor Analysis
 """
 
-# Add sections for each competitor
-for competitor, data in {json.dumps(all_data)}.items():
+# Add sections for each competitor, read from the staged data files
+for competitor, data_file in {json.dumps(competitor_files)}.items():
+    with open(data_file) as f:
+        data = json.load(f)
     report_content += f"### {{competitor}}\\n\\n"
     report_content += f"**Website:** {{data.get('url', 'N/A')}}  \\n"
     report_content += f"**Status:** {{data.get('status', 'Unknown')}}  \\n"
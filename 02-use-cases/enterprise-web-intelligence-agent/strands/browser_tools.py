@@ -1,6 +1,8 @@
 """Browser automation tools using BedrockAgentCore SDK with Playwright and CDP enhancements."""
 
 import asyncio
+import hashlib
+import time
 import uuid
 import json
 from typing import Dict, List, Optional, Any
@@ -18,6 +20,41 @@ from bedrock_agentcore._utils.endpoints import get_control_plane_endpoint
 console = Console()
 
 
+class PageCache:
+    """Per-run cache of extraction results, keyed by URL and page content hash.
+    
+    A result is reused only while the page text it was computed from is
+    unchanged and it is younger than the TTL, so revisiting a page skips the
+    scrolling and LLM extraction without serving stale data.
+    """
+    
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def content_hash(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8', 'replace')).hexdigest()
+    
+    def get(self, kind: str, url: str, content_hash: Optional[str] = None) -> Optional[Dict]:
+        entry = self._entries.get((kind, url))
+        if (entry and entry['content_hash'] == content_hash
+                and time.monotonic() - entry['stored_at'] < self.ttl_seconds):
+            self.hits += 1
+            return {**entry['value'], "cached": True}
+        self.misses += 1
+        return None
+    
+    def put(self, kind: str, url: str, value: Dict, content_hash: Optional[str] = None):
+        self._entries[(kind, url)] = {
+            'content_hash': content_hash,
+            'value': value,
+            'stored_at': time.monotonic()
+        }
+
+
 class BrowserTools:
     """Enhanced browser automation tools with CDP capabilities."""
     
@@ -35,6 +72,8 @@ class BrowserTools:
         self._screenshots_taken = []
         self._discovered_apis = []
         self._performance_metrics = {}
+        self._owns_session = True
+        self.page_cache = PageCache(config.page_cache_ttl_seconds)
     
     def create_browser_with_recording(self) -> str:
         """Create a browser with recording configuration using Control Plane API."""
@@ -143,6 +182,36 @@ class BrowserTools:
         
         return self.page
     
+    async def open_worker_page(self) -> "BrowserTools":
+        """Open a new tab in this browser session as a separate BrowserTools.
+
+        The worker shares the session, and so its recording and live view, but
+        has its own page, CDP session, screenshots and discovered APIs, so
+        several sites can be analyzed concurrently. Its cleanup() only closes
+        the tab.
+        """
+        worker = BrowserTools(self.config)
+        worker._owns_session = False
+        worker.browser_client = self.browser_client
+        worker.browser_id = self.browser_id
+        worker.browser = self.browser
+        worker.context = self.context
+        worker.llm = self.llm
+        worker.recording_path = self.recording_path
+        worker.recording_config = getattr(self, 'recording_config', None)
+        worker.page_cache = self.page_cache
+        worker.page = await self.context.new_page()
+        
+        try:
+            worker.cdp_session = await self.context.new_cdp_session(worker.page)
+            await worker._setup_cdp_domains()
+        except Exception as e:
+            console.print(f"[yellow]⚠️ CDP setup partial for worker tab: {e}[/yellow]")
+            worker.cdp_session = None
+        
+        await worker._setup_network_interception()
+        return worker
+    
     async def _setup_cdp_domains(self):
         """Enable CDP domains for advanced features."""
         if not self.cdp_session:
@@ -188,6 +257,24 @@ class BrowserTools:
         # Set up response handler
         self.page.on("response", handle_response)
     
+    async def wait_for_page_ready(self, page: Optional[Page] = None):
+        """Wait until the page has loaded and its network has gone quiet.
+        
+        Replaces fixed sleeps: returns as soon as the page is idle, and gives
+        up after config.page_ready_timeout_ms on sites that keep connections
+        open (analytics, websockets).
+        """
+        page = page or self.page
+        try:
+            await page.wait_for_load_state("load", timeout=self.config.page_ready_timeout_ms)
+            await page.wait_for_load_state("networkidle", timeout=self.config.page_ready_timeout_ms)
+        except Exception:
+            pass
+    
+    async def _get_page_text(self) -> str:
+        """Return the page's visible text"""
+        return await self.page.evaluate("() => document.body ? document.body.innerText : ''")
+    
     async def navigate_to_url(self, url: str) -> Dict:
         """Navigate to URL with enhanced visual feedback."""
         try:
@@ -197,7 +284,7 @@ class BrowserTools:
             await self.page.goto(url, wait_until="domcontentloaded", timeout=60000)
             
             # Wait for dynamic content
-            await self.page.wait_for_timeout(3000)
+            await self.wait_for_page_ready()
             
             # Get page metrics if CDP is available
             if self.cdp_session:
@@ -343,11 +430,15 @@ class BrowserTools:
             return {"status": "error", "error": str(e)}
     
     async def explore_multi_page_workflow(self, target_pages: List[str]) -> List[Dict]:
-        """NEW: Explore multiple pages in a workflow."""
+        """NEW: Explore multiple pages in a workflow.
+        
+        Each sub-page found from the current page is opened in its own tab, so
+        the current page never has to be reloaded between targets. Sub-pages
+        already explored during this run are reused from the page cache.
+        """
         console.print(f"[cyan]🔄 Exploring {len(target_pages)} additional pages...[/cyan]")
         
         explored_pages = []
-        base_url = self.page.url
         
         for target in target_pages:
             try:
@@ -366,30 +457,24 @@ class BrowserTools:
                 for selector in selectors:
                     try:
                         link = await self.page.query_selector(selector)
-                        if link:
-                            await link.click()
-                            await self.page.wait_for_load_state("domcontentloaded")
-                            await self.page.wait_for_timeout(2000)
-                            
-                            # Capture information about this page
-                            page_info = {
-                                "target": target,
-                                "url": self.page.url,
-                                "title": await self.page.title(),
-                                "found": True,
-                                "timestamp": datetime.now().isoformat()
-                            }
-                            
-                            # Take a screenshot
-                            await self.take_annotated_screenshot(f"Explored - {target}")
-                            
-                            explored_pages.append(page_info)
-                            console.print(f"[green]✅ Found and explored: {target}[/green]")
-                            link_found = True
-                            
-                            # Go back to base URL for next exploration
-                            await self.page.goto(base_url, wait_until="domcontentloaded")
-                            break
+                        if not link:
+                            continue
+                        
+                        href = await link.evaluate("a => a.href || ''")
+                        if not href.startswith(('http://', 'https://')):
+                            continue
+                        
+                        page_info = self.page_cache.get("subpage", href)
+                        if page_info:
+                            page_info["target"] = target
+                        else:
+                            page_info = await self._explore_in_new_tab(target, href)
+                            self.page_cache.put("subpage", href, page_info)
+                        
+                        explored_pages.append(page_info)
+                        console.print(f"[green]✅ Found and explored: {target}[/green]")
+                        link_found = True
+                        break
                     except:
                         continue
                 
@@ -411,6 +496,28 @@ class BrowserTools:
         
         return explored_pages
     
+    async def _explore_in_new_tab(self, target: str, url: str) -> Dict:
+        """Open a sub-page in a new tab, capture it and close the tab."""
+        tab = await self.context.new_page()
+        try:
+            await tab.goto(url, wait_until="domcontentloaded", timeout=self.config.browser_timeout)
+            await self.wait_for_page_ready(tab)
+            
+            # Capture information about this page
+            page_info = {
+                "target": target,
+                "url": tab.url,
+                "title": await tab.title(),
+                "found": True,
+                "timestamp": datetime.now().isoformat()
+            }
+            
+            # Take a screenshot
+            await self.take_annotated_screenshot(f"Explored - {target}", page=tab)
+            return page_info
+        finally:
+            await tab.close()
+    
     async def execute_javascript_analysis(self, custom_script: Optional[str] = None) -> Dict:
         """NEW: Execute custom JavaScript for advanced analysis."""
         console.print("[cyan]⚡ Executing JavaScript analysis...[/cyan]")
@@ -479,9 +586,8 @@ class BrowserTools:
             for position in scroll_positions:
                 current_position = int(page_height * position)
                 
-                # Smooth scroll
-                await self.page.evaluate(f"window.scrollTo({{top: {current_position}, behavior: 'smooth'}})")
-                await asyncio.sleep(1)  # Pause to load content
+                # Smooth scroll, continuing once it has finished
+                await self._scroll_to(current_position)
                 
                 # Look for important sections at this position
                 important_selectors = [
@@ -510,14 +616,28 @@ class BrowserTools:
                         pass
             
             # Scroll back to top
-            await self.page.evaluate("window.scrollTo({top: 0, behavior: 'smooth'})")
-            await asyncio.sleep(1)
+            await self._scroll_to(0)
             
         except Exception as e:
             console.print(f"[yellow]⚠️ Discovery error: {e}[/yellow]")
         
         return discovered_sections
     
+    async def _scroll_to(self, top: int):
+        """Smooth-scroll to a position and resolve when scrolling ends (at most 1s)."""
+        await self.page.evaluate("""
+            (top) => new Promise(resolve => {
+                const target = Math.min(top, document.documentElement.scrollHeight - window.innerHeight);
+                if (Math.abs(window.scrollY - Math.max(target, 0)) < 1) {
+                    resolve();
+                    return;
+                }
+                window.addEventListener('scrollend', () => resolve(), { once: true });
+                setTimeout(resolve, 1000);
+                window.scrollTo({ top, behavior: 'smooth' });
+            })
+        """, top)
+    
     async def smart_navigation(self, target: str) -> bool:
         """Try to navigate to specific page sections (pricing, features, etc)."""
         console.print(f"[cyan]🎯 Looking for {target} page...[/cyan]")
@@ -561,6 +681,14 @@ class BrowserTools:
         try:
             console.print("[cyan]💰 Extracting pricing information...[/cyan]")
             
+            # Reuse the previous extraction if this page's content is unchanged
+            text_content = await self._get_page_text()
+            content_hash = self.page_cache.content_hash(text_content)
+            cached = self.page_cache.get("pricing", self.page.url, content_hash)
+            if cached:
+                console.print("[dim]💾 Pricing unchanged since last visit, using cached extraction[/dim]")
+                return cached
+            
             # First do intelligent scroll to find pricing sections
             discovered = await self.intelligent_scroll_and_discover()
             
@@ -582,11 +710,12 @@ class BrowserTools:
                             found_elements.append(text.strip())
                 except:
                     pass
-            
-            # Get text content - LIMIT TO PREVENT TOKEN OVERFLOW
-            text_content = await self.page.evaluate("() => document.body.innerText")
-            
-            # Truncate to avoid token limits
+
+            # Re-read after scrolling so lazy-loaded pricing sections reach the LLM;
+            # the pre-scroll hash stays the cache key to match the lookup above
+            text_content = await self._get_page_text()
+
+            # LIMIT TEXT CONTENT TO PREVENT TOKEN OVERFLOW
             max_chars = 10000
             if len(text_content) > max_chars:
                 text_content = text_content[:max_chars]
@@ -628,7 +757,9 @@ class BrowserTools:
             }
             
             try:
-                response = bedrock_client.invoke_model(
+                # Run the blocking call in a thread so concurrent site analyses overlap
+                response = await asyncio.to_thread(
+                    bedrock_client.invoke_model,
                     modelId=self.config.llm_model_id,
                     body=json.dumps(native_request)
                 )
@@ -636,7 +767,7 @@ class BrowserTools:
                 model_response = json.loads(response["body"].read())
                 response_text = model_response["content"][0]["text"]
                 
-                return {
+                result = {
                     "status": "success",
                     "data": response_text,
                     "visual_elements": found_elements[:20],
@@ -644,6 +775,8 @@ class BrowserTools:
                     "url": self.page.url,
                     "extracted_at": datetime.now().isoformat()
                 }
+                self.page_cache.put("pricing", result["url"], result, content_hash)
+                return result
                 
             except Exception as llm_error:
                 console.print(f"[yellow]⚠️ LLM error, using fallback extraction: {llm_error}[/yellow]")
@@ -669,9 +802,15 @@ class BrowserTools:
         try:
             console.print("[cyan]🔍 Extracting product features...[/cyan]")
             
-            # Get text content - LIMITED
-            text_content = await self.page.evaluate("() => document.body.innerText")
+            # Reuse the previous extraction if this page's content is unchanged
+            text_content = await self._get_page_text()
+            content_hash = self.page_cache.content_hash(text_content)
+            cached = self.page_cache.get("features", self.page.url, content_hash)
+            if cached:
+                console.print("[dim]💾 Features unchanged since last visit, using cached extraction[/dim]")
+                return cached
             
+            # LIMIT TEXT CONTENT
             max_chars = 8000
             if len(text_content) > max_chars:
                 text_content = text_content[:max_chars]
@@ -708,7 +847,9 @@ class BrowserTools:
             }
             
             try:
-                response = bedrock_client.invoke_model(
+                # Run the blocking call in a thread so concurrent site analyses overlap
+                response = await asyncio.to_thread(
+                    bedrock_client.invoke_model,
                     modelId=self.config.llm_model_id,
                     body=json.dumps(native_request)
                 )
@@ -716,12 +857,14 @@ class BrowserTools:
                 model_response = json.loads(response["body"].read())
                 response_text = model_response["content"][0]["text"]
                 
-                return {
+                result = {
                     "status": "success",
                     "data": response_text,
                     "url": self.page.url,
                     "extracted_at": datetime.now().isoformat()
                 }
+                self.page_cache.put("features", result["url"], result, content_hash)
+                return result
                 
             except Exception as llm_error:
                 console.print(f"[yellow]⚠️ LLM error, using fallback: {llm_error}[/yellow]")
@@ -738,14 +881,15 @@ class BrowserTools:
             console.print(f"[red]❌ Feature extraction error: {e}[/red]")
             return {"status": "error", "error": str(e)}
     
-    async def take_annotated_screenshot(self, description: str = "") -> Dict:
-        """Take screenshot with annotation overlay."""
+    async def take_annotated_screenshot(self, description: str = "", page: Optional[Page] = None) -> Dict:
+        """Take screenshot with annotation overlay (of the current page unless `page` is given)."""
+        page = page or self.page
         try:
             console.print(f"[cyan]📸 Taking screenshot: {description}[/cyan]")
             
             # Add annotation to the page (safe way without innerHTML)
             if description:
-                await self.page.evaluate(f"""
+                await page.evaluate(f"""
                     () => {{
                         const annotation = document.createElement('div');
                         annotation.id = 'screenshot-annotation';
@@ -756,14 +900,16 @@ class BrowserTools:
                 """)
             
             # Take screenshot
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            screenshot_path = f"screenshot_{timestamp}.png"
+            # Microseconds plus a short uuid keep concurrent worker tabs from
+            # overwriting each other's screenshots
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            screenshot_path = f"screenshot_{timestamp}_{uuid.uuid4().hex[:8]}.png"
             
-            await self.page.screenshot(path=screenshot_path, full_page=False)
+            await page.screenshot(path=screenshot_path, full_page=False)
             
             # Remove annotation
             if description:
-                await self.page.evaluate("""
+                await page.evaluate("""
                     () => {
                         const annotation = document.getElementById('screenshot-annotation');
                         if (annotation) annotation.remove();
@@ -773,7 +919,7 @@ class BrowserTools:
             screenshot_info = {
                 "description": description,
                 "timestamp": datetime.now().isoformat(),
-                "url": self.page.url,
+                "url": page.url,
                 "path": screenshot_path
             }
             self._screenshots_taken.append(screenshot_info)
@@ -826,6 +972,15 @@ class BrowserTools:
             except:
                 pass
         
+        if not self._owns_session:
+            # Worker tab: the shared browser session is cleaned up by its owner
+            if self.page:
+                try:
+                    await self.page.close()
+                except Exception:
+                    pass
+            return
+        
         if self.browser:
             console.print("[yellow]🎭 Closing browser...[/yellow]")
             await self.browser.close()
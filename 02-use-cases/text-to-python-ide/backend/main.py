@@ -12,6 +12,15 @@ from botocore.exceptions import NoCredentialsError, ProfileNotFound
 from botocore.config import Config
 from contextlib import asynccontextmanager
 import time
+import re
+import base64
+import hashlib
+import threading
+import contextvars
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import lru_cache
 
 # Load environment variables
@@ -120,7 +129,7 @@ except ImportError:
         raise
 
 # Import AgentCore for code interpreter
-from bedrock_agentcore.tools.code_interpreter_client import code_session
+from bedrock_agentcore.tools.code_interpreter_client import code_session, CodeInterpreter
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -128,9 +137,11 @@ async def lifespan(app: FastAPI):
     global aws_session, aws_region
     aws_session, aws_region = setup_aws_credentials()
     initialize_agents()
+    sandbox_pool.start()
     yield
-    # Shutdown (if needed)
-    pass
+    # Shutdown
+    agent_workers.shutdown()
+    sandbox_pool.shutdown()
 
 app = FastAPI(
     title="AgentCore Code Interpreter", 
@@ -168,115 +179,962 @@ class FileUploadRequest(BaseModel):
     content: str
     session_id: Optional[str] = None
 
+# Session store configuration
+SESSION_MAX_COUNT = int(os.getenv('SESSION_MAX_COUNT', '200'))
+SESSION_IDLE_TTL = int(os.getenv('SESSION_IDLE_TTL', '3600'))
+SESSION_MAX_MEMORY_MB = int(os.getenv('SESSION_MAX_MEMORY_MB', '256'))
+SESSION_MAX_HISTORY = int(os.getenv('SESSION_MAX_HISTORY', '100'))
+SESSION_SPILL_DIR = os.getenv('SESSION_SPILL_DIR', '')
+SESSION_FILE_SPILL_BYTES = int(os.getenv('SESSION_FILE_SPILL_BYTES', '262144'))
+
+HISTORY_FIELDS = ('conversation_history', 'code_history', 'execution_results')
+
+def estimate_size(value) -> int:
+    """Approximate memory held by session data, counting string payloads"""
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(len(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(v) for v in value)
+    return 8
+
 # Session management
 class CodeInterpreterSession:
+    """State of one IDE session
+
+    History lists are capped at SESSION_MAX_HISTORY entries each; older
+    entries are appended to a JSONL file under SESSION_SPILL_DIR when it is
+    set and dropped otherwise. Uploaded CSV files larger than
+    SESSION_FILE_SPILL_BYTES are likewise kept on disk and read back on use.
+    memory_bytes tracks the approximate size of what stays in memory.
+    """
+
     def __init__(self, session_id: str):
         self.session_id = session_id
         self.conversation_history = []
         self.code_history = []
         self.execution_results = []
         self.interactive_sessions = {}  # Track interactive execution sessions
-        self.uploaded_csv = None  # Store uploaded CSV file data
+        self.created_at = time.time()
+        self.last_access = self.created_at
+        self.memory_bytes = 0
+        self.archived_entries = 0
+        self._uploaded_csv = None  # Store uploaded CSV file data
+        self.csv_spilled = False
+
+    @property
+    def spill_dir(self) -> Optional[str]:
+        if not SESSION_SPILL_DIR:
+            return None
+        # Session ids come from clients, so never use them as path components
+        return os.path.join(SESSION_SPILL_DIR, hashlib.sha256(self.session_id.encode()).hexdigest()[:32])
+
+    def add_history(self, field: str, entry):
+        """Append to a history list, archiving the oldest entries beyond the cap"""
+        items = getattr(self, field)
+        items.append(entry)
+        self.memory_bytes += estimate_size(entry)
+
+        overflow = len(items) - SESSION_MAX_HISTORY
+        if overflow > 0:
+            archived = items[:overflow]
+            del items[:overflow]
+            self.memory_bytes -= estimate_size(archived)
+            self.archived_entries += overflow
+            self._spill_history(field, archived)
+
+    def _spill_history(self, field: str, entries: list):
+        spill_dir = self.spill_dir
+        if not spill_dir:
+            return
+        try:
+            os.makedirs(spill_dir, exist_ok=True)
+            with open(os.path.join(spill_dir, f"{field}.jsonl"), 'a') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, default=str) + "\n")
+        except OSError as e:
+            print(f"⚠️  Could not archive {field} for session {self.session_id}: {e}")
+
+    def load_archived(self, field: str) -> list:
+        """Read back history entries archived to disk"""
+        spill_dir = self.spill_dir
+        path = os.path.join(spill_dir, f"{field}.jsonl") if spill_dir else None
+        if not path or not os.path.exists(path):
+            return []
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    @property
+    def csv_meta(self) -> Optional[dict]:
+        """Uploaded CSV details without reading a spilled file back from disk"""
+        return self._uploaded_csv
+
+    @property
+    def uploaded_csv(self) -> Optional[dict]:
+        # Reads a spilled file on every access; callers should keep the result
+        if self._uploaded_csv is None or not self.csv_spilled:
+            return self._uploaded_csv
+        with open(os.path.join(self.spill_dir, 'uploaded.csv')) as f:
+            return {**self._uploaded_csv, 'content': f.read()}
+
+    @uploaded_csv.setter
+    def uploaded_csv(self, value: Optional[dict]):
+        if self._uploaded_csv is not None and not self.csv_spilled:
+            self.memory_bytes -= estimate_size(self._uploaded_csv)
+        self._uploaded_csv = None
+        self.csv_spilled = False
+        if value is None:
+            if self.spill_dir:
+                try:
+                    os.remove(os.path.join(self.spill_dir, 'uploaded.csv'))
+                except OSError:
+                    pass
+            return
+
+        content = value.get('content', '')
+        if self.spill_dir and len(content.encode('utf-8')) > SESSION_FILE_SPILL_BYTES:
+            try:
+                os.makedirs(self.spill_dir, exist_ok=True)
+                with open(os.path.join(self.spill_dir, 'uploaded.csv'), 'w') as f:
+                    f.write(content)
+                self._uploaded_csv = {k: v for k, v in value.items() if k != 'content'}
+                self.csv_spilled = True
+                return
+            except OSError as e:
+                print(f"⚠️  Could not spill CSV for session {self.session_id}, keeping it in memory: {e}")
+        self._uploaded_csv = value
+        self.memory_bytes += estimate_size(value)
+
+    def discard_spilled(self):
+        """Remove everything this session wrote to disk"""
+        if self.spill_dir:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+class SessionStore:
+    """LRU/TTL store of IDE sessions with memory accounting
+
+    Sessions are kept in last-access order. Each lookup first drops sessions
+    idle for longer than SESSION_IDLE_TTL, then evicts the least recently
+    used ones while there are more than SESSION_MAX_COUNT sessions or their
+    tracked memory exceeds SESSION_MAX_MEMORY_MB. Evicting a session also
+    stops its warm sandbox and removes its spilled files.
+    """
+
+    def __init__(self):
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'created': 0, 'evicted_idle': 0, 'evicted_lru': 0, 'evicted_memory': 0}
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def memory_bytes(self) -> int:
+        with self._lock:
+            return sum(s.memory_bytes for s in self._sessions.values())
+
+    def get(self, session_id: str) -> Optional[CodeInterpreterSession]:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._touch_locked(session)
+            return session
+
+    def get_or_create(self, session_id: str) -> CodeInterpreterSession:
+        with self._lock:
+            evicted = self._expire_idle_locked()
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = CodeInterpreterSession(session_id)
+                self._sessions[session_id] = session
+                self._stats['created'] += 1
+            self._touch_locked(session)
+            evicted += self._enforce_limits_locked()
+        self._release(evicted)
+        return session
+
+    def remove(self, session_id: str):
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is not None:
+            self._release([session])
+
+    def _touch_locked(self, session: CodeInterpreterSession):
+        session.last_access = time.time()
+        self._sessions.move_to_end(session.session_id)
+
+    def _expire_idle_locked(self) -> list:
+        evicted = []
+        cutoff = time.time() - SESSION_IDLE_TTL
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if session.last_access > cutoff:
+                break
+            evicted.append(self._sessions.popitem(last=False)[1])
+            self._stats['evicted_idle'] += 1
+        return evicted
+
+    def _enforce_limits_locked(self) -> list:
+        evicted = []
+        max_bytes = SESSION_MAX_MEMORY_MB * 1024 * 1024
+        total_bytes = sum(s.memory_bytes for s in self._sessions.values())
+        # Never evict the most recently used session, which the caller is about to use
+        while len(self._sessions) > 1:
+            if len(self._sessions) > SESSION_MAX_COUNT:
+                self._stats['evicted_lru'] += 1
+            elif total_bytes > max_bytes:
+                self._stats['evicted_memory'] += 1
+            else:
+                break
+            session = self._sessions.popitem(last=False)[1]
+            total_bytes -= session.memory_bytes
+            evicted.append(session)
+        return evicted
+
+    def _release(self, sessions: list):
+        for session in sessions:
+            print(f"🗑️ Evicting session {session.session_id}")
+            session.discard_spilled()
+            # Stopping a sandbox is a network call; keep it off the request path
+            threading.Thread(target=sandbox_pool.evict, args=(session.session_id,), daemon=True).start()
+
+    def stats(self) -> dict:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            stats = dict(self._stats)
+        now = time.time()
+        largest = sorted(sessions, key=lambda s: s.memory_bytes, reverse=True)[:5]
+        return {
+            'active_sessions': len(sessions),
+            'max_sessions': SESSION_MAX_COUNT,
+            'memory_bytes': sum(s.memory_bytes for s in sessions),
+            'max_memory_bytes': SESSION_MAX_MEMORY_MB * 1024 * 1024,
+            'history_entries': sum(len(getattr(s, field)) for s in sessions for field in HISTORY_FIELDS),
+            'archived_entries': sum(s.archived_entries for s in sessions),
+            'spilled_files': sum(1 for s in sessions if s.csv_spilled),
+            'spill_dir': SESSION_SPILL_DIR or None,
+            'largest_sessions': [{
+                'session_id': s.session_id,
+                'memory_bytes': s.memory_bytes,
+                'idle_seconds': round(now - s.last_access, 1)
+            } for s in largest],
+            **stats
+        }
 
 # Global variables for agents
 code_generator_agent = None
 code_executor_agent = None
 executor_type = "unknown"  # Track which executor type we're using
-active_sessions = {}
+active_sessions = SessionStore()
+
+# Warm sandbox pool configuration
+AGENTCORE_SESSION_TIMEOUT = int(os.getenv('AGENTCORE_SESSION_TIMEOUT', '1800'))
+SANDBOX_POOL_MAX_SIZE = int(os.getenv('SANDBOX_POOL_MAX_SIZE', '10'))
+SANDBOX_IDLE_TIMEOUT = int(os.getenv('SANDBOX_IDLE_TIMEOUT', '600'))
+SANDBOX_KEEPALIVE_INTERVAL = int(os.getenv('SANDBOX_KEEPALIVE_INTERVAL', '240'))
+
+# IDE session whose sandbox the execute_python_code tool should use
+current_sandbox_key = contextvars.ContextVar('current_sandbox_key', default=None)
+
+def get_invoke_error(event: dict) -> Optional[str]:
+    """Return the error text of an AgentCore stream event, or None"""
+    result = event.get("result", {})
+    if not result.get("isError", False):
+        return None
+    error_content = result.get("content", [{}])
+    return error_content[0].get("text", "Unknown error") if error_content else "Unknown error"
+
+class WarmSandbox:
+    """A started AgentCore code interpreter session reused across executions"""
+
+    def __init__(self, key: Optional[str]):
+        self.key = key
+        self.client = CodeInterpreter(aws_region)
+        self.client.start(session_timeout_seconds=AGENTCORE_SESSION_TIMEOUT)
+        self.lock = threading.Lock()  # One execution at a time per sandbox
+        self.retired = False  # Evicted while in use; stopped when released
+        self.file_hashes = {}  # path -> sha256 of the content written
+        self.executions = 0
+        self.created_at = time.time()
+        self.last_used = self.created_at
+
+    @property
+    def expires_soon(self) -> bool:
+        # Recycle before AgentCore ends the session on its own
+        return time.time() - self.created_at > AGENTCORE_SESSION_TIMEOUT - SANDBOX_KEEPALIVE_INTERVAL
+
+    def write_files(self, files: list) -> Optional[str]:
+        """Write files whose content changed since the last upload; returns error text or None"""
+        changed = []
+        hashes = {}
+        for file_info in files:
+            path = file_info.get('filename', 'uploaded_file.csv')
+            content = file_info.get('content', '')
+            digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            if self.file_hashes.get(path) != digest:
+                changed.append({"path": path, "text": content})
+                hashes[path] = digest
+
+        if not changed:
+            print(f"📁 {len(files)} files already in sandbox, skipping upload")
+            sandbox_pool.record('uploads_skipped', len(files))
+            return None
+
+        print(f"📁 Uploading {len(changed)} of {len(files)} files to sandbox...")
+        upload_response = self.client.invoke("writeFiles", {"content": changed})
+        for event in upload_response["stream"]:
+            error_text = get_invoke_error(event)
+            if error_text:
+                print(f"❌ File upload error: {error_text}")
+                return error_text
+            for item in event.get("result", {}).get("content", []):
+                if item.get("type") == "text":
+                    print(f"✅ File upload: {item.get('text', '')}")
+
+        self.file_hashes.update(hashes)
+        sandbox_pool.record('uploads_written', len(changed))
+        sandbox_pool.record('uploads_skipped', len(files) - len(changed))
+        return None
+
+    def stop(self):
+        try:
+            self.client.stop()
+        except Exception as e:
+            print(f"⚠️  Failed to stop sandbox for {self.key}: {e}")
+
+class SandboxPool:
+    """Warm AgentCore sandboxes, one per IDE session, with idle eviction and a size cap
+
+    Keeping a started sandbox per CodeInterpreterSession avoids the session
+    start/stop round trips on every execution and preserves interpreter state
+    and uploaded files between runs. Sandboxes idle for longer than
+    SANDBOX_IDLE_TIMEOUT are stopped, the least recently used idle sandbox is
+    evicted when SANDBOX_POOL_MAX_SIZE is reached, and a maintenance thread
+    pings idle sandboxes every SANDBOX_KEEPALIVE_INTERVAL seconds.
+    """
+
+    def __init__(self):
+        self._sandboxes = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._stats = {
+            'hits': 0,
+            'cold_starts': 0,
+            'evictions': 0,
+            'overflow_sessions': 0,
+            'uploads_written': 0,
+            'uploads_skipped': 0
+        }
+
+    def record(self, name: str, count: int = 1):
+        with self._lock:
+            self._stats[name] += count
+
+    @contextmanager
+    def sandbox(self, key: Optional[str]):
+        """Yield a warm sandbox for an IDE session, holding it for exclusive use
+
+        Without a key, or when every pooled sandbox is busy and the pool is
+        full, a one-off sandbox is started and stopped after use.
+        """
+        sandbox = self._checkout(key) if key else None
+        if sandbox is None:
+            self.record('overflow_sessions')
+            sandbox = WarmSandbox(key)
+            try:
+                yield sandbox
+            finally:
+                sandbox.stop()
+            return
+
+        try:
+            yield sandbox
+        except Exception:
+            # The sandbox may have expired or failed; start fresh next time
+            self.evict(key, sandbox)
+            raise
+        finally:
+            sandbox.last_used = time.time()
+            if sandbox.retired:
+                self.evict(key, sandbox)
+            sandbox.lock.release()
+
+    def _checkout(self, key: str) -> Optional[WarmSandbox]:
+        with self._lock:
+            sandbox = self._sandboxes.get(key)
+        if sandbox is not None:
+            # Waits while another execution of the same session is running
+            sandbox.lock.acquire()
+            with self._lock:
+                usable = (self._sandboxes.get(key) is sandbox
+                          and not sandbox.expires_soon and not sandbox.retired)
+                if usable:
+                    self._stats['hits'] += 1
+                    return sandbox
+                if self._sandboxes.get(key) is sandbox:
+                    del self._sandboxes[key]
+                    self._stats['evictions'] += 1
+                    stale = sandbox
+                else:
+                    stale = None  # Evicted while we waited
+            sandbox.lock.release()
+            if stale is not None:
+                stale.stop()
+
+        with self._lock:
+            if len(self._sandboxes) >= SANDBOX_POOL_MAX_SIZE and not self._evict_lru_locked():
+                return None
+
+        sandbox = WarmSandbox(key)
+        sandbox.lock.acquire()
+        with self._lock:
+            if key not in self._sandboxes:
+                self._sandboxes[key] = sandbox
+                self._stats['cold_starts'] += 1
+                print(f"🔥 Started warm sandbox for session {key} ({len(self._sandboxes)} in pool)")
+                return sandbox
+
+        # A concurrent request for the same session registered a sandbox first
+        sandbox.lock.release()
+        sandbox.stop()
+        return self._checkout(key)
+
+    def _evict_lru_locked(self) -> bool:
+        """Stop the least recently used idle sandbox; caller holds self._lock"""
+        for victim in sorted(self._sandboxes.values(), key=lambda s: s.last_used):
+            if victim.lock.acquire(blocking=False):
+                del self._sandboxes[victim.key]
+                self._stats['evictions'] += 1
+                victim.lock.release()
+                threading.Thread(target=victim.stop, daemon=True).start()
+                return True
+        return False
+
+    def evict(self, key: str, sandbox: Optional[WarmSandbox] = None):
+        """Stop and forget the sandbox of an IDE session
+
+        With `sandbox` given, the caller holds its lock and only that sandbox is
+        evicted. Without it, a sandbox that is running an execution is marked
+        retired instead and stopped when the execution releases it.
+        """
+        if sandbox is None:
+            with self._lock:
+                sandbox = self._sandboxes.get(key)
+            if sandbox is None:
+                return
+            if not sandbox.lock.acquire(blocking=False):
+                print(f"⏳ Sandbox for session {key} is busy, evicting after the current execution")
+                sandbox.retired = True
+                return
+            try:
+                self.evict(key, sandbox)
+            finally:
+                sandbox.lock.release()
+            return
+
+        with self._lock:
+            if self._sandboxes.get(key) is not sandbox:
+                return
+            del self._sandboxes[key]
+            self._stats['evictions'] += 1
+        print(f"🧊 Evicting sandbox for session {key}")
+        sandbox.stop()
+
+    def maintain(self):
+        """Evict idle or expiring sandboxes and ping the rest to keep them alive"""
+        now = time.time()
+        with self._lock:
+            candidates = list(self._sandboxes.values())
+        for sandbox in candidates:
+            if not sandbox.lock.acquire(blocking=False):
+                continue  # In use
+            try:
+                if (now - sandbox.last_used > SANDBOX_IDLE_TIMEOUT or sandbox.expires_soon
+                        or sandbox.retired):
+                    self.evict(sandbox.key, sandbox)
+                elif now - sandbox.last_used > SANDBOX_KEEPALIVE_INTERVAL:
+                    try:
+                        response = sandbox.client.invoke("executeCode", {
+                            "code": "pass",
+                            "language": "python",
+                            "clearContext": False
+                        })
+                        for _ in response["stream"]:
+                            pass
+                    except Exception as e:
+                        print(f"⚠️  Sandbox keep-alive failed for {sandbox.key}: {e}")
+                        self.evict(sandbox.key, sandbox)
+            finally:
+                sandbox.lock.release()
+
+    def start(self):
+        """Start the background maintenance thread"""
+        if self._thread is not None:
+            return
+        interval = max(1, min(SANDBOX_KEEPALIVE_INTERVAL, SANDBOX_IDLE_TIMEOUT) // 2)
+
+        def _run():
+            while not self._stop_event.wait(interval):
+                try:
+                    self.maintain()
+                except Exception as e:
+                    print(f"⚠️  Sandbox pool maintenance failed: {e}")
+
+        self._thread = threading.Thread(target=_run, name="sandbox-pool", daemon=True)
+        self._thread.start()
+
+    def shutdown(self):
+        """Stop the maintenance thread and every pooled sandbox"""
+        self._stop_event.set()
+        with self._lock:
+            sandboxes = list(self._sandboxes.values())
+            self._sandboxes.clear()
+        for sandbox in sandboxes:
+            sandbox.stop()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'warm_sandboxes': len(self._sandboxes),
+                'busy_sandboxes': sum(1 for s in self._sandboxes.values() if s.lock.locked()),
+                'max_size': SANDBOX_POOL_MAX_SIZE,
+                **self._stats
+            }
+
+sandbox_pool = SandboxPool()
+
+# Agent worker pool configuration
+AGENT_WORKER_THREADS = int(os.getenv('AGENT_WORKER_THREADS', '8'))
+AGENT_MAX_QUEUE_DEPTH = int(os.getenv('AGENT_MAX_QUEUE_DEPTH', '100'))
+SESSION_MAX_CONCURRENT_REQUESTS = int(os.getenv('SESSION_MAX_CONCURRENT_REQUESTS', '2'))
+
+class AgentWorkerPool:
+    """Runs blocking Strands agent and AgentCore calls off the event loop
+
+    Calls go to a bounded thread pool so a slow generation or execution never
+    stalls other users. Each IDE session may have at most
+    SESSION_MAX_CONCURRENT_REQUESTS calls in flight (further ones wait their
+    turn), and new calls are rejected with 503 once AGENT_MAX_QUEUE_DEPTH
+    calls are waiting for a worker.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(
+            max_workers=AGENT_WORKER_THREADS, thread_name_prefix="agent-worker"
+        )
+        self._session_slots = {}  # session_id -> [asyncio.Semaphore, users]
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._waiting_for_session = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._queue_wait_total = 0.0
+        self._run_time_total = 0.0
+
+    async def run(self, session_id: Optional[str], func, *args, **kwargs):
+        """Run func(*args, **kwargs) on a worker thread, limited per session"""
+        with self._lock:
+            if self._queued >= AGENT_MAX_QUEUE_DEPTH:
+                self._rejected += 1
+                raise HTTPException(status_code=503, detail="Server busy, please retry shortly")
+
+        slot = self._session_slots.setdefault(
+            session_id, [asyncio.Semaphore(SESSION_MAX_CONCURRENT_REQUESTS), 0]
+        )
+        slot[1] += 1
+        self._waiting_for_session += 1
+        try:
+            try:
+                await slot[0].acquire()
+            finally:
+                # Also reached when the request is cancelled while waiting
+                self._waiting_for_session -= 1
+            try:
+                return await self._submit(func, *args, **kwargs)
+            finally:
+                slot[0].release()
+        finally:
+            slot[1] -= 1
+            if slot[1] == 0:
+                self._session_slots.pop(session_id, None)
+
+    async def _submit(self, func, *args, **kwargs):
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+
+        def _call():
+            started_at = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._queue_wait_total += started_at - submitted_at
+            failed = True
+            try:
+                result = func(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._run_time_total += time.perf_counter() - started_at
+                    if failed:
+                        self._failed += 1
+                    else:
+                        self._completed += 1
+
+        # Copy the context so context variables (e.g. the sandbox key) reach the worker
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, context.run, _call)
+
+    def stats(self) -> dict:
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                'worker_threads': AGENT_WORKER_THREADS,
+                'running': self._running,
+                'queue_depth': self._queued,
+                'max_queue_depth': self._max_queue_depth,
+                'waiting_for_session_slot': self._waiting_for_session,
+                'active_sessions': len(self._session_slots),
+                'completed': self._completed,
+                'failed': self._failed,
+                'rejected': self._rejected,
+                'avg_queue_wait_ms': round(self._queue_wait_total / finished * 1000, 1) if finished else 0.0,
+                'avg_run_time_ms': round(self._run_time_total / finished * 1000, 1) if finished else 0.0
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+agent_workers = AgentWorkerPool()
+
+class AgentPool:
+    """Gives every concurrent call its own Strands Agent instance
+
+    An Agent keeps its conversation in agent.messages and is not re-entrant,
+    so worker threads must never call the same instance at once. Instances
+    are built by factory on demand (at most one per concurrent call, so no
+    more than AGENT_WORKER_THREADS) and returned to the pool after each call.
+    Calling the pool is a drop-in replacement for calling an Agent.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._idle = []
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            agent = self._idle.pop() if self._idle else None
+            if agent is None:
+                self.created += 1
+        if agent is None:
+            agent = self._factory()
+        try:
+            return agent(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._idle.append(agent)
+
+def run_executor_agent(session_id: str, prompt: str):
+    """Call the code executor agent with execute_python_code bound to the session's sandbox"""
+    sandbox_token = current_sandbox_key.set(session_id)
+    try:
+        return code_executor_agent(prompt)
+    finally:
+        current_sandbox_key.reset(sandbox_token)
+
+# Websocket output streaming configuration
+STREAM_QUEUE_MAX_CHUNKS = int(os.getenv('STREAM_QUEUE_MAX_CHUNKS', '64'))
+STREAM_SEND_TIMEOUT = float(os.getenv('STREAM_SEND_TIMEOUT', '30'))
+
+IMAGE_DATA_MARKER = 'IMAGE_DATA:'
+
+class ExecutionStream:
+    """Relays sandbox output from a worker thread to a websocket as it arrives
+
+    on_chunk runs on the worker thread and puts messages on a bounded queue
+    that pump() drains onto the websocket, so a slow client throttles the
+    sandbox reader instead of buffering the whole run in memory. IMAGE_DATA
+    lines are held back until complete and sent as image messages rather
+    than as raw base64 text. If the client stops reading for
+    STREAM_SEND_TIMEOUT seconds the stream is closed and later output is
+    only returned in the final result.
+    """
+
+    def __init__(self, websocket: WebSocket, session_id: str):
+        self.websocket = websocket
+        self.session_id = session_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=STREAM_QUEUE_MAX_CHUNKS)
+        self.closed = threading.Event()
+        self.started_at = time.perf_counter()
+        self.first_output_ms = None
+        self.messages_sent = 0
+        self._carry = ''  # possible start of an IMAGE_DATA marker split across chunks
+        self._image_parts = None  # IMAGE_DATA line still being received
+
+    def on_chunk(self, stream: str, text: str):
+        """Queue one stdout/stderr chunk, blocking while the client catches up"""
+        if stream == 'stdout':
+            messages = self._split_stdout(text)
+        else:
+            messages = [self._output_message(stream, text)]
+        for message in messages:
+            self._put(message)
+
+    def _split_stdout(self, text: str) -> list:
+        messages = []
+        text = self._carry + text
+        self._carry = ''
+        while text:
+            if self._image_parts is not None:
+                end = text.find('\n')
+                if end == -1:
+                    self._image_parts.append(text)
+                    break
+                self._image_parts.append(text[:end])
+                messages.extend(self._image_messages())
+                text = text[end + 1:]
+                continue
+
+            start = text.find(IMAGE_DATA_MARKER)
+            if start == -1:
+                # Keep back a trailing partial marker until the next chunk
+                for size in range(min(len(IMAGE_DATA_MARKER) - 1, len(text)), 0, -1):
+                    if IMAGE_DATA_MARKER.startswith(text[-size:]):
+                        self._carry = text[-size:]
+                        text = text[:-size]
+                        break
+                if text:
+                    messages.append(self._output_message('stdout', text))
+                break
+
+            if start:
+                messages.append(self._output_message('stdout', text[:start]))
+            self._image_parts = []
+            text = text[start + len(IMAGE_DATA_MARKER):]
+        return messages
+
+    def _image_messages(self) -> list:
+        image = parse_image_block(''.join(self._image_parts))
+        self._image_parts = None
+        if image is None:
+            return []
+        return [{
+            "type": "execution_image",
+            "session_id": self.session_id,
+            "image": image
+        }]
+
+    def _output_message(self, stream: str, text: str) -> dict:
+        return {
+            "type": "execution_output",
+            "session_id": self.session_id,
+            "stream": stream,
+            "data": text
+        }
+
+    def _put(self, message: dict):
+        if self.closed.is_set():
+            return
+        if self.first_output_ms is None:
+            self.first_output_ms = round((time.perf_counter() - self.started_at) * 1000, 1)
+        future = asyncio.run_coroutine_threadsafe(self.queue.put(message), self.loop)
+        try:
+            future.result(timeout=STREAM_SEND_TIMEOUT)
+        except Exception:
+            future.cancel()
+            self.closed.set()
+            print(f"⚠️  Output stream for session {self.session_id} stalled, dropping further chunks")
+
+    def flush(self):
+        """Send whatever is still held back once execution has finished"""
+        if self._image_parts is not None:
+            for message in self._image_messages():
+                self._put(message)
+        if self._carry:
+            self._put(self._output_message('stdout', self._carry))
+            self._carry = ''
+
+    async def pump(self):
+        """Send queued messages until close() is called or the client goes away"""
+        while True:
+            message = await self.queue.get()
+            if message is None:
+                return
+            if self.closed.is_set():
+                continue
+            try:
+                await self.websocket.send_text(json.dumps(message))
+                self.messages_sent += 1
+            except Exception as e:
+                print(f"⚠️  Output stream for session {self.session_id} closed: {e}")
+                self.closed.set()
+
+    async def close(self, pump_task):
+        await self.queue.put(None)
+        await pump_task
+
+def execute_in_sandbox(code: str, files: list = None, session_key: Optional[str] = None, on_chunk=None):
+    """Run code in the IDE session's warm sandbox, uploading only changed files
+
+    Returns (output_parts, full_stdout, error_message). A reused sandbox that
+    fails before producing any output, typically because AgentCore already
+    ended its session, is replaced by a fresh one once. When given,
+    on_chunk(stream, text) is called with each stdout/stderr chunk as it
+    arrives.
+    """
+    for attempt in (1, 2):
+        was_warm = False
+        received = False
+        try:
+            with sandbox_pool.sandbox(session_key) as sandbox:
+                was_warm = sandbox.executions > 0
+                sandbox.executions += 1
+
+                if files:
+                    upload_error = sandbox.write_files(files)
+                    if upload_error:
+                        return [], "", f"File upload failed: {upload_error}"
+
+                response = sandbox.client.invoke("executeCode", {
+                    "code": code,
+                    "language": "python",
+                    "clearContext": False
+                })
+
+                output_parts = []
+                stdout_parts = []
+                for event in response["stream"]:
+                    received = True
+                    error_text = get_invoke_error(event)
+                    if error_text:
+                        print(f"❌ AgentCore execution error: {error_text}")
+                        return output_parts, "".join(stdout_parts), f"Error: {error_text}"
+
+                    # Extract structured content (stdout, stderr)
+                    structured_content = event.get("result", {}).get("structuredContent", {})
+                    stdout = structured_content.get("stdout", "")
+                    stderr = structured_content.get("stderr", "")
+
+                    if stdout:
+                        output_parts.append(stdout)
+                        stdout_parts.append(stdout)
+                        print(f"📤 Stdout captured: {len(stdout)} characters")
+                        if on_chunk:
+                            on_chunk("stdout", stdout)
+                    if stderr:
+                        output_parts.append(f"Errors: {stderr}")
+                        print(f"⚠️  Stderr captured: {len(stderr)} characters")
+                        if on_chunk:
+                            on_chunk("stderr", stderr)
+
+                return output_parts, "".join(stdout_parts), None
+        except Exception as e:
+            if attempt == 1 and was_warm and not received:
+                print(f"♻️  Warm sandbox failed ({e}), retrying in a fresh sandbox")
+                continue
+            raise
+
+IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'\xff\xd8\xff', 'jpeg'),
+)
+BASE64_BLOCK = re.compile(r'[A-Za-z0-9+/]*={0,2}')
+
+def parse_image_block(block: str) -> Optional[dict]:
+    """Validate one IMAGE_DATA payload by decoding only its first bytes
+
+    The payload must be plain base64 of a reasonable size (at least 1KB of
+    text) whose decoded prefix carries a PNG or JPEG signature; the full image
+    is never decoded here.
+    """
+    block = block.strip()
+    if len(block) <= 1000 or len(block) % 4 or not BASE64_BLOCK.fullmatch(block):
+        return None
+    try:
+        header = base64.b64decode(block[:16])
+    except ValueError:
+        return None
+    for signature, image_format in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return {
+                'format': image_format,
+                'data': block,
+                'source': 'agentcore_stdout'
+            }
+    return None
+
+def scan_image_output(output: str, collect_images: bool = True) -> tuple[list, list]:
+    """Split execution output into text segments and images in one pass
+
+    Every IMAGE_DATA:<base64> line is removed from the text, whether or not it
+    holds a valid image. Returns (text_segments, images), with one more text
+    segment than there were IMAGE_DATA blocks; each image payload is sliced
+    from the output once and not copied again.
+    """
+    text_segments = []
+    images = []
+    if not output:
+        return text_segments, images
+
+    position = 0
+    while True:
+        marker = output.find(IMAGE_DATA_MARKER, position)
+        if marker == -1:
+            text_segments.append(output[position:])
+            break
+        text_segments.append(output[position:marker])
+
+        block_start = marker + len(IMAGE_DATA_MARKER)
+        block_end = output.find('\n', block_start)
+        if block_end == -1:
+            block_end = len(output)
+        if collect_images:
+            image = parse_image_block(output[block_start:block_end])
+            if image:
+                images.append(image)
+            else:
+                print(f"⚠️  Skipping invalid IMAGE_DATA block ({block_end - block_start} chars)")
+        position = block_end + 1
+
+    return text_segments, images
+
+def format_display_text(text_segments: list) -> str:
+    """Join the text around IMAGE_DATA blocks for display"""
+    if len(text_segments) <= 1:
+        return ''.join(text_segments)
+    cleaned_parts = [segment.strip() for segment in text_segments if segment.strip()]
+    if cleaned_parts:
+        return '\n\n'.join(cleaned_parts)
+    return "Code executed successfully - chart generated"
 
 def clean_output_for_display(output: str) -> str:
     """Clean output for display by removing image binary data while preserving analysis text"""
-    if not output:
+    if not output or IMAGE_DATA_MARKER not in output:
         return output
-    
-    # If output contains IMAGE_DATA, extract everything except the binary
-    if 'IMAGE_DATA:' in output:
-        parts = output.split('IMAGE_DATA:')
-        cleaned_parts = []
-        
-        # Add the part before IMAGE_DATA
-        if parts[0].strip():
-            cleaned_parts.append(parts[0].strip())
-        
-        # Process parts after IMAGE_DATA
-        for i in range(1, len(parts)):
-            # Split on newline to separate binary from any following text
-            lines = parts[i].split('\n', 1)
-            if len(lines) > 1:
-                # Skip the binary line, keep any text after it
-                remaining_text = lines[1].strip()
-                if remaining_text and not remaining_text.startswith(('iVBOR', '/9j/', 'data:')):
-                    cleaned_parts.append(remaining_text)
-        
-        if cleaned_parts:
-            result = '\n\n'.join(cleaned_parts)
-            print(f"🧹 Cleaned output: removed image binary, kept {len(result)} chars of text")
-            return result
-        else:
-            return "Code executed successfully - chart generated"
-    
-    return output
+    text_segments, _ = scan_image_output(output)
+    return format_display_text(text_segments)
 
 def extract_image_data(execution_result: str):
-    """Extract base64 image data from execution results - fixed for AgentCore format"""
+    """Extract base64 image data from execution results"""
     try:
-        import re
-        import base64
-        
-        images = []
-        
-        print(f"🔍 Image extraction - Input length: {len(execution_result)}")
-        print(f"🔍 Contains IMAGE_DATA: {'IMAGE_DATA:' in execution_result}")
-        
-        if 'IMAGE_DATA:' in execution_result:
-            # Find all IMAGE_DATA: patterns in the text
-            # AgentCore puts the full base64 string in stdout, so we need a greedy pattern
-            pattern = r'IMAGE_DATA:([A-Za-z0-9+/=\n\r\s]+?)(?=\n[A-Za-z]|\nBase64|\n$|$)'
-            matches = re.findall(pattern, execution_result, re.MULTILINE | re.DOTALL)
-            
-            print(f"🔍 Regex matches found: {len(matches)}")
-            
-            for i, match in enumerate(matches):
-                try:
-                    # Clean up the base64 string - remove all whitespace and newlines
-                    clean_match = re.sub(r'[\s\n\r]', '', match)
-                    
-                    print(f"🔍 Match {i+1} - Original length: {len(match)}, Clean length: {len(clean_match)}")
-                    print(f"🔍 Match {i+1} - Starts with: {clean_match[:50]}...")
-                    
-                    # Must be reasonable length for an image (at least 1KB when decoded)
-                    if len(clean_match) > 1000:
-                        # Validate it's valid base64 and can be decoded
-                        decoded = base64.b64decode(clean_match)
-                        print(f"🔍 Match {i+1} - Decoded length: {len(decoded)} bytes")
-                        
-                        # Check if it looks like a PNG (starts with PNG signature)
-                        if decoded.startswith(b'\x89PNG\r\n\x1a\n'):
-                            images.append({
-                                'format': 'png',
-                                'data': clean_match,
-                                'source': 'agentcore_stdout'
-                            })
-                            print(f"✅ Match {i+1} - Valid PNG image extracted")
-                        # Also check for JPEG signatures
-                        elif decoded.startswith(b'\xff\xd8\xff'):
-                            images.append({
-                                'format': 'jpeg',
-                                'data': clean_match,
-                                'source': 'agentcore_stdout'
-                            })
-                            print(f"✅ Match {i+1} - Valid JPEG image extracted")
-                        else:
-                            print(f"⚠️  Match {i+1} - Invalid image signature")
-                    else:
-                        print(f"⚠️  Match {i+1} - Too short to be valid image")
-                except Exception as e:
-                    print(f"❌ Match {i+1} - Extraction error: {e}")
-                    continue
-        
-        print(f"🎯 Final result: {len(images)} images extracted")
+        _, images = scan_image_output(execution_result)
+        print(f"🎯 Image extraction: {len(images)} images from {len(execution_result)} chars")
         return images
-        
     except Exception as e:
         print(f"❌ Image extraction error: {e}")
         return []
@@ -309,7 +1167,7 @@ def upload_files_to_agentcore_sandbox(files_data: list, aws_region: str) -> bool
         print(f"❌ File upload failed: {str(e)}")
         return False
 
-def execute_chart_code_direct(code: str, session_files: list = None) -> tuple[str, list]:
+def execute_chart_code_direct(code: str, session_files: list = None, session_id: Optional[str] = None, on_chunk=None) -> tuple[str, list]:
     """Execute chart code directly with AgentCore to preserve full base64 output"""
     try:
         print(f"\n🎨 Direct AgentCore chart execution")
@@ -319,73 +1177,21 @@ def execute_chart_code_direct(code: str, session_files: list = None) -> tuple[st
         clean_code = extract_python_code_from_prompt(code)
         print(f"🔧 Clean code length: {len(clean_code)} characters")
         
-        with code_session(aws_region) as code_client:
-            # Upload files to sandbox if provided
-            if session_files:
-                print(f"📁 Uploading {len(session_files)} files to sandbox...")
-                files_data = []
-                for file_info in session_files:
-                    files_data.append({
-                        "path": file_info['filename'],
-                        "text": file_info['content']
-                    })
-                
-                # Upload files using writeFiles tool
-                upload_response = code_client.invoke("writeFiles", {"content": files_data})
-                for event in upload_response["stream"]:
-                    result = event.get("result", {})
-                    if result.get("isError", False):
-                        error_content = result.get("content", [{}])
-                        error_text = error_content[0].get("text", "Unknown error") if error_content else "Unknown error"
-                        print(f"❌ File upload error: {error_text}")
-                        return f"File upload failed: {error_text}", []
-                    else:
-                        content = result.get("content", [])
-                        for item in content:
-                            if item.get("type") == "text":
-                                print(f"✅ File upload: {item.get('text', '')}")
-            
-            # Execute the cleaned code
-            response = code_client.invoke("executeCode", {
-                "code": clean_code,
-                "language": "python",
-                "clearContext": False
-            })
-        
         # Process response directly without Strands-Agents truncation
-        output_parts = []
-        full_stdout = ""
-        
-        for event in response["stream"]:
-            result = event.get("result", {})
-            
-            if result.get("isError", False):
-                error_content = result.get("content", [{}])
-                error_text = error_content[0].get("text", "Unknown error") if error_content else "Unknown error"
-                print(f"❌ Direct execution error: {error_text}")
-                return f"Error: {error_text}", []
-            
-            # Extract structured content
-            structured_content = result.get("structuredContent", {})
-            stdout = structured_content.get("stdout", "")
-            stderr = structured_content.get("stderr", "")
-            
-            if stdout:
-                output_parts.append(stdout)
-                full_stdout += stdout
-                print(f"📤 Direct stdout captured: {len(stdout)} characters")
-            if stderr:
-                output_parts.append(f"Errors: {stderr}")
-                print(f"⚠️  Direct stderr: {stderr}")
+        output_parts, full_stdout, error_message = execute_in_sandbox(clean_code, session_files, session_id, on_chunk)
+        if error_message:
+            print(f"❌ Direct execution error: {error_message}")
+            return error_message, []
         
         # Combine output
         final_output = "\n".join(output_parts) if output_parts else "Code executed successfully"
         
-        # Extract images directly from full stdout
-        images = extract_image_data(full_stdout)
-        
-        # Clean the output for display (remove image binary but keep analysis text)
-        display_output = clean_output_for_display(final_output)
+        # Extract images and the display text (image binary removed) from the full stdout
+        text_segments, images = scan_image_output(full_stdout)
+        if final_output != full_stdout:
+            # Chunks are newline-joined and may include stderr, so the display text needs its own scan
+            text_segments, _ = scan_image_output(final_output, collect_images=False)
+        display_output = format_display_text(text_segments)
         
         print(f"✅ Direct execution completed:")
         print(f"   Output length: {len(final_output)}")
@@ -667,62 +1473,10 @@ def execute_python_code(code: str, description: str = "", files: list = None) ->
     print(f"🔧 Clean code preview: {clean_code[:200]}...")
     
     try:
-        with code_session(aws_region) as code_client:
-            # Upload files to sandbox if provided
-            if files:
-                print(f"📁 Uploading {len(files)} files to sandbox...")
-                files_data = []
-                for file_info in files:
-                    files_data.append({
-                        "path": file_info.get('filename', 'uploaded_file.csv'),
-                        "text": file_info.get('content', '')
-                    })
-                
-                # Upload files using writeFiles tool
-                upload_response = code_client.invoke("writeFiles", {"content": files_data})
-                for event in upload_response["stream"]:
-                    result = event.get("result", {})
-                    if result.get("isError", False):
-                        error_content = result.get("content", [{}])
-                        error_text = error_content[0].get("text", "Unknown error") if error_content else "Unknown error"
-                        print(f"❌ File upload error: {error_text}")
-                        return f"File upload failed: {error_text}"
-                    else:
-                        content = result.get("content", [])
-                        for item in content:
-                            if item.get("type") == "text":
-                                print(f"✅ File upload: {item.get('text', '')}")
-            
-            # Execute the code
-            response = code_client.invoke("executeCode", {
-                "code": clean_code,
-                "language": "python",
-                "clearContext": False
-            })
-        
-        # Process the response stream to capture all output
-        output_parts = []
-        
-        for event in response["stream"]:
-            result = event.get("result", {})
-            
-            if result.get("isError", False):
-                error_content = result.get("content", [{}])
-                error_text = error_content[0].get("text", "Unknown error") if error_content else "Unknown error"
-                print(f"❌ AgentCore execution error: {error_text}")
-                return f"Error: {error_text}"
-            
-            # Extract structured content (stdout, stderr)
-            structured_content = result.get("structuredContent", {})
-            stdout = structured_content.get("stdout", "")
-            stderr = structured_content.get("stderr", "")
-            
-            if stdout:
-                output_parts.append(stdout)
-                print(f"📤 Stdout captured: {len(stdout)} characters")
-            if stderr:
-                output_parts.append(f"Errors: {stderr}")
-                print(f"⚠️  Stderr captured: {len(stderr)} characters")
+        # Runs in the calling IDE session's warm sandbox when one is set
+        output_parts, _, error_message = execute_in_sandbox(clean_code, files, current_sandbox_key.get())
+        if error_message:
+            return error_message
         
         # Combine all output
         final_output = "\n".join(output_parts) if output_parts else "Code executed successfully (no output)"
@@ -853,9 +1607,7 @@ def initialize_agents():
         print(f"🎯 Using model: {model_id}")
         
         # Initialize Code Generator Agent using strands-agents
-        code_generator_agent = Agent(
-            model=bedrock_model,
-            system_prompt=f"""You are a Python code generator specialist powered by {model_id}. Your role is to:
+        generator_prompt = f"""You are a Python code generator specialist powered by {model_id}. Your role is to:
             1. Generate clean, well-commented Python code based on user requirements
             2. Follow Python best practices and PEP 8 style guidelines
             3. Include appropriate error handling where needed
@@ -865,6 +1617,8 @@ def initialize_agents():
             
             Focus on creating practical, efficient code that solves the user's specific problem.
             Return ONLY the Python code, no explanations, no markdown, no additional text."""
+        code_generator_agent = AgentPool(
+            lambda: Agent(model=bedrock_model, system_prompt=generator_prompt)
         )
         
         # Test AgentCore availability
@@ -900,10 +1654,8 @@ TOOL AVAILABLE:
 
 RESPONSE FORMAT: The execute_python_code tool returns execution results including stdout, stderr, and any errors."""
         
-        code_executor_agent = Agent(
-            model=bedrock_model,
-            tools=[execute_python_code],
-            system_prompt=SYSTEM_PROMPT
+        code_executor_agent = AgentPool(
+            lambda: Agent(model=bedrock_model, tools=[execute_python_code], system_prompt=SYSTEM_PROMPT)
         )
         
         print("✅ Agents initialized successfully:")
@@ -929,10 +1681,7 @@ def get_or_create_session(session_id: Optional[str] = None) -> CodeInterpreterSe
     if session_id is None:
         session_id = str(uuid.uuid4())
     
-    if session_id not in active_sessions:
-        active_sessions[session_id] = CodeInterpreterSession(session_id)
-    
-    return active_sessions[session_id]
+    return active_sessions.get_or_create(session_id)
 
 # Utility functions for code analysis
 def detect_chart_code(code: str) -> bool:
@@ -982,12 +1731,14 @@ async def generate_code(request: CodeGenerationRequest):
     """Generate Python code using the strands-agents code generator agent"""
     try:
         session = get_or_create_session(request.session_id)
+        # Read once: a spilled CSV is loaded from disk on every access
+        uploaded_csv = session.uploaded_csv
         
         # Check if prompt mentions files but no CSV is uploaded
         file_keywords = ['file', 'csv', 'data', 'dataset', 'load', 'read', 'import', 'upload']
         mentions_file = any(keyword in request.prompt.lower() for keyword in file_keywords)
         
-        if mentions_file and not session.uploaded_csv:
+        if mentions_file and not uploaded_csv:
             return {
                 "success": False,
                 "requires_file": True,
@@ -1002,16 +1753,16 @@ async def generate_code(request: CodeGenerationRequest):
         chart_keywords = ['plot', 'chart', 'graph', 'visualiz', 'histogram', 'scatter', 'bar chart', 'line chart', 'pie chart', 'heatmap', 'matplotlib', 'seaborn', 'plotly']
         needs_visualization = any(keyword in request.prompt.lower() for keyword in chart_keywords)
         
-        if session.uploaded_csv:
+        if uploaded_csv:
             csv_info = f"""
-You have access to a CSV file named '{session.uploaded_csv['filename']}' with the following content preview:
+You have access to a CSV file named '{uploaded_csv['filename']}' with the following content preview:
 
 ```csv
-{session.uploaded_csv['content'][:1000]}{'...' if len(session.uploaded_csv['content']) > 1000 else ''}
+{uploaded_csv['content'][:1000]}{'...' if len(uploaded_csv['content']) > 1000 else ''}
 ```
 
 When generating code, assume this CSV data is available and can be loaded using pandas.read_csv() or similar methods. 
-Use the filename '{session.uploaded_csv['filename']}' in your code.
+Use the filename '{uploaded_csv['filename']}' in your code.
 
 User request: {request.prompt}
 """
@@ -1055,20 +1806,20 @@ This ensures your charts are properly displayed in the web interface.
 """
             enhanced_prompt += chart_instructions
         
-        # Use the strands-agents agent for code generation
-        agent_result = code_generator_agent(enhanced_prompt)
+        # Use the strands-agents agent for code generation, off the event loop
+        agent_result = await agent_workers.run(session.session_id, code_generator_agent, enhanced_prompt)
         
         # Extract string content from AgentResult
         generated_code = str(agent_result) if agent_result is not None else ""
         
         # Store generation in session history
-        session.conversation_history.append({
+        session.add_history('conversation_history', {
             "type": "generation",
             "prompt": request.prompt,
-            "enhanced_prompt": enhanced_prompt if session.uploaded_csv else None,
+            "enhanced_prompt": enhanced_prompt if uploaded_csv else None,
             "generated_code": generated_code,
             "agent": "strands_code_generator",
-            "csv_used": session.uploaded_csv['filename'] if session.uploaded_csv else None,
+            "csv_used": uploaded_csv['filename'] if uploaded_csv else None,
             "timestamp": time.time()
         })
         
@@ -1077,9 +1828,11 @@ This ensures your charts are properly displayed in the web interface.
             "code": generated_code,
             "session_id": session.session_id,
             "agent_used": "strands_code_generator",
-            "csv_file_used": session.uploaded_csv['filename'] if session.uploaded_csv else None
+            "csv_file_used": uploaded_csv['filename'] if uploaded_csv else None
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Code generation failed: {str(e)}")
 
@@ -1104,7 +1857,7 @@ Provide:
 
 Keep response short and practical."""
             
-            analysis_result = code_generator_agent(analysis_prompt)
+            analysis_result = await agent_workers.run(request.session_id, code_generator_agent, analysis_prompt)
             
             return {
                 "success": True,
@@ -1120,6 +1873,8 @@ Keep response short and practical."""
                 "suggestions": None
             }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Code analysis failed: {str(e)}")
 
@@ -1176,10 +1931,11 @@ async def execute_code(request: CodeExecutionRequest):
         
         # Get session files for sandbox upload
         session_files = []
-        if session.uploaded_csv:
+        uploaded_csv = session.uploaded_csv
+        if uploaded_csv:
             session_files.append({
-                'filename': session.uploaded_csv['filename'],
-                'content': session.uploaded_csv['content']
+                'filename': uploaded_csv['filename'],
+                'content': uploaded_csv['content']
             })
         
         # REVERTED: Use original logic - only force direct AgentCore for charts and files, NOT for interactive
@@ -1187,7 +1943,9 @@ async def execute_code(request: CodeExecutionRequest):
             print(f"🎨 Chart code detected - using direct AgentCore execution")
             
             # Use direct AgentCore execution to preserve full base64 output
-            execution_result_str, images = execute_chart_code_direct(prepared_code, session_files)
+            execution_result_str, images = await agent_workers.run(
+                session.session_id, execute_chart_code_direct, prepared_code, session_files, session.session_id
+            )
             agent_used = "direct_agentcore_charts"
             
         else:
@@ -1197,7 +1955,9 @@ async def execute_code(request: CodeExecutionRequest):
             # since Strands-Agents tools can't easily access session files
             if session_files:
                 print(f"📁 Files detected - switching to direct AgentCore for file access")
-                execution_result_str, images = execute_chart_code_direct(prepared_code, session_files)
+                execution_result_str, images = await agent_workers.run(
+                    session.session_id, execute_chart_code_direct, prepared_code, session_files, session.session_id
+                )
                 agent_used = "direct_agentcore_with_files"
             else:
                 # Use strands-agents with AgentCore tool for regular code without files
@@ -1209,7 +1969,9 @@ async def execute_code(request: CodeExecutionRequest):
 
 Use the tool to run the code and return the complete output."""
                 
-                execution_result = code_executor_agent(execution_prompt)
+                execution_result = await agent_workers.run(
+                    session.session_id, run_executor_agent, session.session_id, execution_prompt
+                )
                 
                 # Debug the AgentResult structure
                 print(f"🔍 AgentResult type: {type(execution_result)}")
@@ -1227,8 +1989,8 @@ Use the tool to run the code and return the complete output."""
         execution_duration = execution_end_time - execution_start_time
         
         # Store execution in session history
-        session.code_history.append(request.code)
-        session.execution_results.append({
+        session.add_history('code_history', request.code)
+        session.add_history('execution_results', {
             "code": request.code,
             "result": execution_result_str,
             "agent": agent_used,
@@ -1256,6 +2018,8 @@ Use the tool to run the code and return the complete output."""
             "is_chart_code": is_chart_code
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ Code execution failed: {str(e)}")
         import traceback
@@ -1268,14 +2032,18 @@ async def clear_csv_from_session(session_id: str):
     try:
         session = get_or_create_session(session_id)
         
-        if session.uploaded_csv:
-            filename = session.uploaded_csv['filename']
+        if session.csv_meta:
+            filename = session.csv_meta['filename']
             
             # Clear CSV from session
             session.uploaded_csv = None
+
+            # Drop the warm sandbox so the file is gone from AgentCore too;
+            # stopping it is a network call, so keep it off the event loop
+            await asyncio.to_thread(sandbox_pool.evict, session_id)
             
             # Add to conversation history
-            session.conversation_history.append({
+            session.add_history('conversation_history', {
                 "type": "csv_removal",
                 "filename": filename,
                 "timestamp": time.time()
@@ -1309,14 +2077,6 @@ async def upload_csv_file(request: FileUploadRequest):
         if not request.filename.lower().endswith('.csv'):
             raise HTTPException(status_code=400, detail="Only CSV files are allowed")
         
-        # Store CSV file in session
-        session.conversation_history.append({
-            "type": "csv_upload",
-            "filename": request.filename,
-            "content": request.content,
-            "timestamp": time.time()
-        })
-        
         # Store CSV data for code generation
         session.uploaded_csv = {
             "filename": request.filename,
@@ -1324,6 +2084,17 @@ async def upload_csv_file(request: FileUploadRequest):
             "timestamp": asyncio.get_event_loop().time()
         }
         
+        # Store CSV file in session history (only a preview when the file was spilled to disk)
+        history_content = request.content
+        if session.csv_spilled:
+            history_content = request.content[:SESSION_FILE_SPILL_BYTES] + f"\n... ({len(request.content)} characters, full file kept on disk)"
+        session.add_history('conversation_history', {
+            "type": "csv_upload",
+            "filename": request.filename,
+            "content": history_content,
+            "timestamp": time.time()
+        })
+        
         return {
             "success": True,
             "message": f"CSV file {request.filename} uploaded successfully",
@@ -1342,7 +2113,7 @@ async def upload_file(request: FileUploadRequest):
         session = get_or_create_session(request.session_id)
         
         # Store file in session
-        session.conversation_history.append({
+        session.add_history('conversation_history', {
             "type": "file_upload",
             "filename": request.filename,
             "content": request.content,
@@ -1360,24 +2131,40 @@ async def upload_file(request: FileUploadRequest):
         raise HTTPException(status_code=500, detail=f"File upload failed: {str(e)}")
 
 @app.get("/api/session/{session_id}/history")
-async def get_session_history(session_id: str):
+async def get_session_history(session_id: str, include_archived: bool = False):
     """Get session history"""
     try:
-        if session_id not in active_sessions:
+        session = active_sessions.get(session_id)
+        if session is None:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        session = active_sessions[session_id]
+        conversation_history = session.conversation_history
+        execution_results = session.execution_results
+        if include_archived:
+            conversation_history = session.load_archived('conversation_history') + conversation_history
+            execution_results = session.load_archived('execution_results') + execution_results
         
         return {
             "success": True,
             "session_id": session_id,
-            "conversation_history": session.conversation_history,
-            "execution_results": session.execution_results
+            "conversation_history": conversation_history,
+            "execution_results": execution_results,
+            "archived_entries": session.archived_entries
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get session history: {str(e)}")
 
+@app.get("/api/sessions/stats")
+async def get_session_stats():
+    """Get session store memory use, limits and eviction counts"""
+    return {
+        "success": True,
+        "sessions": active_sessions.stats()
+    }
+
 @app.get("/api/agents/status")
 async def get_agents_status():
     """Get status of all agents"""
@@ -1417,6 +2204,19 @@ async def get_agents_status():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get agents status: {str(e)}")
 
+@app.get("/api/workers/stats")
+async def get_worker_stats():
+    """Get agent worker pool load: running calls, queue depth and wait times"""
+    return {
+        "success": True,
+        "workers": agent_workers.stats(),
+        "agent_instances": {
+            "code_generator": getattr(code_generator_agent, 'created', 0),
+            "code_executor": getattr(code_executor_agent, 'created', 0)
+        },
+        "sandbox_pool": sandbox_pool.stats()
+    }
+
 # WebSocket endpoint for real-time communication
 @app.websocket("/ws/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
@@ -1431,7 +2231,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
             if message["type"] == "generate_code":
                 # Handle code generation via WebSocket
                 try:
-                    agent_result = code_generator_agent(message["prompt"])
+                    agent_result = await agent_workers.run(session_id, code_generator_agent, message["prompt"])
                     
                     # Extract string content from AgentResult
                     generated_code = str(agent_result) if agent_result is not None else ""
@@ -1453,16 +2253,46 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                 # Handle code execution via WebSocket
                 try:
                     if executor_type == "agentcore":
-                        execution_result = code_executor_agent(f"Execute this code: {message['code']}")
+                        # Run directly in the session's sandbox and forward output as it arrives
+                        session = get_or_create_session(session_id)
+                        session_files = []
+                        uploaded_csv = session.uploaded_csv
+                        if uploaded_csv:
+                            session_files.append({
+                                'filename': uploaded_csv['filename'],
+                                'content': uploaded_csv['content']
+                            })
+                        
+                        stream = ExecutionStream(websocket, session_id)
+                        pump_task = asyncio.create_task(stream.pump())
+                        try:
+                            execution_result, images = await agent_workers.run(
+                                session_id, execute_chart_code_direct, message['code'],
+                                session_files, session_id, stream.on_chunk
+                            )
+                            await asyncio.get_running_loop().run_in_executor(None, stream.flush)
+                        finally:
+                            await stream.close(pump_task)
+                        
+                        await websocket.send_text(json.dumps({
+                            "type": "execution_result",
+                            "success": True,
+                            "result": execution_result,
+                            "images": images,
+                            "streamed": True,
+                            "first_output_ms": stream.first_output_ms,
+                            "session_id": session_id
+                        }))
                     else:
-                        execution_result = code_executor_agent(f"Simulate execution of: {message['code']}")
-                    
-                    await websocket.send_text(json.dumps({
-                        "type": "execution_result",
-                        "success": True,
-                        "result": execution_result,
-                        "session_id": session_id
-                    }))
+                        prompt = f"Simulate execution of: {message['code']}"
+                        execution_result = await agent_workers.run(session_id, run_executor_agent, session_id, prompt)
+                        
+                        await websocket.send_text(json.dumps({
+                            "type": "execution_result",
+                            "success": True,
+                            "result": extract_text_from_agent_result(execution_result),
+                            "session_id": session_id
+                        }))
                 except Exception as e:
                     await websocket.send_text(json.dumps({
                         "type": "error",
@@ -1486,6 +2316,12 @@ async def health_check():
         "current_model": current_model,
         "aws_region": aws_region,
         "authentication": "AWS Profile" if os.getenv('AWS_PROFILE') else "Access Keys",
+        "sandbox_pool": sandbox_pool.stats(),
+        "workers": agent_workers.stats(),
+        "sessions": {
+            "active": len(active_sessions),
+            "memory_bytes": active_sessions.memory_bytes()
+        },
         "architecture": {
             "code_generation": f"Strands-Agents Agent ({current_model})",
             "code_execution": f"{executor_type.title().replace('_', ' ')} Agent ({current_model})"
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Concurrency load test for the backend
+Runs N simulated IDE sessions against a running backend and checks that
+/health stays responsive while agent calls are in flight
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+PROMPTS = [
+    "Write a function that returns the first 20 Fibonacci numbers",
+    "Print the squares of the numbers 1 to 10",
+    "Sort a list of 10 random integers and print it",
+]
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_session(base_url, session_number, requests_per_session, execute, timeout):
+    """Run one session's requests back to back, returning (latencies, errors)"""
+    session_id = f"load-{session_number}-{uuid.uuid4().hex[:8]}"
+    latencies = []
+    errors = []
+
+    for n in range(requests_per_session):
+        prompt = PROMPTS[(session_number + n) % len(PROMPTS)]
+        started_at = time.perf_counter()
+        try:
+            response = requests.post(
+                f"{base_url}/api/generate-code",
+                json={"prompt": prompt, "session_id": session_id},
+                timeout=timeout,
+            )
+            if response.status_code != 200:
+                errors.append(f"generate {response.status_code}")
+                continue
+
+            if execute:
+                code = response.json().get("code", "")
+                response = requests.post(
+                    f"{base_url}/api/execute-code",
+                    json={"code": code, "session_id": session_id},
+                    timeout=timeout,
+                )
+                if response.status_code != 200:
+                    errors.append(f"execute {response.status_code}")
+                    continue
+
+            latencies.append(time.perf_counter() - started_at)
+        except requests.RequestException as e:
+            errors.append(type(e).__name__)
+
+    return latencies, errors
+
+
+def probe_health(base_url, stop_event, health_latencies, peak):
+    """Poll /health and /api/workers/stats until stop_event is set"""
+    while not stop_event.is_set():
+        started_at = time.perf_counter()
+        try:
+            requests.get(f"{base_url}/health", timeout=10)
+            health_latencies.append(time.perf_counter() - started_at)
+
+            stats = requests.get(f"{base_url}/api/workers/stats", timeout=10)
+            # Backends without the worker pool have no stats endpoint
+            if stats.ok:
+                workers = stats.json()["workers"]
+                peak["queue_depth"] = max(peak["queue_depth"], workers["queue_depth"])
+                peak["running"] = max(peak["running"], workers["running"])
+        except requests.RequestException:
+            health_latencies.append(float("inf"))
+        stop_event.wait(0.25)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent session load test")
+    parser.add_argument(
+        "--url", default="http://localhost:8000", help="Backend base URL"
+    )
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent sessions")
+    parser.add_argument("--requests", type=int, default=2, help="Requests per session")
+    parser.add_argument(
+        "--execute", action="store_true", help="Also execute the generated code"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=300, help="Per-request timeout in seconds"
+    )
+    args = parser.parse_args()
+
+    try:
+        requests.get(f"{args.url}/health", timeout=5).raise_for_status()
+    except requests.RequestException as e:
+        print(f"❌ Backend not reachable at {args.url}: {e}")
+        return 1
+
+    print(f"🚀 {args.sessions} sessions x {args.requests} requests against {args.url}")
+
+    stop_event = threading.Event()
+    health_latencies = []
+    peak = {"queue_depth": 0, "running": 0}
+    prober = threading.Thread(
+        target=probe_health,
+        args=(args.url, stop_event, health_latencies, peak),
+        daemon=True,
+    )
+    prober.start()
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.sessions) as pool:
+        futures = [
+            pool.submit(
+                run_session, args.url, i, args.requests, args.execute, args.timeout
+            )
+            for i in range(args.sessions)
+        ]
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - started_at
+
+    stop_event.set()
+    prober.join()
+
+    latencies = [
+        latency for session_latencies, _ in results for latency in session_latencies
+    ]
+    errors = [error for _, session_errors in results for error in session_errors]
+    total = args.sessions * args.requests
+
+    print(f"\n📊 Results ({elapsed:.1f}s)")
+    print(f"   Successful requests: {len(latencies)}/{total}")
+    print(f"   Throughput:          {len(latencies) / elapsed:.2f} req/s")
+    if latencies:
+        print(f"   Latency p50:         {statistics.median(latencies):.2f}s")
+        print(f"   Latency p95:         {percentile(latencies, 95):.2f}s")
+    if health_latencies:
+        print(
+            f"   /health p95:         {percentile(health_latencies, 95) * 1000:.0f}ms"
+        )
+        print(f"   /health max:         {max(health_latencies) * 1000:.0f}ms")
+    print(f"   Peak running calls:  {peak['running']}")
+    print(f"   Peak queue depth:    {peak['queue_depth']}")
+    server_errors = [error for error in errors if error.split()[-1].startswith("5")]
+    print(f"   5xx responses:       {len(server_errors)}")
+    if errors:
+        print(
+            f"   Errors:              {len(errors)} ({', '.join(sorted(set(errors)))})"
+        )
+
+    final_stats = requests.get(f"{args.url}/api/workers/stats", timeout=10)
+    if final_stats.ok:
+        final_stats = final_stats.json()
+        print(f"   Worker stats:        {final_stats['workers']}")
+        print(f"   Agent instances:     {final_stats.get('agent_instances', {})}")
+
+    return 0 if not errors else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())